@@ -0,0 +1,10 @@
+import sys
+from pathlib import Path
+
+# Permite importar o pacote bsc_toolkit a partir da raiz do repositório
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bsc_toolkit.inspector.balances import main
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,28 @@
+import argparse
+import getpass
 import json
-import random
+import sys
 import time
 from datetime import datetime, timezone
+from pathlib import Path
 from eth_account import Account
 import mnemonic
 import os
 from dotenv import load_dotenv
-from web3 import Web3
 import uuid
 import re
 
+# Permite importar o pacote bsc_toolkit a partir da raiz do repositório
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bsc_toolkit.rpc import NodePool, NoHealthyNodeError
+from bsc_toolkit.rpc.web3_provider import instrumented_web3
+from bsc_toolkit.wallet import (WORD_SIZES, KdfParams, VanityPattern, WalletStore, build_vanity_record,
+                                export_keystores, generate_wallets_bulk, import_keystores, search_vanity_address)
+
+# Timeout (em segundos) de cada requisição a um nó RPC
+NODE_TIMEOUT = 5
+
 # Carregar as variáveis do arquivo .env
 load_dotenv()
 
@@ -39,7 +52,7 @@ def connect_to_node(node_url):
         if not validate_node_url(node_url):
             raise ValueError(f"URL inválida para o nó RPC: {node_url}")
         
-        web3 = Web3(Web3.HTTPProvider(node_url))
+        web3 = instrumented_web3(node_url, NODE_TIMEOUT)
         
         # Testar a conexão obtendo o número do bloco
         latest_block = web3.eth.block_number
@@ -73,35 +86,29 @@ def create_new_address(seed_strength):
     public_address = new_account.address
     return private_key, public_address, seed_phrase
 
+# Arquivo append-only (JSON Lines) onde as carteiras são gravadas
+WALLET_STORE_PATH = "wallets.jsonl"
+_wallet_store = None
+
+def get_wallet_store():
+    """
+    Função para abrir (uma única vez) o armazenamento de carteiras.
+    Na abertura, uma gravação interrompida no fim do arquivo é descartada e os índices são reconstruídos.
+    """
+    global _wallet_store
+    if _wallet_store is None:
+        _wallet_store = WalletStore(WALLET_STORE_PATH)
+    return _wallet_store
+
 def save_wallet_to_file(wallet_data):
     """
-    Função para salvar as carteiras geradas no arquivo JSON.
+    Função para salvar uma carteira gerada no armazenamento append-only.
     """
     try:
-        # Tenta abrir o arquivo e ler os dados existentes
-        if os.path.exists("wallets.json"):
-            with open("wallets.json", "r") as file:
-                wallets = json.load(file)
-        else:
-            wallets = []  # Caso o arquivo não exista, inicializa uma lista vazia
-
-        # Adiciona a nova carteira à lista de carteiras
-        wallets.append(wallet_data)
-
-        # Grava as carteiras de volta no arquivo JSON
-        with open("wallets.json", "w") as file:
-            json.dump(wallets, file, indent=4)
-
+        get_wallet_store().append(wallet_data)
         print("Carteira salva com sucesso!")
-
-    except json.JSONDecodeError:
-        print("Erro ao decodificar o arquivo JSON. O arquivo pode estar corrompido.")
-        # Se o arquivo JSON estiver corrompido, criar um novo arquivo
-        with open("wallets.json", "w") as file:
-            json.dump([wallet_data], file, indent=4)
-        print("Arquivo JSON corrompido. Um novo arquivo foi criado.")
     except PermissionError:
-        print("Erro de permissão ao tentar acessar o arquivo wallets.json.")
+        print(f"Erro de permissão ao tentar acessar o arquivo {WALLET_STORE_PATH}.")
     except Exception as e:
         print(f"Erro ao salvar as informações no arquivo: {e}")
 
@@ -121,62 +128,241 @@ def generate_wallets():
         24: 256
     }
     
-    for i in range(num_wallets):
-        # Solicita ao usuário o tamanho da chave de recuperação
-        print("Escolha o tamanho da chave de recuperação:")
-        for words, strength in word_sizes.items():
-            print(f"{words} palavras: Força {strength} bits")
+    # Sondar todos os nós em paralelo uma única vez; o pool escolhe o melhor e troca de nó se ele cair
+    node_pool = NodePool(node_urls, timeout=NODE_TIMEOUT)
+
+    try:
+        for i in range(num_wallets):
+            # Solicita ao usuário o tamanho da chave de recuperação
+            print("Escolha o tamanho da chave de recuperação:")
+            for words, strength in word_sizes.items():
+                print(f"{words} palavras: Força {strength} bits")
         
-        word_count = int(input("Digite o número de palavras para a chave de recuperação (12, 15, 18, 21, 24): "))
-        if word_count not in word_sizes:
-            print("Tamanho inválido. Usando 12 palavras por padrão.")
-            word_count = 12  # Default to 12 words if invalid input
-
-        # Escolher um nó aleatório da lista de nós disponíveis
-        node_url = random.choice(node_urls)
-
-        # Conectar-se ao nó
-        connection_info = None
-        attempts = 0
-        while connection_info is None and attempts < 3:
-            connection_info = connect_to_node(node_url)
-            if connection_info is None:
-                print(f"Tentando novamente com outro nó...")
-                attempts += 1
-                time.sleep(2)
-
-        if connection_info:
-            print("-" * 50)
-            print(f"Conexão bem-sucedida com o nó: {connection_info['url']}")
-            print(f"Número do último bloco: {connection_info['latest_block']}")
-            print("-" * 50)
-
-            # Criar um novo endereço
-            new_private_key, new_public_address, seed_phrase = create_new_address(word_sizes[word_count])
-
-            # Obter o timestamp atual em UTC
-            timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
-
-            # Gerar um ID único para a carteira
-            wallet_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{new_public_address}-{timestamp}-{connection_info['latest_block']}"))
-
-            # Salvar os dados da carteira em um dicionário
-            wallet_data = {
-                "wallet_id": wallet_id,
-                "private_key": new_private_key,
-                "public_address": new_public_address,
-                "seed_phrase": " ".join(seed_phrase),
-                "timestamp": timestamp,
-                "block_number": connection_info["latest_block"],
-                "node_url": connection_info["url"]
-            }
-
-            # Salvar no arquivo JSON
-            save_wallet_to_file(wallet_data)
-            print(f"Carteira {i + 1}/{num_wallets} gerada com sucesso.")
-            time.sleep(0.1)  # Adicionar um pequeno delay entre as gerações
-        else:
-            print(f"Falha ao conectar a todos os nós. Tente mais tarde.")
-
-# Executar a função para gerar carteiras
-generate_wallets()
+            word_count = int(input("Digite o número de palavras para a chave de recuperação (12, 15, 18, 21, 24): "))
+            if word_count not in word_sizes:
+                print("Tamanho inválido. Usando 12 palavras por padrão.")
+                word_count = 12  # Default to 12 words if invalid input
+
+            # Obter o último bloco no melhor nó do pool (failover automático entre os nós)
+            try:
+                connection_info = node_pool.connect()
+            except NoHealthyNodeError as e:
+                print(f"Erro de conexão com os nós RPC: {e}")
+                connection_info = None
+
+            if connection_info:
+                print("-" * 50)
+                print(f"Conexão bem-sucedida com o nó: {connection_info['url']}")
+                print(f"Número do último bloco: {connection_info['latest_block']}")
+                print("-" * 50)
+
+                # Criar um novo endereço
+                new_private_key, new_public_address, seed_phrase = create_new_address(word_sizes[word_count])
+
+                # Obter o timestamp atual em UTC
+                timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+                # Gerar um ID único para a carteira
+                wallet_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{new_public_address}-{timestamp}-{connection_info['latest_block']}"))
+
+                # Salvar os dados da carteira em um dicionário
+                wallet_data = {
+                    "wallet_id": wallet_id,
+                    "private_key": new_private_key,
+                    "public_address": new_public_address,
+                    "seed_phrase": " ".join(seed_phrase),
+                    "timestamp": timestamp,
+                    "block_number": connection_info["latest_block"],
+                    "node_url": connection_info["url"]
+                }
+
+                # Salvar no arquivo JSON
+                save_wallet_to_file(wallet_data)
+                print(f"Carteira {i + 1}/{num_wallets} gerada com sucesso.")
+                time.sleep(0.1)  # Adicionar um pequeno delay entre as gerações
+            else:
+                print(f"Falha ao conectar a todos os nós. Tente mais tarde.")
+    finally:
+        node_pool.close()
+
+def save_wallets_to_file(wallets_batch):
+    """
+    Função para salvar um lote de carteiras no armazenamento append-only com uma única escrita.
+    """
+    get_wallet_store().append_many(wallets_batch)
+
+def generate_wallets_batch(num_wallets, strength, workers=None, chunk_size=64):
+    """
+    Função para gerar carteiras em lote, sem perguntas ao usuário.
+    A derivação das chaves é distribuída em um pool de processos e os registros são
+    gravados lote a lote, com relatório de carteiras por segundo.
+    """
+    node_pool = NodePool(node_urls, timeout=NODE_TIMEOUT)
+    try:
+        connection_info = node_pool.connect()
+    except NoHealthyNodeError as e:
+        print(f"Falha ao conectar a todos os nós. Tente mais tarde. ({e})")
+        return None
+    finally:
+        node_pool.close()
+
+    print("-" * 50)
+    print(f"Conexão bem-sucedida com o nó: {connection_info['url']}")
+    print(f"Número do último bloco: {connection_info['latest_block']}")
+    print("-" * 50)
+
+    def report(generated, total, rate):
+        print(f"Carteiras {generated}/{total} geradas ({rate:,.1f} carteiras/s)")
+
+    stats = generate_wallets_bulk(
+        num_wallets,
+        strength,
+        sink=save_wallets_to_file,
+        block_number=connection_info["latest_block"],
+        node_url=connection_info["url"],
+        workers=workers,
+        chunk_size=chunk_size,
+        progress=report,
+    )
+    print(
+        f"{stats['count']} carteiras geradas em {stats['seconds']:.2f}s "
+        f"({stats['wallets_per_second']:,.1f} carteiras/s com {stats['workers']} processos)."
+    )
+    return stats
+
+def generate_vanity_wallet(prefix, suffix, case_sensitive=False, workers=None):
+    """
+    Função para procurar, em todos os núcleos, um endereço com o prefixo e/ou sufixo escolhidos.
+    Informa chaves por segundo e o tempo estimado até o acerto, e salva a carteira encontrada
+    no mesmo formato das demais (sem frase-semente: o par de chaves é gerado diretamente).
+    """
+    try:
+        pattern = VanityPattern(prefix, suffix, case_sensitive)
+    except ValueError as e:
+        print(f"Padrão inválido: {e}")
+        return None
+
+    print(f"Procurando 0x{pattern.prefix}...{pattern.suffix} "
+          f"(1 acerto a cada {pattern.difficulty:,} chaves, em média)")
+
+    last_report = 0.0
+
+    def report(keys, rate, eta):
+        nonlocal last_report
+        now = time.monotonic()
+        if now - last_report >= 1:
+            print(f"{keys:,} chaves testadas ({rate:,.0f} chaves/s, acerto estimado em {eta:,.0f}s)")
+            last_report = now
+
+    result = search_vanity_address(pattern, workers=workers, progress=report)
+    print(f"Endereço encontrado: {result['public_address']} após {result['keys']:,} chaves em "
+          f"{result['seconds']:.1f}s ({result['keys_per_second']:,.0f} chaves/s com {result['workers']} processos).")
+
+    # O bloco e o nó ficam registrados como nas demais carteiras, se algum nó responder
+    connection_info = {"url": None, "latest_block": None}
+    node_pool = NodePool(node_urls, timeout=NODE_TIMEOUT)
+    try:
+        connection_info = node_pool.connect()
+    except NoHealthyNodeError as e:
+        print(f"Nenhum nó RPC respondeu; a carteira será salva sem o número do bloco. ({e})")
+    finally:
+        node_pool.close()
+
+    save_wallet_to_file(build_vanity_record(result, connection_info["latest_block"], connection_info["url"]))
+    return result
+
+def export_wallets_to_keystores(directory, kdf_params, workers=None):
+    """
+    Função para exportar as carteiras do armazenamento para keystores V3 cifrados (um arquivo por carteira).
+    A cifragem é distribuída em um pool de processos e os arquivos são gravados à medida que ficam prontos.
+    """
+    password = getpass.getpass("Senha dos keystores: ")
+    if password != getpass.getpass("Confirme a senha: "):
+        print("As senhas não conferem.")
+        return None
+
+    def report(exported, rate):
+        print(f"{exported} keystores gravados ({rate:,.1f} carteiras/s)")
+
+    stats = export_keystores(get_wallet_store(), directory, password, kdf_params, workers=workers, progress=report)
+    print(
+        f"{stats['count']} keystores exportados para {directory} em {stats['seconds']:.2f}s "
+        f"({stats['wallets_per_second']:,.1f} carteiras/s com {stats['workers']} processos; "
+        f"{stats['skipped']} carteiras já exportadas ou sem chave privada)."
+    )
+    return stats
+
+def import_wallets_from_keystores(directory, workers=None):
+    """
+    Função para importar os keystores V3 de um diretório para o armazenamento de carteiras.
+    Carteiras cujo endereço já está no armazenamento não são duplicadas.
+    """
+    password = getpass.getpass("Senha dos keystores: ")
+    store = get_wallet_store()
+    paths = sorted(str(path) for path in Path(directory).iterdir() if path.is_file())
+
+    def save_new(records):
+        new = {}
+        for record in records:
+            if record["public_address"] not in store:
+                new.setdefault(record["public_address"].lower(), record)
+        return store.append_many(new.values())
+
+    def report(imported, rate):
+        print(f"{imported} keystores importados ({rate:,.1f} carteiras/s)")
+
+    stats = import_keystores(paths, password, save_new, workers=workers, progress=report)
+    print(
+        f"{stats['count']} keystores importados de {directory} em {stats['seconds']:.2f}s "
+        f"({stats['wallets_per_second']:,.1f} carteiras/s; {stats['skipped']} já estavam no armazenamento; "
+        f"{stats['failed']} não puderam ser decifrados)."
+    )
+    return stats
+
+def main():
+    global WALLET_STORE_PATH
+
+    parser = argparse.ArgumentParser(description="Gerador de carteiras da Binance Smart Chain.")
+    parser.add_argument("--count", type=int, help="Número de carteiras (modo em lote, sem perguntas)")
+    parser.add_argument("--strength", type=int, default=128, choices=sorted(WORD_SIZES.values()),
+                        help="Força da frase-semente em bits (padrão: 128, 12 palavras)")
+    parser.add_argument("--workers", type=int, help="Processos usados na derivação (padrão: número de CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=64, help="Carteiras por tarefa enviada a um processo")
+    parser.add_argument("--store", default=WALLET_STORE_PATH, help="Arquivo JSON Lines das carteiras")
+    parser.add_argument("--vanity-prefix", default="", help="Procura um endereço que comece com estes dígitos hexadecimais")
+    parser.add_argument("--vanity-suffix", default="", help="Procura um endereço que termine com estes dígitos hexadecimais")
+    parser.add_argument("--case-sensitive", action="store_true",
+                        help="Exige as maiúsculas/minúsculas do padrão no endereço em checksum")
+    parser.add_argument("--export-keystores", metavar="DIRETÓRIO",
+                        help="Exporta as carteiras do armazenamento para keystores V3 cifrados e sai")
+    parser.add_argument("--import-keystores", metavar="DIRETÓRIO",
+                        help="Importa os keystores V3 de um diretório para o armazenamento e sai")
+    parser.add_argument("--kdf", default="scrypt", choices=["scrypt", "pbkdf2"], help="KDF dos keystores exportados")
+    parser.add_argument("--kdf-work-factor", type=int,
+                        help="n do scrypt (potência de 2) ou iterações do PBKDF2 (padrão: 262144 / 1000000)")
+    parser.add_argument("--import-json", metavar="ARQUIVO",
+                        help="Importa um wallets.json do formato antigo para o armazenamento e sai")
+    args = parser.parse_args()
+
+    WALLET_STORE_PATH = args.store
+
+    if args.import_json:
+        imported = get_wallet_store().import_json(args.import_json)
+        print(f"{imported} carteiras importadas de {args.import_json} para {WALLET_STORE_PATH}.")
+    elif args.export_keystores:
+        export_wallets_to_keystores(args.export_keystores, KdfParams(args.kdf, args.kdf_work_factor), args.workers)
+    elif args.import_keystores:
+        import_wallets_from_keystores(args.import_keystores, args.workers)
+    elif args.vanity_prefix or args.vanity_suffix:
+        generate_vanity_wallet(args.vanity_prefix, args.vanity_suffix, args.case_sensitive, args.workers)
+    elif args.count is None:
+        # Sem argumentos: modo interativo original
+        generate_wallets()
+    else:
+        generate_wallets_batch(args.count, args.strength, args.workers, args.chunk_size)
+
+    if _wallet_store is not None:
+        _wallet_store.close()
+
+if __name__ == "__main__":
+    main()
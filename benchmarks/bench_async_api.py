@@ -0,0 +1,149 @@
+"""
+Benchmark das variantes asyncio das APIs contra as chamadas síncronas levadas a threads.
+
+Com os provedores substituídos pelos servidores locais (`benchmarks.local_api`, com
+latência configurável), o benchmark:
+
+1. confere que cada variante assíncrona devolve o mesmo resultado da síncrona
+   (BscScan, CoinGecko, CoinMarketCap, 0x e PancakeSwap/NodeReal);
+2. mede `--calls` consultas de preço da 0x (cada uma com uma quantidade diferente, para
+   não serem atendidas pelo cache) e de pares da PancakeSwap disparadas de uma vez no
+   event loop, de duas formas:
+   - `asyncio.to_thread(get_token_price, ...)`: o que um serviço asyncio faz hoje com as
+     funções bloqueantes (limitado pelas threads do executor padrão);
+   - `asyncio.gather(get_token_price_async(...))`: sessão aiohttp compartilhada, com no
+     máximo `max_concurrency` requisições simultâneas por provedor.
+
+Também mede consultas repetidas ao mesmo preço, que o cache atende com uma única requisição.
+
+    python -m benchmarks.bench_async_api --calls 500 --latency 0.05
+"""
+import argparse
+import asyncio
+import contextlib
+import logging
+import os
+import time
+
+from bsc_toolkit.http_client import close_async_clients
+
+from .local_api import PROVIDERS, StandInServer, redirect, redirect_async
+
+API_KEYS = ("BSC_API_KEY", "COINMARKETCAP_API_KEY", "ZEROX_API_KEY", "PANCAKESWAP_API_KEY")
+
+SELL_TOKEN = "0x0697AB2B003FD2Cbaea2dF1ef9b404E45bE59d4C"
+BUY_TOKEN = "0x55d398326f99059fF775485246999027B3197955"
+
+
+async def check_parity(cmc) -> None:
+    from bsc_toolkit.api import bscscan, coingecko, pancakeswap, zerox
+    from bsc_toolkit.price_cache import get_price_cache
+
+    api_key = bscscan.get_api_key()
+    pair = pancakeswap.ASPPBR_PAIRS[0][0]
+    cases = [
+        ("bscscan.get_gas_price", lambda: bscscan.get_gas_price(api_key), lambda: bscscan.get_gas_price_async(api_key)),
+        ("bscscan.get_eth_block_number", lambda: bscscan.get_eth_block_number(api_key),
+         lambda: bscscan.get_eth_block_number_async(api_key)),
+        ("bscscan.get_gas_oracle", lambda: bscscan.get_gas_oracle(api_key), lambda: bscscan.get_gas_oracle_async(api_key)),
+        ("bscscan.get_bnb_supply", lambda: bscscan.get_bnb_supply(api_key), lambda: bscscan.get_bnb_supply_async(api_key)),
+        ("bscscan.get_bnb_price", lambda: bscscan.get_bnb_price(api_key), lambda: bscscan.get_bnb_price_async(api_key)),
+        ("bscscan.estimate_gas", lambda: bscscan.estimate_gas(api_key, "0x4e71d92d", BUY_TOKEN, None, None, None),
+         lambda: bscscan.estimate_gas_async(api_key, "0x4e71d92d", BUY_TOKEN, None, None, None)),
+        ("bscscan.get_prices_usd", lambda: bscscan.get_prices_usd(["ethereum", "binancecoin"]),
+         lambda: bscscan.get_prices_usd_async(["ethereum", "binancecoin"])),
+        ("coingecko.get_market_data", lambda: coingecko.get_market_data([f"coin-{i}" for i in range(250)]),
+         lambda: coingecko.get_market_data_async([f"coin-{i}" for i in range(250)])),
+        ("coinmarketcap.get_latest_market_pairs", lambda: cmc.get_latest_market_pairs(limit=50, convert="USD,EUR"),
+         lambda: cmc.get_latest_market_pairs_async(limit=50, convert="USD,EUR")),
+        ("coinmarketcap.get_crypto_map", cmc.get_crypto_map, cmc.get_crypto_map_async),
+        ("coinmarketcap.get_crypto_categories", cmc.get_crypto_categories, cmc.get_crypto_categories_async),
+        ("zerox.get_token_price", lambda: zerox.get_token_price(SELL_TOKEN, BUY_TOKEN, 10 ** 7),
+         lambda: zerox.get_token_price_async(SELL_TOKEN, BUY_TOKEN, 10 ** 7)),
+        ("pancakeswap.get_pair_data", lambda: pancakeswap.get_pair_data(pair),
+         lambda: pancakeswap.get_pair_data_async(pair)),
+    ]
+    for name, sync, native in cases:
+        # Sem cache, para que as duas variantes façam a requisição
+        get_price_cache().invalidate()
+        expected = await asyncio.to_thread(sync)
+        get_price_cache().invalidate()
+        assert await native() == expected, name
+    print(f"{len(cases)} variantes assíncronas com o mesmo resultado das síncronas.")
+
+
+async def measure(name: str, calls, count: int) -> None:
+    from bsc_toolkit.price_cache import get_price_cache
+
+    get_price_cache().invalidate()
+    started = time.perf_counter()
+    results = await asyncio.gather(*(call() for call in calls))
+    elapsed = time.perf_counter() - started
+    assert len(results) == count
+    print(f"{name:<56}{count / elapsed:>12,.1f}{elapsed * 1000:>12,.0f}")
+
+
+async def run(args, cmc) -> None:
+    from bsc_toolkit.api import pancakeswap, zerox
+
+    await check_parity(cmc)
+    amounts = range(10 ** 6, 10 ** 6 + args.calls)
+    pairs = [f"0x{i:040x}" for i in range(args.calls)]
+
+    print(f"{'caminho':<56}{'chamadas/s':>12}{'total (ms)':>12}")
+    await measure("asyncio.to_thread(get_token_price)", [
+        lambda amount=amount: asyncio.to_thread(zerox.get_token_price, SELL_TOKEN, BUY_TOKEN, amount)
+        for amount in amounts
+    ], args.calls)
+    await measure("get_token_price_async", [
+        lambda amount=amount: zerox.get_token_price_async(SELL_TOKEN, BUY_TOKEN, amount) for amount in amounts
+    ], args.calls)
+    await measure("get_token_price_async (sempre o mesmo par e quantidade)", [
+        lambda: zerox.get_token_price_async(SELL_TOKEN, BUY_TOKEN, 10 ** 6) for _ in amounts
+    ], args.calls)
+    await measure("asyncio.to_thread(get_pair_data)", [
+        lambda pair=pair: asyncio.to_thread(pancakeswap.get_pair_data, pair) for pair in pairs
+    ], args.calls)
+    await measure("get_pair_data_async", [
+        lambda pair=pair: pancakeswap.get_pair_data_async(pair) for pair in pairs
+    ], args.calls)
+    await close_async_clients()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=500, help="Consultas disparadas de uma vez em cada caminho")
+    parser.add_argument("--latency", type=float, default=0.05, help="Latência média dos provedores, em segundos")
+    args = parser.parse_args()
+
+    for name in API_KEYS:
+        os.environ[name] = "benchmark"
+    logging.getLogger("bsc_toolkit").setLevel(logging.CRITICAL)
+
+    from bsc_toolkit.api import bscscan, coingecko, pancakeswap, zerox
+    from bsc_toolkit.api.coinmarketcap import CoinMarketCapAPI
+
+    with contextlib.ExitStack() as stack:
+        servers = {
+            provider: stack.enter_context(StandInServer(factory(), latency=args.latency))
+            for provider, (_, factory) in PROVIDERS.items()
+        }
+        cmc = CoinMarketCapAPI(requests_per_minute=10 ** 9)
+        coingecko.get_scheduler().requests_per_minute = 10 ** 9
+        clients = {
+            "bscscan": (bscscan.bscscan_client(), bscscan.bscscan_async_client()),
+            "coingecko": (coingecko.coingecko_client(), coingecko.coingecko_async_client()),
+            "coinmarketcap": (cmc.client, cmc.async_client),
+            "0x": (zerox.zerox_client(), zerox.zerox_async_client()),
+            "nodereal": (pancakeswap.nodereal_client(), pancakeswap.nodereal_async_client()),
+        }
+        for provider, (prefix, _) in PROVIDERS.items():
+            client, async_client = clients[provider]
+            redirect(client, prefix, servers[provider].url)
+            redirect_async(async_client, prefix, servers[provider].url)
+
+        asyncio.run(run(args, cmc))
+
+
+if __name__ == "__main__":
+    main()
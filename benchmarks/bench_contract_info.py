@@ -0,0 +1,98 @@
+"""
+Benchmark da inspeção de contratos BEP-20: laço original vs. JSON-RPC batch vs. Multicall3.
+
+Executa contra um nó local (`local_node.LocalBscNode`), sem acesso à rede:
+
+    python -m benchmarks.bench_contract_info --tokens 200 --latency 0.005
+"""
+import argparse
+import json
+import logging
+import time
+
+from web3 import Web3
+
+from bsc_toolkit.inspector import query_contracts_info
+from bsc_toolkit.inspector.contract_analysis import load_bep20_abi
+from bsc_toolkit.rpc import JsonRpcClient
+
+from .local_node import LocalBscNode, fake_tokens
+
+
+def legacy_loop(url, addresses, contract_abi):
+    """
+    Mesma sequência de chamadas de `query_contract_info`: 4 eth_call bloqueantes por token, um token por vez.
+    """
+    web3 = Web3(Web3.HTTPProvider(url))
+    results = []
+    for address in addresses:
+        try:
+            contract = web3.eth.contract(address=address, abi=contract_abi)
+            results.append({
+                "symbol": contract.functions.symbol().call(),
+                "name": contract.functions.name().call(),
+                "decimals": contract.functions.decimals().call(),
+                "total_supply": contract.functions.totalSupply().call(),
+            })
+        except Exception:
+            results.append(None)
+    return results
+
+
+def run(node, label, fn):
+    node.reset_counters()
+    start = time.perf_counter()
+    results = fn()
+    elapsed = time.perf_counter() - start
+    ok = sum(1 for r in results if r)
+    return {
+        "mode": label,
+        "tokens": len(results),
+        "ok": ok,
+        "failed": len(results) - ok,
+        "http_requests": node.http_requests,
+        "rpc_calls": node.rpc_calls,
+        "http_requests_per_token": node.http_requests / len(results),
+        "seconds": elapsed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=200, help="Quantidade de contratos inspecionados")
+    parser.add_argument("--latency", type=float, default=0.005, help="Latência por requisição HTTP (s)")
+    parser.add_argument("--reverting-every", type=int, default=25, help="Um a cada N contratos reverte")
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    # Os contratos que revertem são esperados; não poluir a saída com os logs de erro
+    logging.getLogger("bsc_toolkit").setLevel(logging.CRITICAL)
+
+    contract_abi = load_bep20_abi()
+
+    tokens = fake_tokens(args.tokens, args.reverting_every)
+    addresses = list(tokens)
+
+    with LocalBscNode(tokens, latency=args.latency) as node:
+        rows = [
+            run(node, "laço original", lambda: legacy_loop(node.url, addresses, contract_abi)),
+            run(node, "json-rpc batch", lambda: query_contracts_info(addresses, JsonRpcClient(node.url), method="batch")),
+            run(node, "multicall3", lambda: query_contracts_info(addresses, JsonRpcClient(node.url))),
+        ]
+
+    if args.json:
+        print(json.dumps(rows, indent=4))
+        return
+
+    baseline = rows[0]["seconds"]
+    print(f"{args.tokens} tokens, latência {args.latency * 1000:.1f} ms por requisição HTTP")
+    print(f"{'modo':<16}{'ok':>6}{'falhas':>8}{'HTTP':>8}{'HTTP/token':>12}{'tempo (s)':>11}{'ganho':>8}")
+    for row in rows:
+        print(
+            f"{row['mode']:<16}{row['ok']:>6}{row['failed']:>8}{row['http_requests']:>8}"
+            f"{row['http_requests_per_token']:>12.3f}{row['seconds']:>11.3f}{baseline / row['seconds']:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
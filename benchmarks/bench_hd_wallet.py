@@ -0,0 +1,62 @@
+"""
+Benchmark da derivação HD com a chave mestra em cache contra o caminho atual por carteira.
+
+Compara endereços por segundo de:
+
+- `Account.from_mnemonic` para cada conta m/44'/60'/0'/0/i da mesma frase (o que o
+  caminho atual faz por carteira: PBKDF2 da semente e derivação BIP-32 completa);
+- `create_wallet_keys` (frase nova + `Account.from_mnemonic` por carteira);
+- `HDWallet.derive_range` (semente e nível de troca calculados uma vez);
+- `HDWallet.iter_ranges` em um pool de processos.
+
+Também confere que as chaves do `HDWallet` são as mesmas do `Account.from_mnemonic`.
+
+    python -m benchmarks.bench_hd_wallet --count 2000 --workers 4
+"""
+import argparse
+import os
+import time
+
+from eth_account import Account
+
+from bsc_toolkit.wallet import HDWallet, create_wallet_keys
+
+
+def rate(fn, count: int) -> float:
+    started = time.perf_counter()
+    fn()
+    return count / (time.perf_counter() - started)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=2000, help="Endereços derivados pelo HDWallet")
+    parser.add_argument("--baseline", type=int, default=100, help="Endereços derivados pelos caminhos atuais")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="Processos do caso paralelo")
+    args = parser.parse_args()
+
+    Account.enable_unaudited_hdwallet_features()
+    wallet = HDWallet.generate(128)
+    for index in (0, 1, args.count - 1):
+        account = Account.from_mnemonic(wallet.seed_phrase, account_path=wallet.path(index))
+        assert wallet.derive(index) == (account._private_key.hex(), account.address), index
+
+    rows = [
+        ("Account.from_mnemonic por conta", rate(
+            lambda: [Account.from_mnemonic(wallet.seed_phrase, account_path=wallet.path(i))
+                     for i in range(args.baseline)], args.baseline)),
+        ("create_wallet_keys (frase nova)", rate(
+            lambda: [create_wallet_keys(128) for _ in range(args.baseline)], args.baseline)),
+        ("HDWallet (semente + cache)", rate(lambda: HDWallet(wallet.seed_phrase).derive_range(0, args.count),
+                                            args.count)),
+        (f"HDWallet.iter_ranges ({args.workers} processos)",
+         rate(lambda: sum(len(chunk) for chunk in wallet.iter_ranges(args.count, workers=args.workers)), args.count)),
+    ]
+
+    print(f"{'caminho':<40}{'endereços/s':>14}{'ganho':>9}")
+    for name, addresses_per_second in rows:
+        print(f"{name:<40}{addresses_per_second:>14,.1f}{addresses_per_second / rows[0][1]:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""
+Benchmark da reutilização de conexões HTTP nas chamadas às APIs.
+
+Compara, contra um servidor HTTP local, três formas de fazer N chamadas repetidas:
+  - `requests.get` solto (como o `bsc.py` original): uma conexão nova por chamada;
+  - uma `Session` nova por chamada (como o `CoinMarketCapAPI.establish_connection` original);
+  - o `HttpClient` compartilhado de `bsc_toolkit.http_client`: conexões keep-alive reutilizadas.
+
+O custo de abrir uma conexão (handshake TCP + TLS até um provedor real) é simulado por um
+atraso aplicado pelo servidor a cada conexão nova:
+
+    python -m benchmarks.bench_http_reuse --calls 200 --handshake 0.03 --latency 0.005
+"""
+import argparse
+import gzip
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from bsc_toolkit.http_client import HttpClient
+
+PAYLOAD = json.dumps({
+    "status": "1",
+    "message": "OK",
+    "result": [{"id": i, "symbol": f"TK{i}", "price": i * 1.5} for i in range(200)],
+}).encode()
+
+
+class LocalApiServer:
+    """
+    Servidor HTTP/1.1 local (keep-alive) que conta conexões e simula o custo de cada conexão nova.
+    """
+
+    def __init__(self, handshake: float, latency: float):
+        self.handshake = handshake
+        self.latency = latency
+        self.connections = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+                time.sleep(server.handshake)
+
+            def do_GET(self):
+                time.sleep(server.latency)
+                body = PAYLOAD
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                    self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def measure(server, label, calls, fn):
+    server.connections = 0
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        fn()
+        latencies.append(time.perf_counter() - t0)
+    total = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "mode": label,
+        "calls": calls,
+        "connections": server.connections,
+        "mean_ms": statistics.fmean(latencies) * 1000,
+        "p50_ms": latencies[len(latencies) // 2] * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "seconds": total,
+    }
+
+
+def new_session_per_call(url):
+    session = requests.Session()
+    session.get(url, params={"module": "stats"}).json()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200, help="Chamadas por modo")
+    parser.add_argument("--handshake", type=float, default=0.03, help="Custo simulado de uma conexão nova (s)")
+    parser.add_argument("--latency", type=float, default=0.005, help="Latência simulada por requisição (s)")
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    server = LocalApiServer(args.handshake, args.latency)
+    client = HttpClient("local")
+    try:
+        rows = [
+            measure(server, "requests.get", args.calls,
+                    lambda: requests.get(server.url, params={"module": "stats"}).json()),
+            measure(server, "Session por chamada", args.calls, lambda: new_session_per_call(server.url)),
+            measure(server, "HttpClient", args.calls,
+                    lambda: client.get_json(server.url, params={"module": "stats"})),
+        ]
+    finally:
+        client.close()
+        server.close()
+
+    if args.json:
+        print(json.dumps(rows, indent=4))
+        return
+
+    print(f"{args.calls} chamadas por modo; conexão nova custa {args.handshake * 1000:.0f} ms, "
+          f"requisição {args.latency * 1000:.0f} ms")
+    print(f"{'modo':<22}{'conexões':>10}{'média (ms)':>12}{'p50 (ms)':>10}{'p95 (ms)':>10}{'total (s)':>11}")
+    for row in rows:
+        print(f"{row['mode']:<22}{row['connections']:>10}{row['mean_ms']:>12.2f}{row['p50_ms']:>10.2f}"
+              f"{row['p95_ms']:>10.2f}{row['seconds']:>11.2f}")
+    saved = rows[0]["mean_ms"] - rows[2]["mean_ms"]
+    print(f"Reutilizar a conexão economiza {saved:.2f} ms por chamada ({saved / rows[0]['mean_ms']:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
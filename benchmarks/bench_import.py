@@ -0,0 +1,128 @@
+"""
+Benchmark do custo de importar os módulos do pacote.
+
+Cada módulo é importado em um interpretador novo (importação a frio), dentro de um
+diretório temporário com um `.env` falso, e com um audit hook que registra a E/S feita
+durante a importação. Importar um módulo do pacote não deve tocar na rede nem ler
+arquivos de configuração ou dados (o `.env`, a ABI, o armazenamento de carteiras):
+  - conexões e resoluções de nome (`socket.connect`, `socket.getaddrinfo`) e arquivos
+    abertos no diretório atual ou no repositório contam como E/S indevida;
+  - a E/S local das dependências (metadados de pacotes lidos pelo importlib, o teste de
+    IPv6 do urllib3 com um bind em ::1, ...) é apenas contada, à parte.
+
+Para cada módulo são medidos:
+  - o tempo total da importação (inclui dependências como requests, eth_abi e web3);
+  - o tempo próprio dos módulos `bsc_toolkit.*` (`-X importtime`), que é o custo que o
+    pacote acrescenta e que deve ficar em poucos milissegundos.
+
+    python -m benchmarks.bench_import --budget-ms 20
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+MODULES = [
+    "bsc_toolkit",
+    "bsc_toolkit.metrics",
+    "bsc_toolkit.http_client",
+    "bsc_toolkit.price_cache",
+    "bsc_toolkit.scheduler",
+    "bsc_toolkit.gas_oracle",
+    "bsc_toolkit.pair_history",
+    "bsc_toolkit.pair_analytics",
+    "bsc_toolkit.listings",
+    "bsc_toolkit.rpc",
+    "bsc_toolkit.inspector",
+    "bsc_toolkit.inspector.contract_analysis",
+    "bsc_toolkit.wallet",
+    "bsc_toolkit.api.bscscan",
+    "bsc_toolkit.api.coingecko",
+    "bsc_toolkit.api.coinmarketcap",
+    "bsc_toolkit.api.zerox",
+    "bsc_toolkit.api.pancakeswap",
+]
+
+# Executado no interpretador novo: importa o módulo e classifica a E/S observada
+PROBE = r"""
+import json, os, sys, time
+
+ROOT, CWD = sys.argv[2], os.getcwd()
+CODE_SUFFIXES = (".py", ".pyc", ".so", ".pyd", ".pth", ".typed")
+io, deps_io = [], []
+
+def hook(event, args):
+    if event in ("socket.connect", "socket.getaddrinfo"):
+        io.append([event, repr(args[1] if event == "socket.connect" else args[:2])])
+    elif event in ("socket.bind", "subprocess.Popen"):
+        deps_io.append(event)
+    elif event == "open" and isinstance(args[0], str) and not args[0].endswith(CODE_SUFFIXES):
+        path = os.path.abspath(args[0])
+        if os.path.isdir(path):
+            return
+        if path.startswith((CWD + os.sep, ROOT + os.sep)):
+            io.append([event, path])
+        else:
+            deps_io.append(event)
+
+sys.addaudithook(hook)
+started = time.perf_counter()
+__import__(sys.argv[1])
+elapsed = time.perf_counter() - started
+print(json.dumps({"total_ms": elapsed * 1000, "io": io, "deps_io": len(deps_io)}))
+"""
+
+
+def measure(module: str, workdir: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=str(ROOT), PYTHONDONTWRITEBYTECODE="1")
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE, module, str(ROOT)],
+        cwd=workdir, env=env, capture_output=True, text=True, check=True,
+    )
+    result = json.loads(process.stdout.strip().splitlines()[-1])
+
+    # Linhas do -X importtime: "import time: <self us> | <cumulative us> | <módulo>"
+    own_us = 0
+    for line in process.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip().startswith("bsc_toolkit"):
+            own_us += int(parts[0].split(":")[1])
+    result.update(module=module, own_ms=own_us / 1000)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget-ms", type=float, default=20.0,
+                        help="Tempo próprio máximo dos módulos bsc_toolkit por importação (ms)")
+    parser.add_argument("--json", action="store_true", help="Imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        # Um .env no diretório atual: lê-lo durante a importação conta como E/S indevida
+        Path(workdir, ".env").write_text("BSC_API_KEY=nao-deve-ser-lida\n")
+        rows = [measure(module, workdir) for module in MODULES]
+
+    failures = [row for row in rows if row["io"] or row["own_ms"] > args.budget_ms]
+    if args.json:
+        print(json.dumps(rows, indent=4))
+    else:
+        print(f"{'módulo':<42}{'total (ms)':>12}{'próprio (ms)':>14}{'E/S':>6}{'E/S deps':>10}")
+        for row in rows:
+            print(f"{row['module']:<42}{row['total_ms']:>12.1f}{row['own_ms']:>14.2f}{len(row['io']):>6}"
+                  f"{row['deps_io']:>10}")
+        for row in failures:
+            for event in row["io"]:
+                print(f"E/S durante a importação de {row['module']}: {event}")
+        print("OK: nenhuma importação fez E/S e todas ficaram dentro do orçamento."
+              if not failures else f"{len(failures)} módulo(s) fora do esperado.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark do custo das métricas no caminho quente.
+
+Mede o tempo de `record_http`/`record_rpc` com o registro ligado e desligado, e o de
+gerar o snapshot e a exposição do Prometheus, e compara com uma requisição HTTP real
+ao servidor local do BscScan (sem latência injetada) para mostrar a fração do custo
+de uma chamada que vai para a instrumentação.
+
+    python -m benchmarks.bench_metrics --calls 200000
+"""
+import argparse
+import time
+
+from bsc_toolkit import metrics
+from bsc_toolkit.api import bscscan
+
+from .local_api import StandInServer, bscscan_handler, redirect
+
+
+def per_call(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200000, help="Registros medidos por caso")
+    parser.add_argument("--requests", type=int, default=300, help="Requisições HTTP ao servidor local")
+    args = parser.parse_args()
+
+    record_http = lambda: metrics.record_http("bscscan", "/api", 200, 0.012, 512)
+    record_rpc = lambda: metrics.record_rpc("https://bsc-dataseed.binance.org/", "eth_call", 0.02, 128)
+
+    rows = []
+    for enabled in (True, False):
+        metrics.set_enabled(enabled)
+        state = "ligado" if enabled else "desligado"
+        rows.append((f"record_http ({state})", per_call(record_http, args.calls)))
+        rows.append((f"record_rpc ({state})", per_call(record_rpc, args.calls)))
+    metrics.set_enabled(True)
+    rows.append(("snapshot()", per_call(metrics.snapshot, 1000)))
+    rows.append(("to_prometheus()", per_call(metrics.to_prometheus, 1000)))
+
+    with StandInServer(bscscan_handler()) as server:
+        redirect(bscscan.bscscan_client(), "https://api.bscscan.com", server.url)
+        request = lambda: bscscan.get_gas_price("benchmark")
+        per_call(request, 20)
+        rows.append(("get_gas_price (HTTP local)", per_call(request, args.requests)))
+
+    print(f"{'operação':<32}{'por chamada (µs)':>18}")
+    for name, seconds in rows:
+        print(f"{name:<32}{seconds * 1e6:>18.2f}")
+    overhead = rows[0][1] / rows[-1][1]
+    print(f"Instrumentação: {overhead:.2%} do tempo de uma requisição ao servidor local.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+"""
+Servidores locais que substituem os provedores externos nos benchmarks.
+
+Cada servidor responde como o provedor real a partir das respostas gravadas em
+`benchmarks/fixtures/` (BscScan, CoinGecko, CoinMarketCap, 0x e NodeReal GraphQL),
+expandindo os modelos para os ids, pares e moedas pedidos. Latência, jitter e
+injeção de erros (HTTP 503) são configuráveis.
+
+Os clientes HTTP do pacote são redirecionados para cá com `redirect`, sem nenhuma
+alteração no código das APIs: a URL original (https://api.bscscan.com/...) é
+reescrita para o servidor local no adaptador da `requests.Session`. Os clientes
+assíncronos (aiohttp) são redirecionados com `redirect_async`.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from requests.adapters import HTTPAdapter
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+# handler(método, caminho, query, corpo JSON) -> (status, corpo JSON)
+Handler = Callable[[str, str, Dict[str, str], Any], Tuple[int, Any]]
+
+
+def load_fixture(name: str) -> Any:
+    with open(FIXTURES / f"{name}.json") as file:
+        return json.load(file)
+
+
+class BurstHTTPServer(ThreadingHTTPServer):
+    """
+    `ThreadingHTTPServer` com fila de conexões maior: com a fila padrão (5), uma rajada de
+    conexões novas (ex.: clientes asyncio) perde SYNs, e cada um refeito custa 1 s.
+    """
+
+    request_queue_size = 128
+
+
+class StandInServer:
+    """
+    Servidor HTTP/1.1 local (keep-alive) em uma thread de fundo. Use como gerenciador de contexto.
+
+    Args:
+        handler (Callable): Produz a resposta de cada requisição.
+        latency (float): Atraso médio por requisição, em segundos.
+        jitter (float): Variação máxima (uniforme, para mais ou para menos) do atraso.
+        error_rate (float): Fração das requisições respondidas com HTTP 503.
+        seed (int, opcional): Semente do gerador de jitter e erros, para execuções reprodutíveis.
+    """
+
+    def __init__(self, handler: Handler, latency: float = 0.0, jitter: float = 0.0,
+                 error_rate: float = 0.0, seed: Optional[int] = None):
+        self.handler = handler
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests = 0
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = BurstHTTPServer(("127.0.0.1", 0), self._request_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.injected_errors = 0
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _draw(self) -> Tuple[float, bool]:
+        """
+        Sorteia o atraso e se a requisição falha (sob lock: `random.Random` não é thread-safe).
+        """
+        with self._lock:
+            self.requests += 1
+            delay = max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter))
+            fail = self._random.random() < self.error_rate
+            if fail:
+                self.injected_errors += 1
+        return delay, fail
+
+    def _request_handler(self):
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def _respond(self, method):
+                parts = urlsplit(self.path)
+                query = {key: values[-1] for key, values in parse_qs(parts.query).items()}
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+
+                delay, fail = server._draw()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    status, payload = 503, {"error": "erro injetado pelo benchmark"}
+                else:
+                    status, payload = server.handler(method, parts.path, query, body)
+
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                self._respond("GET")
+
+            def do_POST(self):
+                self._respond("POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        return RequestHandler
+
+
+class RedirectAdapter(HTTPAdapter):
+    """
+    Adaptador da `requests` que envia as requisições para outro servidor, mantendo caminho e query.
+    """
+
+    def __init__(self, target: str, **kwargs):
+        super().__init__(**kwargs)
+        self.target = target.rstrip("/")
+
+    def send(self, request, **kwargs):
+        parts = urlsplit(request.url)
+        request.url = self.target + parts.path + (f"?{parts.query}" if parts.query else "")
+        return super().send(request, **kwargs)
+
+
+def redirect(client, prefix: str, target: str) -> None:
+    """
+    Faz um `HttpClient` enviar ao servidor `target` tudo o que começar com `prefix`.
+    """
+    client.session.mount(prefix, RedirectAdapter(target, pool_maxsize=10))
+
+
+def redirect_async(client, prefix: str, target: str) -> None:
+    """
+    Faz um `AsyncHttpClient` enviar ao servidor `target` tudo o que começar com `prefix`.
+    """
+    resolve = client._url
+
+    def url(path: str) -> str:
+        full = resolve(path)
+        return target.rstrip("/") + full[len(prefix):] if full.startswith(prefix) else full
+
+    client._url = url
+
+
+# Provedores
+
+def bscscan_handler() -> Handler:
+    fixtures = load_fixture("bscscan")
+
+    def handle(method, path, query, body):
+        if not query.get("apikey"):
+            return 200, {"status": "0", "message": "NOTOK", "result": "Missing/Invalid API Key"}
+        return 200, fixtures[query.get("action")]
+
+    return handle
+
+
+def coingecko_handler() -> Handler:
+    fixtures = load_fixture("coingecko")
+
+    def handle(method, path, query, body):
+        ids = [i for i in query.get("ids", "").split(",") if i]
+        if path.endswith("/simple/price"):
+            return 200, {i: fixtures["simple_price"] for i in ids}
+        if path.endswith("/coins/markets"):
+            row = fixtures["coins_markets_row"]
+            return 200, [dict(row, id=i, symbol=i[:4], name=i.title()) for i in ids[:int(query.get("per_page", 100))]]
+        return 404, {"error": "Not Found"}
+
+    return handle
+
+
+def coinmarketcap_handler(total: int = 10_000) -> Handler:
+    """
+    A listagem tem `total` moedas (informado em `status.total_count`); preço e
+    capitalização caem com o rank, e cada moeda de cotação tem uma taxa diferente.
+    """
+    fixtures = load_fixture("coinmarketcap")
+
+    rates = {"USD": 1.0, "EUR": 0.92, "BRL": 5.6, "BTC": 1 / 68_000}
+
+    def quote(i, currency):
+        rate = rates.get(currency, 1.0)
+        row = fixtures["listing_row"]["quote_row"]
+        return dict(row, price=row["price"] * rate / i, market_cap=row["market_cap"] * rate / i,
+                    volume_24h=row["volume_24h"] * rate / (1 + i % 97), percent_change_24h=(i % 41 - 20) / 4)
+
+    def handle(method, path, query, body):
+        start, limit = int(query.get("start", 1)), int(query.get("limit", 100))
+        numbers = range(start, min(start + limit, total + 1))
+        if path.endswith("/listings/latest"):
+            converts = query.get("convert", "USD").split(",")
+            rows = [
+                dict(fixtures["listing_row"], id=i, cmc_rank=i, symbol=f"C{i % 4000}", name=f"Coin {i}",
+                     quote={currency: quote(i, currency) for currency in converts})
+                for i in numbers
+            ]
+            for row in rows:
+                del row["quote_row"]
+            return 200, {"status": dict(fixtures["status"], total_count=total), "data": rows}
+        elif path.endswith("/map"):
+            rows = [dict(fixtures["map_row"], id=i, rank=i, symbol=f"C{i}", name=f"Coin {i}") for i in numbers]
+        elif path.endswith("/categories"):
+            rows = [dict(fixtures["category_row"], id=f"{i:024x}", name=f"Category {i}") for i in numbers]
+        else:
+            return 404, {"status": dict(fixtures["status"], error_code=404, error_message="Not Found")}
+        return 200, {"status": fixtures["status"], "data": rows}
+
+    return handle
+
+
+def zerox_handler() -> Handler:
+    fixture = load_fixture("0x")
+
+    def handle(method, path, query, body):
+        return 200, dict(fixture, sellTokenAddress=query.get("sellToken", "").lower(),
+                         buyTokenAddress=query.get("buyToken", "").lower(),
+                         sellAmount=query.get("sellAmount", fixture["sellAmount"]))
+
+    return handle
+
+
+def nodereal_handler(history_days: int = 730) -> Handler:
+    """
+    Consultas com `$first` (backfill paginado) recebem um histórico sintético de
+    `history_days` dias por par, a partir da data do fixture; as demais, o fixture.
+    """
+    fixture = load_fixture("nodereal")["pair_day_data"]
+
+    def day(address, k):
+        return dict(
+            fixture, pairAddress={"id": address.lower(), "name": fixture["pairAddress"]["name"]},
+            date=fixture["date"] + k * 86400, dailyVolumeUSD=str(1000 + k % 97 * 13.5), dailyTxns=str(10 + k % 31),
+            reserve0=str(150000 + k * 12.5), reserve1=str(950 + k % 50), reserveUSD=str(570000 + k * 101.25),
+        )
+
+    def handle(method, path, query, body):
+        variables = (body or {}).get("variables") or {}
+        first = variables.get("first")
+        data = {}
+        for alias, address in variables.items():
+            if not alias.startswith("pair"):
+                continue
+            if first is None:
+                data[alias] = [dict(fixture, pairAddress={"id": address.lower(), "name": fixture["pairAddress"]["name"]})]
+                continue
+            after = variables.get(f"after{alias[4:]}", 0)
+            start = max(0, (after - fixture["date"]) // 86400 + 1)
+            data[alias] = [day(address, k) for k in range(start, min(history_days, start + first))]
+        return 200, {"data": data}
+
+    return handle
+
+
+# Provedor -> (prefixo das URLs reais, fábrica do handler)
+PROVIDERS: Dict[str, Tuple[str, Callable[[], Handler]]] = {
+    "bscscan": ("https://api.bscscan.com", bscscan_handler),
+    "coingecko": ("https://api.coingecko.com", coingecko_handler),
+    "coinmarketcap": ("https://pro-api.coinmarketcap.com", coinmarketcap_handler),
+    "0x": ("https://bsc.api.0x.org", zerox_handler),
+    "nodereal": ("https://open-platform.nodereal.io", nodereal_handler),
+}
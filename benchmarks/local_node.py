@@ -0,0 +1,281 @@
+"""
+Nó JSON-RPC local que imita um nó da BSC para os benchmarks.
+
+Responde `eth_call` para contratos BEP-20 fictícios (incluindo o Multicall3 em
+`aggregate3`), `eth_estimateGas` (custo intrínseco da transação; reverte nos contratos
+que revertem), `eth_gasPrice`, `eth_feeHistory` e `eth_getBlockByNumber` (taxas
+sintéticas e determinísticas por bloco; um a cada 10 blocos vem vazio),
+`eth_getLogs` (eventos `Transfer` determinísticos dos tokens fictícios, recusando
+consultas com mais de `max_logs` resultados), `eth_blockNumber`, `eth_chainId` e `net_version`, aceita requisições
+simples e em lote e conta quantas requisições HTTP e chamadas RPC recebeu.
+Uma latência por requisição HTTP (com jitter opcional) simula o tempo de ida e volta
+até um nó real, e uma fração das requisições pode falhar com HTTP 503.
+"""
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from typing import Dict, Optional
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
+
+from .local_api import BurstHTTPServer
+
+MULTICALL3_ADDRESS = "0xca11bde05977b3631167028862be2a173976ca11"
+SELECTORS = {
+    function_signature_to_4byte_selector("symbol()"): "symbol",
+    function_signature_to_4byte_selector("name()"): "name",
+    function_signature_to_4byte_selector("decimals()"): "decimals",
+    function_signature_to_4byte_selector("totalSupply()"): "totalSupply",
+}
+BALANCE_OF = function_signature_to_4byte_selector("balanceOf(address)")
+AGGREGATE3 = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+
+TRANSFER_TOPIC = "0x" + keccak(text="Transfer(address,address,uint256)").hex()
+
+
+class JsonRpcFailure(Exception):
+    """
+    Erro JSON-RPC com código próprio, devolvido como está ao cliente.
+    """
+
+    def __init__(self, code: int, message: str):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def fake_balance(token: str, holder: str) -> int:
+    """
+    Saldo determinístico de um titular em um token fictício (para conferir as leituras).
+    """
+    return int(holder[-8:], 16) * 10**9 + int(token[-4:], 16)
+
+
+def fake_tokens(count: int, reverting_every: int = 0) -> Dict[str, Optional[dict]]:
+    """
+    Gera `count` tokens fictícios. Com `reverting_every=n`, um a cada n tokens reverte todas as leituras.
+    """
+    tokens = {}
+    for i in range(count):
+        address = to_checksum_address(f"0x{i + 1:040x}")
+        if reverting_every and i % reverting_every == reverting_every - 1:
+            tokens[address] = None
+        else:
+            tokens[address] = {
+                "symbol": f"TK{i}",
+                "name": f"Token {i}",
+                "decimals": 18,
+                "totalSupply": (i + 1) * 10 ** 24,
+            }
+    return tokens
+
+
+class LocalBscNode:
+    """
+    Servidor HTTP local em uma thread de fundo. Use como gerenciador de contexto.
+
+    Args:
+        tokens (dict): Endereço -> campos do token (None = contrato que sempre reverte).
+        latency (float): Atraso, em segundos, aplicado a cada requisição HTTP.
+        block_number (int): Número do bloco devolvido por `eth_blockNumber`.
+        jitter (float): Variação máxima (uniforme, para mais ou para menos) da latência.
+        error_rate (float): Fração das requisições HTTP respondidas com 503.
+        seed (int, opcional): Semente do gerador de jitter e erros.
+        fee_history (bool): Se False, `eth_feeHistory` responde "método inexistente".
+        max_logs (int): Máximo de eventos por `eth_getLogs` (acima disso, erro -32005).
+    """
+
+    def __init__(self, tokens: Optional[Dict[str, Optional[dict]]] = None, latency: float = 0.0,
+                 block_number: int = 45_000_000, jitter: float = 0.0, error_rate: float = 0.0,
+                 seed: Optional[int] = None, fee_history: bool = True, max_logs: int = 10_000):
+        self.fee_history = fee_history
+        self.max_logs = max_logs
+        self.tokens = {address.lower(): info for address, info in (tokens or {}).items()}
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.block_number = block_number
+        self._random = random.Random(seed)
+        self.http_requests = 0
+        self.rpc_calls = 0
+        self._lock = threading.Lock()
+        self._server = BurstHTTPServer(("127.0.0.1", 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def reset_counters(self) -> None:
+        with self._lock:
+            self.http_requests = 0
+            self.rpc_calls = 0
+
+    def __enter__(self) -> "LocalBscNode":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    # Lógica do nó
+
+    def _token_call(self, to: str, data: bytes) -> bytes:
+        info = self.tokens.get(to.lower(), False)
+        if info is False:
+            return b""  # Conta sem código: a chamada "funciona" e devolve vazio
+        if info is not None and data[:4] == BALANCE_OF:
+            return encode(["uint256"], [fake_balance(to, "0x" + data[-20:].hex())])
+        field = SELECTORS.get(data[:4])
+        if info is None or field is None:
+            raise ValueError("execution reverted")
+        value = info[field]
+        return encode(["string" if isinstance(value, str) else "uint256"], [value])
+
+    def _eth_call(self, tx: dict) -> str:
+        to = tx["to"]
+        data = bytes.fromhex(tx.get("data", tx.get("input", "0x"))[2:])
+        if to.lower() == MULTICALL3_ADDRESS and data[:4] == AGGREGATE3:
+            (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+            results = []
+            for target, allow_failure, calldata in calls:
+                try:
+                    results.append((True, self._token_call(target, calldata)))
+                except ValueError:
+                    if not allow_failure:
+                        raise
+                    results.append((False, b""))
+            return "0x" + encode(["(bool,bytes)[]"], [results]).hex()
+        return "0x" + self._token_call(to, data).hex()
+
+    def _estimate_gas(self, tx: dict) -> str:
+        if self.tokens.get(tx.get("to", "").lower(), False) is None:
+            raise ValueError("execution reverted")
+        data = bytes.fromhex(tx.get("data", tx.get("input", "0x"))[2:])
+        return hex(21000 + sum(16 if byte else 4 for byte in data))
+
+    @staticmethod
+    def _tip(number: int, percentile: float) -> int:
+        """
+        Taxa de prioridade sintética (wei) do percentil `percentile` das transações do bloco.
+        """
+        if number % 10 == 0:
+            return 0
+        return (5 + number % 5) * int(100 + percentile) * 2 * 10**6
+
+    def _fee_history(self, count: str, newest: str, percentiles: list) -> dict:
+        last = self.block_number if newest == "latest" else int(newest, 16)
+        oldest = max(0, last - int(count, 16) + 1)
+        numbers = range(oldest, last + 1)
+        return {
+            "oldestBlock": hex(oldest),
+            "baseFeePerGas": ["0x0"] * (len(numbers) + 1),
+            "gasUsedRatio": [0.0 if n % 10 == 0 else 0.5 for n in numbers],
+            "reward": [[hex(self._tip(n, p)) for p in percentiles] for n in numbers],
+        }
+
+    def _block(self, number: str) -> dict:
+        number = self.block_number if number == "latest" else int(number, 16)
+        prices = [] if number % 10 == 0 else [self._tip(number, p) for p in range(0, 100, 10)]
+        return {
+            "number": hex(number),
+            "baseFeePerGas": "0x0",
+            "gasLimit": hex(140_000_000),
+            "gasUsed": hex(21000 * len(prices)),
+            "transactions": [{"gasPrice": hex(price)} for price in prices],
+        }
+
+    def _logs(self, query: dict) -> list:
+        addresses = query.get("address") or list(self.tokens)
+        addresses = [addresses] if isinstance(addresses, str) else addresses
+        start, end = int(query["fromBlock"], 16), int(query["toBlock"], 16)
+        tokens = [address.lower() for address in addresses if self.tokens.get(address.lower())]
+        # Quantidade de eventos por bloco: 0 a 3, determinística por token e bloco
+        total = sum(sum((n + int(token[-2:], 16)) % 4 for n in range(start, end + 1)) for token in tokens)
+        if total > self.max_logs:
+            raise JsonRpcFailure(-32005, f"query returned more than {self.max_logs} results")
+        logs = []
+        for number in range(start, end + 1):
+            for token in tokens:
+                for i in range((number + int(token[-2:], 16)) % 4):
+                    logs.append({
+                        "address": token,
+                        "topics": [TRANSFER_TOPIC, f"0x{number:064x}", f"0x{number * 4 + i:064x}"],
+                        "data": f"0x{(number + i) * 10**15:064x}",
+                        "blockNumber": hex(number),
+                        "transactionHash": f"0x{number:032x}{i:032x}",
+                        "logIndex": hex(len(logs)),
+                        "removed": False,
+                    })
+        return logs
+
+    def _dispatch(self, request: dict) -> dict:
+        reply = {"jsonrpc": "2.0", "id": request.get("id")}
+        method, params = request.get("method"), request.get("params") or []
+        try:
+            if method == "eth_call":
+                reply["result"] = self._eth_call(params[0])
+            elif method == "eth_estimateGas":
+                reply["result"] = self._estimate_gas(params[0])
+            elif method == "eth_feeHistory" and self.fee_history:
+                reply["result"] = self._fee_history(*params)
+            elif method == "eth_getBlockByNumber":
+                reply["result"] = self._block(params[0])
+            elif method == "eth_getLogs":
+                reply["result"] = self._logs(params[0])
+            elif method == "eth_gasPrice":
+                reply["result"] = hex(3 * 10**9)
+            elif method == "eth_blockNumber":
+                reply["result"] = hex(self.block_number)
+            elif method == "eth_chainId":
+                reply["result"] = hex(56)
+            elif method == "net_version":
+                reply["result"] = "56"
+            else:
+                reply["error"] = {"code": -32601, "message": f"the method {method} does not exist"}
+        except JsonRpcFailure as e:
+            reply["error"] = {"code": e.code, "message": e.message}
+        except ValueError as e:
+            reply["error"] = {"code": 3, "message": str(e)}
+        return reply
+
+    def _handler(self):
+        node = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                requests = body if isinstance(body, list) else [body]
+                with node._lock:
+                    node.http_requests += 1
+                    node.rpc_calls += len(requests)
+                    delay = max(0.0, node.latency + node._random.uniform(-node.jitter, node.jitter))
+                    fail = node._random.random() < node.error_rate
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    payload = b'{"error": "erro injetado pelo benchmark"}'
+                    status = 503
+                else:
+                    replies = [node._dispatch(request) for request in requests]
+                    payload = json.dumps(replies if isinstance(body, list) else replies[0]).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,333 @@
+"""
+Suíte de benchmarks offline: todos os pontos de entrada contra servidores locais.
+
+Sobe servidores que substituem BscScan, CoinGecko, CoinMarketCap, 0x, NodeReal GraphQL
+(respostas gravadas em `benchmarks/fixtures/`) e um nó JSON-RPC da BSC, redireciona os
+clientes do pacote para eles e mede cada ponto de entrada: funções de `bscscan`
+(antigo `bsc.py`), `get_market_data`, `CoinMarketCapAPI`, `get_token_price`,
+`get_pair_data`, a inspeção de contratos e a geração de carteiras.
+
+Para cada cenário são informados vazão (chamadas/s), latência média e p50/p95/p99, e
+erros. Os resultados podem ser gravados em JSON (`--output`) e comparados com uma
+execução anterior (`--baseline`), que aponta regressões acima de `--tolerance`:
+
+    python -m benchmarks.suite --iterations 200 --latency 0.005 --jitter 0.002 --output atual.json
+    python -m benchmarks.suite --baseline atual.json --error-rate 0.01
+"""
+import argparse
+import atexit
+import contextlib
+import io
+import json
+import logging
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from web3 import Web3
+
+from .local_api import PROVIDERS, StandInServer, redirect
+from .local_node import LocalBscNode, fake_tokens
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Chaves fictícias: os servidores locais só verificam que foram enviadas
+API_KEYS = ("BSC_API_KEY", "COINMARKETCAP_API_KEY", "ZEROX_API_KEY", "PANCAKESWAP_API_KEY")
+
+ASPPBR = "0x0697AB2B003FD2Cbaea2dF1ef9b404E45bE59d4C"
+USDT = "0x55d398326f99059fF775485246999027B3197955"
+PAIRS = [
+    "0xB9a2b08Be15dC15e531b0d25B3942268DA27B100",
+    "0x3DAc89C0C868eb9F835D97E1FDb702b6fD6Ae38E",
+    "0x60825783086bbEbbF0C83129e88c69914ad17073",
+    "0x2E931d4b735F476E5edba95D0FEba9eb848cECD0",
+    "0x4F287Dd8B2b02aA8885AB9C6DdCE876D1031268B",
+    "0x25aF0AC22fdC2A408Ef07FcB795c516B3a0F3858",
+]
+
+
+class Scenario:
+    """
+    Um ponto de entrada medido: `call` é cronometrada; `before` roda antes de cada chamada, fora do tempo.
+    """
+
+    def __init__(self, name: str, call: Callable[[], object], before: Optional[Callable[[], None]] = None,
+                 items: int = 1, server=None):
+        self.name = name
+        self.call = call
+        self.before = before
+        self.items = items  # Itens processados por chamada (moedas, pares, contratos, ...)
+        self.server = server
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Percentil pelo método do posto mais próximo (`values` já ordenado).
+    """
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, max(0, math.ceil(q * len(values)) - 1))]
+
+
+def run_scenario(scenario: Scenario, iterations: int, warmup: int) -> Dict:
+    for _ in range(warmup):
+        if scenario.before:
+            scenario.before()
+        with contextlib.suppress(Exception):
+            scenario.call()
+    if scenario.server is not None:
+        scenario.server.reset_counters()
+
+    latencies, errors, first_error = [], 0, None
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if scenario.before:
+            scenario.before()
+        t0 = time.perf_counter()
+        try:
+            scenario.call()
+        except Exception as e:
+            errors += 1
+            first_error = first_error or f"{type(e).__name__}: {e}"
+        latencies.append(time.perf_counter() - t0)
+    measured = sum(latencies)
+    latencies.sort()
+
+    row = {
+        "name": scenario.name,
+        "calls": iterations,
+        "errors": errors,
+        "items_per_call": scenario.items,
+        "seconds": time.perf_counter() - started,
+        "calls_per_second": iterations / measured if measured else 0.0,
+        "items_per_second": iterations * scenario.items / measured if measured else 0.0,
+        "mean_ms": measured / iterations * 1000 if iterations else 0.0,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+    if scenario.server is not None:
+        row["http_requests"] = getattr(scenario.server, "requests", None) or getattr(scenario.server, "http_requests", 0)
+    if first_error:
+        row["first_error"] = first_error
+    return row
+
+
+def build_scenarios(servers: Dict[str, StandInServer], node: LocalBscNode, contracts: List[str]) -> List[Scenario]:
+    from bsc_toolkit.api import bscscan, coingecko, pancakeswap, zerox
+    from bsc_toolkit.api.coinmarketcap import CoinMarketCapAPI
+    from bsc_toolkit.gas_oracle import GasOracle
+    from bsc_toolkit.listings import ListingsSync
+    from bsc_toolkit.pair_analytics import analyze
+    from bsc_toolkit.inspector import BalanceScanner, TokenMetadataCache, query_contracts_info
+    from bsc_toolkit.inspector.contract_analysis import load_bep20_abi, query_contract_info
+    from bsc_toolkit.inspector.transfers import TransferIndexer, TransferLogStore
+    from bsc_toolkit.price_cache import get_price_cache
+    from bsc_toolkit.rpc import JsonRpcClient, NodePool
+    from bsc_toolkit.wallet import create_wallet_keys, generate_wallets_bulk
+
+    # Clientes criados pelas próprias fábricas dos módulos (mesmos base_url e opções) e redirecionados
+    cmc = CoinMarketCapAPI(requests_per_minute=10 ** 9)
+    clients = {
+        "bscscan": bscscan.bscscan_client(),
+        "coingecko": coingecko.coingecko_client(),
+        "coinmarketcap": cmc.client,
+        "0x": zerox.zerox_client(),
+        "nodereal": pancakeswap.nodereal_client(),
+    }
+    for provider, (prefix, _) in PROVIDERS.items():
+        redirect(clients[provider], prefix, servers[provider].url)
+    # O limite do plano gratuito da CoinGecko dominaria a medição
+    coingecko.get_scheduler().requests_per_minute = 10 ** 9
+
+    cache = get_price_cache()
+    api_key = bscscan.get_api_key()
+    market_ids = [f"coin-{i}" for i in range(250)]
+    web3 = Web3(Web3.HTTPProvider(node.url))
+    abi = load_bep20_abi()
+    rpc = JsonRpcClient(node.url)
+    pool = NodePool([node.url])
+    gas_oracle = GasOracle(rpc)
+    token_cache = TokenMetadataCache(":memory:")
+    balance_scanner = BalanceScanner(pool)
+    holders = [f"0x{i:040x}" for i in range(1, 501)]
+    transfer_store = TransferLogStore(tempfile.mkdtemp(prefix="transfer_logs_"))
+    transfer_indexer = TransferIndexer(pool, transfer_store)
+    atexit.register(shutil.rmtree, transfer_store.path, True)
+
+    def reset_transfer_store():
+        shutil.rmtree(transfer_store.path)
+        transfer_store.path.mkdir()
+        transfer_store.refresh()
+    random = np.random.default_rng(0)
+    history = [random.uniform(1e3, 1e6, (1000, 365)) for _ in range(3)]
+    history_dates = np.arange(365, dtype=np.int64) * 86400 + 1659398400
+    candidates = [{"to": USDT, "data": f"0xa9059cbb{i:064x}", "value": 0} for i in range(500)]
+    sink = lambda records: None  # noqa: E731
+    listings_sync = ListingsSync(cmc, ["USD", "EUR", "BRL"])
+
+    return [
+        Scenario("bscscan.get_gas_price", lambda: bscscan.get_gas_price(api_key), server=servers["bscscan"]),
+        Scenario("bscscan.get_gas_oracle", lambda: bscscan.get_gas_oracle(api_key), server=servers["bscscan"]),
+        Scenario("bscscan.get_eth_block_number", lambda: bscscan.get_eth_block_number(api_key),
+                 server=servers["bscscan"]),
+        Scenario("gas_oracle.oracle (memória)", gas_oracle.oracle, server=node),
+        Scenario("bscscan.get_bnb_supply", lambda: bscscan.get_bnb_supply(api_key), server=servers["bscscan"]),
+        Scenario("bscscan.get_bnb_price", lambda: bscscan.get_bnb_price(api_key),
+                 before=cache.invalidate, server=servers["bscscan"]),
+        Scenario("bscscan.get_bnb_price (cache)", lambda: bscscan.get_bnb_price(api_key),
+                 server=servers["bscscan"]),
+        Scenario("bscscan.estimate_gas",
+                 lambda: bscscan.estimate_gas(api_key, "0x4e71d92d", USDT, "0xff22", "0x51da038cc", "0x5f5e0ff"),
+                 server=servers["bscscan"]),
+        Scenario("bscscan.estimate_gas_batch (500 tx)", lambda: bscscan.estimate_gas_batch(candidates, pool=pool),
+                 items=len(candidates), server=node),
+        Scenario("bscscan.get_gas_price_usd", lambda: bscscan.get_gas_price_usd("binancecoin"),
+                 before=cache.invalidate, server=servers["coingecko"]),
+        Scenario("coingecko.get_market_data (250 ids)", lambda: coingecko.get_market_data(market_ids),
+                 before=cache.invalidate, items=len(market_ids), server=servers["coingecko"]),
+        Scenario("coinmarketcap.get_latest_market_pairs",
+                 lambda: cmc.get_latest_market_pairs(limit=100, convert="USD,EUR"),
+                 items=100, server=servers["coinmarketcap"]),
+        Scenario("coinmarketcap.get_crypto_map", lambda: cmc.get_crypto_map(limit=100),
+                 items=100, server=servers["coinmarketcap"]),
+        Scenario("listings.ListingsSync.fetch (10000 ativos x 3 moedas)", listings_sync.fetch,
+                 items=10_000, server=servers["coinmarketcap"]),
+        Scenario("zerox.get_token_price", lambda: zerox.get_token_price(ASPPBR, USDT, 10_000_000),
+                 before=cache.invalidate, server=servers["0x"]),
+        Scenario("pancakeswap.get_pair_data", lambda: pancakeswap.get_pair_data(PAIRS[0]),
+                 server=servers["nodereal"]),
+        Scenario("pancakeswap.get_pairs_data (6 pares)", lambda: pancakeswap.get_pairs_data(PAIRS),
+                 items=len(PAIRS), server=servers["nodereal"]),
+        Scenario("inspector.query_contract_info (web3)",
+                 lambda: query_contract_info(contracts[0], web3, None, abi), server=node),
+        Scenario("inspector.query_contracts_info (50, multicall)",
+                 lambda: query_contracts_info(contracts[:50], rpc), items=50, server=node),
+        Scenario("inspector.query_contracts_info (200, cache)",
+                 lambda: query_contracts_info(contracts, rpc, cache=token_cache), items=len(contracts), server=node),
+        Scenario("inspector.BalanceScanner (6 tokens x 500 titulares)",
+                 lambda: sum(1 for _ in balance_scanner.scan_product(contracts[:6], holders)),
+                 items=6 * len(holders), server=node),
+        Scenario("inspector.TransferIndexer (3 tokens x 2000 blocos)",
+                 lambda: transfer_indexer.index(contracts[:3], node.block_number - 2000, node.block_number - 1),
+                 before=reset_transfer_store, items=2000, server=node),
+        Scenario("pair_analytics.analyze (1000 pares x 365 dias)", lambda: analyze(history_dates, *history),
+                 items=1000 * 365),
+        Scenario("wallet.create_wallet_keys", lambda: create_wallet_keys(128)),
+        Scenario("wallet.generate_wallets_bulk (64)", lambda: generate_wallets_bulk(64, 128, sink, workers=1),
+                 items=64),
+    ]
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(rows: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """
+    Compara p50 e vazão com uma execução anterior e devolve as regressões acima da tolerância.
+    """
+    previous = {row["name"]: row for row in baseline.get("results", [])}
+    regressions = []
+    print(f"\n{'cenário':<48}{'p50 antes':>11}{'p50 agora':>11}{'Δ p50':>9}{'Δ vazão':>10}")
+    for row in rows:
+        old = previous.get(row["name"])
+        if not old or not old["p50_ms"] or not old["calls_per_second"]:
+            continue
+        latency_change = row["p50_ms"] / old["p50_ms"] - 1
+        throughput_change = row["calls_per_second"] / old["calls_per_second"] - 1
+        flag = ""
+        if latency_change > tolerance or throughput_change < -tolerance:
+            flag = "  <- regressão"
+            regressions.append(row["name"])
+        print(f"{row['name']:<48}{old['p50_ms']:>11.2f}{row['p50_ms']:>11.2f}{latency_change:>+9.0%}"
+              f"{throughput_change:>+10.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=100, help="Chamadas medidas por cenário")
+    parser.add_argument("--warmup", type=int, default=3, help="Chamadas de aquecimento por cenário")
+    parser.add_argument("--latency", type=float, default=0.005, help="Latência média dos servidores (s)")
+    parser.add_argument("--jitter", type=float, default=0.002, help="Variação máxima da latência (s)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fração de respostas HTTP 503")
+    parser.add_argument("--seed", type=int, default=42, help="Semente do jitter e dos erros")
+    parser.add_argument("--only", help="Executa apenas cenários cujo nome contém este texto")
+    parser.add_argument("--output", help="Grava os resultados em JSON neste arquivo")
+    parser.add_argument("--baseline", help="Resultados JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Piora relativa aceita na comparação")
+    args = parser.parse_args()
+
+    for name in API_KEYS:
+        os.environ[name] = "benchmark"
+    # Falhas injetadas e novas tentativas são esperadas; os erros aparecem na tabela
+    logging.getLogger("bsc_toolkit").setLevel(logging.CRITICAL)
+
+    options = dict(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate, seed=args.seed)
+    tokens = fake_tokens(200)
+    with contextlib.ExitStack() as stack:
+        servers = {
+            provider: stack.enter_context(StandInServer(factory(), **options))
+            for provider, (_, factory) in PROVIDERS.items()
+        }
+        node = stack.enter_context(LocalBscNode(tokens, **options))
+        scenarios = [
+            scenario for scenario in build_scenarios(servers, node, list(tokens))
+            if not args.only or args.only in scenario.name
+        ]
+
+        rows = []
+        for scenario in scenarios:
+            # Os pontos de entrada imprimem mensagens de progresso; não interessam aqui
+            with contextlib.redirect_stdout(io.StringIO()):
+                rows.append(run_scenario(scenario, args.iterations, args.warmup))
+
+    print(f"{'cenário':<48}{'chamadas/s':>11}{'itens/s':>10}{'p50 (ms)':>10}{'p95 (ms)':>10}"
+          f"{'p99 (ms)':>10}{'HTTP':>7}{'erros':>7}")
+    for row in rows:
+        print(f"{row['name']:<48}{row['calls_per_second']:>11.1f}{row['items_per_second']:>10.1f}"
+              f"{row['p50_ms']:>10.2f}{row['p95_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+              f"{row.get('http_requests', '-'):>7}{row['errors']:>7}")
+        if "first_error" in row:
+            print(f"    primeiro erro: {row['first_error'][:120]}")
+
+    results = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "options": vars(args),
+        },
+        "results": rows,
+    }
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+        print(f"\nResultados gravados em {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(rows, json.load(file), args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regressão(ões) acima de {args.tolerance:.0%}.")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,9 @@
+"""
+Biblioteca compartilhada pelos scripts da Binance Smart Chain (API, Inspetor e Wallet).
+
+As rotinas reutilizáveis (transporte JSON-RPC, Multicall3, inspeção de contratos, clientes
+das APIs, ...) ficam aqui e podem ser importadas por outros serviços: importar um módulo
+não faz chamadas de rede nem lê o `.env`. Os scripts das pastas do repositório continuam
+sendo os pontos de entrada de linha de comando e apenas chamam o `main()` do módulo
+correspondente (ex.: `API/bsc.py` -> `bsc_toolkit.api.bscscan.main`).
+"""
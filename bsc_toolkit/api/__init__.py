@@ -0,0 +1,15 @@
+"""
+Clientes das APIs externas: BscScan (`bscscan`), CoinGecko (`coingecko`),
+CoinMarketCap (`coinmarketcap`), 0x (`zerox`) e PancakeSwap via NodeReal (`pancakeswap`).
+
+Importar um módulo não faz chamadas de rede nem lê o `.env`: clientes HTTP, chaves de
+API e agendadores são criados no primeiro uso. Cada módulo tem um `main()` com o
+comportamento do script correspondente em `API/` (`python -m bsc_toolkit.api.bscscan`).
+Os módulos são importados individualmente, para que quem usa só um não pague pelos outros.
+
+As consultas públicas têm variantes asyncio com o sufixo `_async` (`get_market_data_async`,
+`CoinMarketCapAPI.get_crypto_map_async`, ...), com o mesmo resultado e o mesmo cache das
+síncronas. Elas usam uma sessão aiohttp por provedor (`http_client.get_async_client`), com
+um limite de requisições simultâneas por provedor; feche as sessões com
+`await http_client.close_async_clients()` antes de encerrar o event loop.
+"""
@@ -0,0 +1,430 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from ..env import get_env
+from ..http_client import ApiError, ApiRateLimitError, ApiResponseError, get_async_client, get_client
+from ..price_cache import get_price_cache
+from ..scheduler import CreditScheduler
+
+logger = logging.getLogger(__name__)
+
+BSCSCAN_API_URL = "https://api.bscscan.com/api"
+
+# Chamadas eth_estimateGas por requisição JSON-RPC em lote e lotes enviados em paralelo
+GAS_BATCH_SIZE = 100
+GAS_BATCH_WORKERS = 4
+
+# Campos aceitos em uma transação candidata (objeto de chamada do eth_estimateGas)
+CALL_FIELDS = ("from", "to", "data", "value", "gas", "gasPrice")
+
+# Clientes HTTP compartilhados (conexões reutilizadas entre chamadas), criados no primeiro uso
+def bscscan_client():
+    return get_client("bscscan")
+
+def coingecko_client():
+    return get_client("coingecko", base_url="https://api.coingecko.com/api/v3")
+
+# Função para obter a chave da API de uma variável de ambiente
+def get_api_key():
+    api_key = get_env('BSC_API_KEY')  # Alterado para corresponder ao nome da variável no .env
+    if not api_key:
+        raise Exception("BSC_API_KEY não encontrada. Defina a variável de ambiente BSC_API_KEY no arquivo .env.")
+    return api_key
+
+# Função para verificar a resposta da API
+def check_response(data):
+    if data.get('status') == '0' and str(data.get('message', '')).startswith('NOTOK'):
+        # Erros da BscScan chegam com HTTP 200 e a descrição no campo "result"
+        if 'rate limit' in str(data.get('result', '')).lower():
+            raise ApiRateLimitError(f"bscscan: {data['result']}", "bscscan", BSCSCAN_API_URL)
+        raise ApiResponseError(f"bscscan: {data.get('result')}", "bscscan", BSCSCAN_API_URL)
+    if 'error' in data:
+        raise ApiResponseError(f"bscscan: {data['error']}", "bscscan", BSCSCAN_API_URL)
+    if 'result' not in data:
+        raise ApiResponseError("Resultado não encontrado na resposta da API.", "bscscan", BSCSCAN_API_URL)
+    return data
+
+# Função para consultar a BscScan com o cliente compartilhado
+def bscscan_get(api_key, **params):
+    data = bscscan_client().get_json(BSCSCAN_API_URL, params={**params, "apikey": api_key})
+    return check_response(data)
+
+def get_gas_price(api_key):
+    data = bscscan_get(api_key, module="proxy", action="eth_gasPrice")
+    return int(data['result'], 16)
+
+def estimate_gas(api_key, data, to, value, gas_price, gas):
+    data = bscscan_get(
+        api_key, module="proxy", action="eth_estimateGas",
+        data=data, to=to, value=value, gasPrice=gas_price, gas=gas,
+    )
+    return int(data['result'], 16)
+
+
+_scheduler: Optional[CreditScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> CreditScheduler:
+    """
+    Agendador com o limite do plano gratuito da BscScan (5 chamadas/s); as estimativas do
+    fallback de `estimate_gas_batch` passam por ele e são refeitas diante de "rate limit".
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CreditScheduler(requests_per_minute=300, max_concurrency=4)
+        return _scheduler
+
+
+# Pool de nós RPC próprios (BINANCE_SMART_CHAIN_MAINNET_NODE_URL_*), criado no primeiro uso
+_node_pool = None
+_node_pool_lock = threading.Lock()
+
+def node_pool():
+    global _node_pool
+    with _node_pool_lock:
+        if _node_pool is None:
+            from ..rpc import NodePool
+
+            _node_pool = NodePool()
+        return _node_pool
+
+def normalize_call(tx: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Normaliza um objeto de chamada do eth_estimateGas: inteiros viram hexadecimais,
+    endereços e dados ficam em minúsculas e campos vazios são descartados, de modo que
+    transações equivalentes produzam o mesmo objeto (e sejam estimadas uma única vez).
+
+    Raises:
+        ValueError: Se houver campos desconhecidos ou faltar o destinatário ("to").
+    """
+    unknown = set(tx) - set(CALL_FIELDS)
+    if unknown:
+        raise ValueError(f"Campos desconhecidos na transação: {sorted(unknown)}")
+    call = {}
+    for field in CALL_FIELDS:
+        value = tx.get(field)
+        if value is None or value == "":
+            continue
+        if isinstance(value, int):
+            value = hex(value)
+        elif field in ("value", "gas", "gasPrice"):
+            value = hex(int(value, 16))
+        call[field] = value.lower()
+    if "to" not in call:
+        raise ValueError("Transação sem destinatário ('to').")
+    return call
+
+def estimate_gas_batch(
+    transactions: Sequence[Dict[str, Any]],
+    api_key: Optional[str] = None,
+    pool=None,
+    gas_price: Optional[int] = None,
+    price_id: str = "binancecoin",
+    batch_size: int = GAS_BATCH_SIZE,
+    workers: int = GAS_BATCH_WORKERS,
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Estima o gás de muitas transações candidatas de uma vez.
+
+    As transações são normalizadas e deduplicadas e as estimativas vão para os nós
+    próprios em requisições JSON-RPC em lote (`eth_estimateGas`, `batch_size` por
+    requisição, `workers` lotes em paralelo, com o failover do `NodePool`). Se nenhum
+    nó estiver configurado ou respondendo, cada estimativa pendente cai para o proxy
+    da BscScan, em paralelo dentro do limite de `get_scheduler()`. O preço do gás (se não informado) e a cotação do BNB em USD são
+    buscados uma única vez para o lote inteiro; o `gasPrice` de uma transação, quando
+    presente, tem precedência no cálculo do custo.
+
+    Args:
+        transactions (Sequence[dict]): Objetos de chamada (from, to, data, value, gas, gasPrice).
+        api_key (str, opcional): Chave da BscScan para o fallback (por padrão, BSC_API_KEY).
+        pool (NodePool, opcional): Pool de nós; por padrão, o de `node_pool()`.
+        gas_price (int, opcional): Preço do gás em wei; por padrão, o `eth_gasPrice` da rede.
+        price_id (str): Id da CoinGecko usado na conversão para USD.
+        batch_size (int): Chamadas por requisição em lote.
+        workers (int): Requisições em lote simultâneas.
+
+    Returns:
+        list: Na ordem das transações, um dicionário {"gas", "gas_price", "cost_wei",
+            "cost_bnb", "cost_usd", "source"} ou a exceção daquele item (revert,
+            transação inválida, lote recusado pelo nó, falha da BscScan, chave ausente
+            ou preço do gás indisponível). `cost_usd` é None se a cotação falhar.
+    """
+    # Normalização e deduplicação: chave canônica -> posição única
+    unique: Dict[tuple, int] = {}
+    calls: List[Dict[str, str]] = []
+    slots: List[Union[int, Exception]] = []
+    for tx in transactions:
+        try:
+            call = normalize_call(tx)
+        except (ValueError, TypeError) as e:
+            slots.append(e)
+            continue
+        key = tuple(sorted(call.items()))
+        if key not in unique:
+            unique[key] = len(calls)
+            calls.append(call)
+        slots.append(unique[key])
+
+    estimates: List[Any] = [None] * len(calls)
+    sources: List[str] = ["node"] * len(calls)
+    network_gas_price = gas_price
+
+    if calls:
+        try:
+            pool = pool or node_pool()
+        except ValueError as e:
+            logger.info(f"Sem nós RPC próprios ({e}); estimando pela BscScan.")
+            pool = None
+
+    pending = list(range(len(calls)))
+    if pool is not None and calls:
+        from ..rpc import JsonRpcError, NoHealthyNodeError
+
+        chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+
+        def send(chunk):
+            return pool.batch([("eth_estimateGas", [calls[index]]) for index in chunk])
+
+        pending = []
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(chunks)))) as executor:
+            futures = [executor.submit(send, chunk) for chunk in chunks]
+            if network_gas_price is None:
+                try:
+                    network_gas_price = int(pool.call("eth_gasPrice"), 16)
+                except Exception as e:
+                    logger.warning(f"eth_gasPrice falhou nos nós próprios ({e}); usando a BscScan.")
+            for chunk, future in zip(chunks, futures):
+                try:
+                    results = future.result()
+                except NoHealthyNodeError as e:
+                    logger.warning(f"Lote de {len(chunk)} estimativas sem nó disponível ({e}); usando a BscScan.")
+                    pending.extend(chunk)
+                    continue
+                except JsonRpcError as e:
+                    # O nó recusou a requisição inteira (ex.: tamanho do lote): cada item recebe o erro
+                    logger.warning(f"Lote de {len(chunk)} estimativas recusado ({e}).")
+                    results = [e] * len(chunk)
+                for index, result in zip(chunk, results):
+                    # Erros por item (ex.: execution reverted) são a resposta: não há fallback
+                    estimates[index] = result if isinstance(result, Exception) else int(result, 16)
+
+    if pending:
+        try:
+            api_key = api_key or get_api_key()
+        except Exception as e:
+            for index in pending:
+                sources[index] = "bscscan"
+                estimates[index] = e
+            pending = []
+    if pending:
+        # Em paralelo, dentro do limite da BscScan ("rate limit" chega com HTTP 200 e é refeito)
+        scheduler = get_scheduler()
+        futures = [
+            scheduler.submit(lambda call=calls[index]: estimate_gas(
+                api_key, call.get("data"), call["to"], call.get("value"), call.get("gasPrice"), call.get("gas"),
+            ))
+            for index in pending
+        ]
+        for index, future in zip(pending, futures):
+            sources[index] = "bscscan"
+            try:
+                estimates[index] = future.result()
+            except ApiError as e:
+                estimates[index] = e
+
+    # O preço da rede só é necessário para estimativas sem gasPrice próprio
+    if network_gas_price is None and any(
+        not isinstance(estimates[index], Exception) and "gasPrice" not in call for index, call in enumerate(calls)
+    ):
+        try:
+            network_gas_price = get_gas_price(api_key or get_api_key())
+        except Exception as e:
+            logger.warning(f"Preço do gás indisponível ({e}).")
+            for index, call in enumerate(calls):
+                if "gasPrice" not in call and not isinstance(estimates[index], Exception):
+                    estimates[index] = e
+
+    # Uma única cotação para o lote inteiro
+    price_usd = None
+    if calls:
+        try:
+            price_usd = get_gas_price_usd(price_id)
+        except ApiError as e:
+            logger.warning(f"Cotação de {price_id} indisponível ({e}); custos em USD omitidos.")
+
+    results: List[Union[Dict[str, Any], Exception]] = []
+    for index, call in enumerate(calls):
+        gas = estimates[index]
+        if isinstance(gas, Exception):
+            results.append(gas)
+            continue
+        unit_price = int(call["gasPrice"], 16) if "gasPrice" in call else network_gas_price
+        cost_wei = gas * unit_price
+        cost_bnb = cost_wei / 10**18
+        results.append({
+            "gas": gas,
+            "gas_price": unit_price,
+            "cost_wei": cost_wei,
+            "cost_bnb": cost_bnb,
+            "cost_usd": cost_bnb * price_usd if price_usd is not None else None,
+            "source": sources[index],
+        })
+    # Duplicatas recebem cópias, para que alterar um resultado não altere os outros
+    return [
+        slot if isinstance(slot, Exception) else
+        results[slot] if isinstance(results[slot], Exception) else dict(results[slot])
+        for slot in slots
+    ]
+
+
+def usd_prices(data, crypto_ids):
+    return {crypto_id: data[crypto_id]['usd'] for crypto_id in crypto_ids if 'usd' in data.get(crypto_id, {})}
+
+
+def get_prices_usd(crypto_ids):
+    # Uma única requisição para todos os ids que não estão no cache
+    def load(ids):
+        data = coingecko_client().get_json("/simple/price", params={"ids": ",".join(ids), "vs_currencies": "usd"})
+        return usd_prices(data, ids)
+
+    return get_price_cache().get_many("coingecko", crypto_ids, "usd", load)
+
+
+def get_gas_price_usd(crypto_id):
+    prices = get_prices_usd([crypto_id])
+    
+    # Verificar se o preço em USD está presente na resposta
+    if crypto_id not in prices:
+        raise ApiResponseError(f"Preço do {crypto_id} em USD não encontrado na resposta da API.", "coingecko")
+    
+    return prices[crypto_id]
+
+
+def get_eth_block_number(api_key):
+    data = bscscan_get(api_key, module="proxy", action="eth_blockNumber")
+    return int(data['result'], 16)
+
+def get_gas_oracle(api_key):
+    data = bscscan_get(api_key, module="gastracker", action="gasoracle")
+    return data['result']
+
+def get_bnb_supply(api_key):
+    data = bscscan_get(api_key, module="stats", action="bnbsupply")
+    return data['result']
+
+def get_bnb_price(api_key):
+    def load():
+        return bscscan_get(api_key, module="stats", action="bnbprice")['result']
+
+    return get_price_cache().get("bscscan", "bnb", "btc,usd", load)
+
+# Variantes asyncio (aiohttp) das consultas acima: mesmas requisições, mesmo cache e mesmos
+# resultados, com uma sessão por provedor e um limite de requisições simultâneas por
+# provedor, de modo que centenas de chamadas possam ser disparadas com asyncio.gather
+def bscscan_async_client():
+    return get_async_client("bscscan")
+
+def coingecko_async_client():
+    return get_async_client("coingecko", base_url="https://api.coingecko.com/api/v3")
+
+async def bscscan_get_async(api_key, **params):
+    data = await bscscan_async_client().get_json(BSCSCAN_API_URL, params={**params, "apikey": api_key})
+    return check_response(data)
+
+async def get_gas_price_async(api_key):
+    data = await bscscan_get_async(api_key, module="proxy", action="eth_gasPrice")
+    return int(data['result'], 16)
+
+async def estimate_gas_async(api_key, data, to, value, gas_price, gas):
+    data = await bscscan_get_async(
+        api_key, module="proxy", action="eth_estimateGas",
+        data=data, to=to, value=value, gasPrice=gas_price, gas=gas,
+    )
+    return int(data['result'], 16)
+
+async def get_prices_usd_async(crypto_ids):
+    async def load(ids):
+        data = await coingecko_async_client().get_json(
+            "/simple/price", params={"ids": ",".join(ids), "vs_currencies": "usd"}
+        )
+        return usd_prices(data, ids)
+
+    return await get_price_cache().get_many_async("coingecko", crypto_ids, "usd", load)
+
+async def get_gas_price_usd_async(crypto_id):
+    prices = await get_prices_usd_async([crypto_id])
+    if crypto_id not in prices:
+        raise ApiResponseError(f"Preço do {crypto_id} em USD não encontrado na resposta da API.", "coingecko")
+    return prices[crypto_id]
+
+async def get_eth_block_number_async(api_key):
+    data = await bscscan_get_async(api_key, module="proxy", action="eth_blockNumber")
+    return int(data['result'], 16)
+
+async def get_gas_oracle_async(api_key):
+    data = await bscscan_get_async(api_key, module="gastracker", action="gasoracle")
+    return data['result']
+
+async def get_bnb_supply_async(api_key):
+    data = await bscscan_get_async(api_key, module="stats", action="bnbsupply")
+    return data['result']
+
+async def get_bnb_price_async(api_key):
+    async def load():
+        return (await bscscan_get_async(api_key, module="stats", action="bnbprice"))['result']
+
+    return await get_price_cache().get_async("bscscan", "bnb", "btc,usd", load)
+
+# Função para formatar números com zeros à esquerda
+def format_with_zeros(number, decimals=10):
+    return f"{number:.{decimals}f}"
+
+# Ponto de entrada de linha de comando: o relatório que o script API/bsc.py sempre imprimiu
+def main():
+    # Carregar a chave da API de uma variável de ambiente
+    bsc_api_key = get_api_key()
+
+    # Obter o preço atual do BNB em BTC e USD
+    bnb_price_info = get_bnb_price(bsc_api_key)
+    print("Preço Atual do BNB (em BTC):", format_with_zeros(float(bnb_price_info['ethbtc'])))
+    print("Preço Atual do BNB (em USD):", format_with_zeros(float(bnb_price_info['ethusd'])))
+
+    # Obter o fornecimento total de BNB
+    bnb_supply_info = get_bnb_supply(bsc_api_key)
+    print("Fornecimento Total de BNB:", bnb_supply_info)
+
+    # Obter o último bloco processado pelo Oráculo de Gás
+    gas_oracle_info = get_gas_oracle(bsc_api_key)
+    print("Último Bloco Processado pelo Oráculo de Gás:", gas_oracle_info['LastBlock'])
+
+    # Obter o número do bloco Ethereum
+    eth_block_number = get_eth_block_number(bsc_api_key)
+    print("Número do Bloco:", eth_block_number)
+
+    # Obter o preço do gás em wei e convertê-lo para USD e BNB
+    gas_price_wei = get_gas_price(bsc_api_key)
+    get_prices_usd(["ethereum", "binancecoin"])  # Busca os dois preços em uma única requisição
+    gas_price_usd = gas_price_wei * (get_gas_price_usd("ethereum") / 10**18)
+    gas_price_bnb = gas_price_wei * (get_gas_price_usd("binancecoin") / 10**18)
+
+    print("Preço do Gás (em Wei):", gas_price_wei)
+    print("Preço do Gás (em USD):", format_with_zeros(gas_price_usd))
+    print("Preço do Gás (em BNB):", format_with_zeros(gas_price_bnb))
+
+    # Exemplo de dados para estimativa de gás
+    data = "0x4e71d92d"
+    to = "0xEeee7341f206302f2216e39D715B96D8C6901A1C"
+    value = "0xff22"
+    gas_price = "0x51da038cc"
+    gas = "0x5f5e0ff"
+
+    # Obter o gas estimado e convertê-lo para USD e BNB
+    estimated_gas_wei = estimate_gas(bsc_api_key, data, to, value, gas_price, gas)
+
+    print("Gas Estimado (em Wei):", estimated_gas_wei)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, wait
+from functools import partial
+from typing import Iterator, List, Dict, Optional
+
+from ..http_client import ApiError, ApiResponseError, get_async_client, get_client
+from ..price_cache import get_price_cache
+from ..scheduler import CreditScheduler
+
+logger = logging.getLogger(__name__)
+
+# Máximo de moedas por página em /coins/markets
+PAGE_SIZE = 100
+
+# Cliente HTTP compartilhado da CoinGecko (conexões reutilizadas entre chamadas), criado no primeiro uso
+def coingecko_client():
+    return get_client("coingecko", base_url="https://api.coingecko.com/api/v3")
+
+_scheduler: Optional[CreditScheduler] = None
+_scheduler_lock = threading.Lock()
+
+def get_scheduler() -> CreditScheduler:
+    """
+    Agendador com o limite do plano gratuito da CoinGecko; as páginas são buscadas em paralelo dentro dele.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = CreditScheduler(requests_per_minute=30, max_concurrency=4)
+        return _scheduler
+
+def coingecko_async_client():
+    return get_async_client("coingecko", base_url="https://api.coingecko.com/api/v3")
+
+def market_page_params(ids: List[str]) -> Dict[str, str]:
+    return {
+        "vs_currency": "usd",
+        "ids": ",".join(ids),
+        "order": "market_cap_desc",
+        "per_page": str(len(ids)),
+        "page": "1",
+        "sparkline": "false",
+        "price_change_percentage": "1h,24h,7d"
+    }
+
+def check_market_page(data) -> List[Dict]:
+    if not isinstance(data, list):
+        raise ApiResponseError(f"Resposta inesperada da CoinGecko: {data!r}", "coingecko")
+    return data
+
+def fetch_market_page(ids: List[str]) -> List[Dict]:
+    """
+    Busca uma página de /coins/markets com até `PAGE_SIZE` ids.
+
+    Raises:
+        ApiError: Se a solicitação falhar ou a resposta não for válida.
+    """
+    return check_market_page(coingecko_client().get_json("/coins/markets", params=market_page_params(ids)))
+
+async def fetch_market_page_async(ids: List[str]) -> List[Dict]:
+    """
+    Variante asyncio de `fetch_market_page`.
+    """
+    return check_market_page(await coingecko_async_client().get_json("/coins/markets", params=market_page_params(ids)))
+
+def iter_market_data(ids: List[str], page_size: int = PAGE_SIZE) -> Iterator[Dict]:
+    """
+    Gera os dados de mercado página a página, à medida que cada página chega.
+
+    A lista de ids é dividida em páginas de até `page_size` moedas, buscadas em paralelo
+    dentro do limite de requisições da CoinGecko. No máximo duas páginas por requisição
+    simultânea ficam pendentes, então a memória não cresce com o tamanho da lista.
+
+    Args:
+        ids (list): Ids das criptomoedas (qualquer quantidade).
+        page_size (int): Moedas por requisição (máximo 100).
+
+    Yields:
+        dict: Dados de mercado de cada moeda, na ordem em que as páginas terminam.
+
+    Raises:
+        ApiError: Se alguma página falhar.
+    """
+    # Os ids da CoinGecko são minúsculos; "Shentu" e "shentu" são a mesma moeda
+    unique = list(dict.fromkeys(i.lower() for i in ids))
+    page_size = min(page_size, PAGE_SIZE)
+    pages = [unique[i:i + page_size] for i in range(0, len(unique), page_size)]
+    scheduler = get_scheduler()
+    window = 2 * scheduler.max_concurrency
+
+    pending = set()
+    try:
+        for page in pages:
+            pending.add(scheduler.submit(partial(fetch_market_page, page)))
+            if len(pending) >= window:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+def exceeds_cache(ids: List[str]) -> bool:
+    # Mais moedas do que o cache comporta se descartariam umas às outras dentro da própria
+    # consulta (LRU), e a próxima chamada buscaria tudo de novo: essas listas não usam o cache
+    return len(set(ids)) > get_price_cache().max_entries
+
+def ordered(ids: List[str], market_data: Dict[str, Dict]) -> List[Dict]:
+    return [market_data[i] for i in dict.fromkeys(ids) if i in market_data]
+
+def get_market_data(ids: List[str]) -> List[Dict]:
+    """
+    Obtém dados de mercado das criptomoedas especificadas da API da CoinGecko.
+
+    Listas com mais de 100 ids são divididas em páginas buscadas em paralelo. Os dados de
+    cada moeda ficam no cache de preços compartilhado; apenas as moedas ausentes (ou
+    expiradas) são buscadas, e a lista segue a ordem de `ids`. Listas maiores que o
+    cache (`max_entries`) são sempre buscadas inteiras, sem passar por ele.
+
+    Args:
+        ids (list): Lista de ids das criptomoedas que se deseja obter os dados.
+
+    Returns:
+        list: Lista contendo os dados de mercado das criptomoedas especificadas.
+
+    Raises:
+        ApiError: Se a solicitação falhar ou a resposta não for válida.
+    """
+    def load(missing: List[str]) -> Dict[str, Dict]:
+        return {coin["id"]: coin for coin in iter_market_data(missing)}
+
+    ids = [i.lower() for i in ids]
+    if exceeds_cache(ids):
+        return ordered(ids, load(list(dict.fromkeys(ids))))
+    market_data = get_price_cache().get_many("coingecko.markets", ids, "usd", load)
+    return list(market_data.values())
+
+async def get_market_data_async(ids: List[str], page_size: int = PAGE_SIZE) -> List[Dict]:
+    """
+    Variante asyncio de `get_market_data`, com o mesmo cache e o mesmo resultado.
+
+    As páginas são buscadas ao mesmo tempo, cada uma admitida pelo mesmo agendador das
+    consultas síncronas (limite de requisições por minuto da CoinGecko).
+
+    Raises:
+        ApiError: Se alguma página falhar.
+    """
+    async def load(missing: List[str]) -> Dict[str, Dict]:
+        scheduler = get_scheduler()
+        size = min(page_size, PAGE_SIZE)
+        pages = await asyncio.gather(*(
+            scheduler.execute_async(partial(fetch_market_page_async, missing[i:i + size]))
+            for i in range(0, len(missing), size)
+        ))
+        return {coin["id"]: coin for page in pages for coin in page}
+
+    ids = [i.lower() for i in ids]
+    if exceeds_cache(ids):
+        return ordered(ids, await load(list(dict.fromkeys(ids))))
+    market_data = await get_price_cache().get_many_async("coingecko.markets", ids, "usd", load)
+    return list(market_data.values())
+
+def format_market_data(data: Dict) -> str:
+    """
+    Formata os dados de mercado em uma string legível.
+
+    Args:
+        data (dict): Dados de mercado obtidos da API da CoinGecko.
+
+    Returns:
+        str: Dados de mercado formatados como uma string legível.
+    """
+    # Verificação de campos presentes nos dados antes de formatar
+    ath_date = data.get('ath_date', 'N/A')
+    atl_date = data.get('atl_date', 'N/A')
+
+    formatted_data = f"""
+ID: {data['id']}
+Nome: {data['name']}
+Símbolo: {data['symbol']}
+Preço Atual: ${data['current_price']:.2f}
+Market Cap: ${data['market_cap']:,}
+Rank de Market Cap: {data['market_cap_rank']}
+Volume Total (24h): ${data['total_volume']:,}
+Variação de Preço (24h): {data['price_change_percentage_24h']:.2f}%
+ATH (All-Time High): ${data['ath']:.2f} ({ath_date})
+ATL (All-Time Low): ${data['atl']:.2f} ({atl_date})
+Última Atualização: {data['last_updated']}
+"""
+    return formatted_data
+
+# Ponto de entrada de linha de comando
+def main():
+    # Configuração do log
+    logging.basicConfig(level=logging.INFO)
+
+    # Lista de ids das criptomoedas desejadas
+    crypto_ids = ["bitcoin", "binancecoin", "ethereum", "Shentu", "filecoin", "trust-wallet-token"]
+
+    try:
+        market_data = get_market_data(crypto_ids)
+        logger.info("Dados das criptomoedas:")
+        for data in market_data:
+            print(format_market_data(data))
+    except ApiError as e:
+        logger.error(f"Falha ao obter dados das criptomoedas: {e}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+import asyncio
+import logging
+import math
+
+from ..env import get_env
+from ..http_client import RETRY_STATUS, ApiError, ApiHTTPError, ApiRateLimitError, get_async_client, get_client
+from ..scheduler import CreditScheduler
+
+logger = logging.getLogger(__name__)
+
+# Códigos de erro da CoinMarketCap que indicam limite de taxa ou de créditos
+RATE_LIMIT_ERROR_CODES = {1008, 1009, 1010, 1011}
+
+def estimate_credits(endpoint, params=None):
+    """
+    Estima o custo em créditos de uma consulta, segundo a tabela de preços da CoinMarketCap:
+    listings/latest custa 1 crédito a cada 200 moedas (arredondado para cima) mais 1 por
+    moeda de conversão além da primeira; map e categories custam 1 crédito por chamada.
+    O custo real informado na resposta (`status.credit_count`) corrige a estimativa.
+    """
+    params = params or {}
+    if endpoint == '/v1/cryptocurrency/listings/latest':
+        converts = len(str(params.get('convert') or 'USD').split(','))
+        return math.ceil(int(params.get('limit', 100)) / 200) + converts - 1
+    return 1
+
+class CoinMarketCapAPI:
+    def __init__(self, requests_per_minute=30, credits_per_day=None, max_concurrency=4):
+        """
+        Args:
+            requests_per_minute (int): Limite de requisições por minuto do plano (Basic: 30).
+            credits_per_day (int, opcional): Créditos disponíveis por dia (None = não controlar).
+            max_concurrency (int): Consultas independentes executadas em paralelo.
+        """
+        self.api_key = get_env('COINMARKETCAP_API_KEY')  # Lida do ambiente ou do arquivo .env
+        if not self.api_key:
+            raise ValueError("API key not found. Please set COINMARKETCAP_API_KEY in .env file.")
+        # Cliente HTTP compartilhado: a conexão com a API é reutilizada entre as consultas.
+        # O 429 fica a cargo do agendador, que conhece o orçamento de requisições e créditos.
+        self.client = get_client(
+            "coinmarketcap",
+            base_url="https://pro-api.coinmarketcap.com",
+            retry_status=RETRY_STATUS - {429},
+        )
+        # Variante asyncio (métodos `*_async`): mesma API, mesmo agendador, sessão aiohttp própria
+        self.async_client = get_async_client(
+            "coinmarketcap",
+            base_url="https://pro-api.coinmarketcap.com",
+            retry_status=RETRY_STATUS - {429},
+            max_concurrency=max_concurrency,
+        )
+        self.scheduler = CreditScheduler(
+            requests_per_minute=requests_per_minute,
+            credit_limit=credits_per_day,
+            max_concurrency=max_concurrency,
+        )
+
+    def establish_connection(self, endpoint, params=None):
+        """
+        Consulta um endpoint da API assim que houver orçamento de requisições e créditos.
+        Levanta `ApiError` (ou uma subclasse) em caso de falha.
+        """
+        headers = self._headers()
+        credits = estimate_credits(endpoint, params)
+
+        data = self.scheduler.execute(lambda: self._fetch(endpoint, params, headers), credits)
+        return self._connected(endpoint, credits, data)
+
+    async def establish_connection_async(self, endpoint, params=None):
+        """
+        Variante asyncio de `establish_connection`: espera o orçamento sem bloquear o event loop.
+        """
+        headers = self._headers()
+        credits = estimate_credits(endpoint, params)
+
+        data = await self.scheduler.execute_async(lambda: self._fetch_async(endpoint, params, headers), credits)
+        return self._connected(endpoint, credits, data)
+
+    def _headers(self):
+        return {
+            'X-CMC_PRO_API_KEY': self.api_key,
+        }
+
+    def _connected(self, endpoint, credits, data):
+        credit_count = (data.get('status') or {}).get('credit_count')
+        if credit_count is not None:
+            self.scheduler.reconcile(credits, credit_count)
+        logger.info(f"Conexão bem-sucedida com {endpoint}!")
+        return data
+
+    def _fetch(self, endpoint, params, headers):
+        try:
+            return self.client.get_json(endpoint, params=params, headers=headers)
+        except ApiHTTPError as e:
+            if self._is_rate_limited(e):
+                raise ApiRateLimitError(str(e), e.provider, e.url, e.status, e.body) from e
+            raise
+
+    async def _fetch_async(self, endpoint, params, headers):
+        try:
+            return await self.async_client.get_json(endpoint, params=params, headers=headers)
+        except ApiHTTPError as e:
+            if self._is_rate_limited(e):
+                raise ApiRateLimitError(str(e), e.provider, e.url, e.status, e.body) from e
+            raise
+
+    @staticmethod
+    def _is_rate_limited(e):
+        # Limite de minuto/dia/mês ou de IP pode vir com outro status; o agendador trata todos como 429
+        error_code = ((e.json() or {}).get('status') or {}).get('error_code')
+        return error_code in RATE_LIMIT_ERROR_CODES and not isinstance(e, ApiRateLimitError)
+
+    def gather(self, *requests, return_exceptions=False):
+        """
+        Executa consultas independentes em paralelo (cada uma ainda respeita o orçamento).
+
+        Args:
+            *requests: Funções sem argumentos, ex.: `api.get_crypto_map`.
+            return_exceptions (bool): Se True, erros entram na lista de resultados em vez de serem levantados.
+        """
+        return self.scheduler.gather(*requests, return_exceptions=return_exceptions)
+
+    async def gather_async(self, *requests, return_exceptions=False):
+        """
+        Variante asyncio de `gather`: executa corrotinas independentes (ex.:
+        `api.get_crypto_map_async()`) e devolve os resultados na ordem recebida.
+        """
+        return list(await asyncio.gather(*requests, return_exceptions=return_exceptions))
+
+    def sync_budget(self):
+        """
+        Lê o uso atual da chave em /v1/key/info (não consome créditos) e alinha o agendador.
+        """
+        return self._apply_key_info(self.client.get_json('/v1/key/info', headers=self._headers())['data'])
+
+    async def sync_budget_async(self):
+        """
+        Variante asyncio de `sync_budget`.
+        """
+        return self._apply_key_info((await self.async_client.get_json('/v1/key/info', headers=self._headers()))['data'])
+
+    def _apply_key_info(self, data):
+        usage = data['usage']
+        self.scheduler.requests_per_minute = data['plan'].get('rate_limit_minute') or self.scheduler.requests_per_minute
+        if self.scheduler.credit_limit is None and data['plan'].get('credit_limit_daily'):
+            self.scheduler.credit_limit = data['plan']['credit_limit_daily']
+        self.scheduler.sync(
+            requests_left=usage['current_minute'].get('requests_left'),
+            credits_left=usage['current_day'].get('credits_left'),
+        )
+        return self.budget()
+
+    def budget(self):
+        """
+        Orçamento restante no agendador (requisições no minuto, créditos no dia, pausa em curso).
+        """
+        return self.scheduler.budget()
+
+    def get_latest_market_pairs(self, start=1, limit=5, convert='USD'):
+        return self.establish_connection('/v1/cryptocurrency/listings/latest', params=self._listing_params(start, limit, convert))
+
+    async def get_latest_market_pairs_async(self, start=1, limit=5, convert='USD'):
+        return await self.establish_connection_async(
+            '/v1/cryptocurrency/listings/latest', params=self._listing_params(start, limit, convert)
+        )
+
+    def get_crypto_map(self, start=1, limit=5, convert=None):
+        return self.establish_connection('/v1/cryptocurrency/map', params=self._listing_params(start, limit))
+
+    async def get_crypto_map_async(self, start=1, limit=5, convert=None):
+        return await self.establish_connection_async('/v1/cryptocurrency/map', params=self._listing_params(start, limit))
+
+    def get_crypto_categories(self, start=1, limit=5, convert=None):
+        return self.establish_connection('/v1/cryptocurrency/categories', params=self._listing_params(start, limit))
+
+    async def get_crypto_categories_async(self, start=1, limit=5, convert=None):
+        return await self.establish_connection_async('/v1/cryptocurrency/categories', params=self._listing_params(start, limit))
+
+    @staticmethod
+    def _listing_params(start, limit, convert=None):
+        params = {
+            'start': start,
+            'limit': limit,
+        }
+        if convert:
+            params['convert'] = convert
+        return params
+
+    def format_crypto_data(self, data, convert=None):
+        """
+        Resume cada moeda de uma resposta de listings/latest.
+
+        Args:
+            data (dict): Resposta de `get_latest_market_pairs`.
+            convert (str, opcional): Moeda de cotação exibida (padrão: a primeira da resposta,
+                isto é, a primeira do `convert` da consulta).
+
+        Para a listagem inteira e consultas por rank ou símbolo, use `bsc_toolkit.listings`.
+        """
+        formatted_data = {}
+        for currency in data['data']:
+            quote_currency = convert or next(iter(currency['quote']))
+            quote = currency['quote'][quote_currency]
+            formatted_data[currency['name']] = {
+                f'Preço em {quote_currency}': quote['price'],
+                'Volume em 24h': quote['volume_24h'],
+                'Variação em 1h': quote['percent_change_1h'],
+                'Variação em 24h': quote['percent_change_24h'],
+                'Variação em 7d': quote['percent_change_7d'],
+                'Capitalização de Mercado': quote['market_cap']
+            }
+        return formatted_data
+
+
+# Ponto de entrada de linha de comando
+def main():
+    coinmarketcap_api = CoinMarketCapAPI()
+    
+    # Consulta aos endpoints em paralelo, respeitando o limite por minuto e os créditos do plano
+    results = coinmarketcap_api.gather(
+        lambda: coinmarketcap_api.get_latest_market_pairs(convert='EUR'),
+        coinmarketcap_api.get_crypto_map,
+        coinmarketcap_api.get_crypto_categories,
+        return_exceptions=True,
+    )
+    endpoints = ('/v1/cryptocurrency/listings/latest', '/v1/cryptocurrency/map', '/v1/cryptocurrency/categories')
+    for endpoint, result in zip(endpoints, results):
+        if isinstance(result, ApiError):
+            print("Erro ao conectar-se à API:", result)
+        elif not isinstance(result, Exception):
+            print(f"Conexão bem-sucedida com {endpoint}!")
+    latest_market_pairs, crypto_map, crypto_categories = (
+        None if isinstance(result, Exception) else result for result in results
+    )
+    
+    # Formatando e imprimindo os resultados
+    if latest_market_pairs:
+        formatted_data = coinmarketcap_api.format_crypto_data(latest_market_pairs, convert='EUR')
+        print("Resultados da consulta - Últimos Pares de Mercado:")
+        for currency, info in formatted_data.items():
+            print(f"{currency}:")
+            for key, value in info.items():
+                print(f"- {key}: {value}")
+            print()
+    else:
+        print("Falha ao obter dados mais recentes do mercado.")
+        
+    if crypto_map:
+        print("Resultados da consulta - Mapa de Criptomoedas:")
+        for currency in crypto_map['data']:
+            name = currency['name']
+            rank = currency['rank']
+            is_active = "Sim" if currency['is_active'] else "Não"
+            first_historical_data = currency['first_historical_data']
+            last_historical_data = currency['last_historical_data']
+            print(f"- {name} ({currency['symbol']}):")
+            print(f"  - Rank: {rank}")
+            print(f"  - Ativo: {is_active}")
+            print(f"  - Primeiros dados históricos: {first_historical_data}")
+            print(f"  - Últimos dados históricos: {last_historical_data}")
+            print()
+    else:
+        print("Falha ao obter o mapa de criptomoedas.")
+        
+
+    if crypto_categories:
+        print("Resultados da consulta - Categorias de Criptomoedas:")
+        for category in crypto_categories['data']:
+            print(f"- {category['name']} ({category['title']}):")
+            print(f"  - Descrição: {category['description']}")
+            print(f"  - Número de tokens: {category['num_tokens']}")
+            print(f"  - Variação média de preço: {category['avg_price_change']:.2f}%")
+            print(f"  - Capitalização de mercado: ${category['market_cap']:.2f}")
+            print(f"  - Variação na capitalização de mercado: {category['market_cap_change']:.2f}%")
+            print(f"  - Volume em 24h: ${category['volume']:.2f}")
+            print(f"  - Variação no volume em 24h: {category['volume_change']:.2f}%")
+            print(f"  - Última atualização: {category['last_updated']}")
+            print()
+    else:
+        print("Falha ao obter as categorias de criptomoedas.")
+
+    budget = coinmarketcap_api.budget()
+    print(f"Orçamento restante: {budget['requests_remaining']}/{budget['requests_per_minute']} requisições neste minuto.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+import asyncio
+import logging
+
+from ..env import get_env
+from ..http_client import ApiResponseError, get_async_client, get_client
+
+logger = logging.getLogger(__name__)
+
+# Obtém a chave API do ambiente ou do arquivo .env (só na primeira consulta)
+def get_api_key():
+    pancakeswap_api_key = get_env("PANCAKESWAP_API_KEY")
+
+    # Verifica se a chave foi carregada corretamente
+    if not pancakeswap_api_key:
+        raise ValueError("Chave da API não encontrada no arquivo .env")
+    return pancakeswap_api_key
+
+# URL da API GraphQL
+def graphql_url():
+    return f"https://open-platform.nodereal.io/{get_api_key()}/pancakeswap-free/graphql"
+
+# Cliente HTTP compartilhado da NodeReal (a chave na URL é ocultada nas mensagens de erro)
+def nodereal_client():
+    return get_client("nodereal", secrets=[get_api_key()])
+
+def nodereal_async_client():
+    return get_async_client("nodereal", secrets=[get_api_key()])
+
+# Pares por consulta GraphQL em get_pairs_data
+PAIR_CHUNK_SIZE = 50
+
+# Backfill do histórico: dias por página de cada par e pares por consulta GraphQL
+HISTORY_PAGE_SIZE = 1000
+HISTORY_PAIRS_PER_QUERY = 10
+
+# Pares ASPPBR avaliados pelo script API/pancakeswap.py
+ASPPBR_PAIRS = [
+    ("0xB9a2b08Be15dC15e531b0d25B3942268DA27B100", "WBNB"),   # WBNB
+    ("0x3DAc89C0C868eb9F835D97E1FDb702b6fD6Ae38E", "CTK"),   # CTK
+    ("0x60825783086bbEbbF0C83129e88c69914ad17073", "TWT"),   # TWT
+    ("0x2E931d4b735F476E5edba95D0FEba9eb848cECD0", "WBTC"),   # WBTC
+    ("0x4F287Dd8B2b02aA8885AB9C6DdCE876D1031268B", "USDT"),   # USDT
+    ("0x25aF0AC22fdC2A408Ef07FcB795c516B3a0F3858", "Filecoin")    # Filecoin
+]
+
+# Campos de pairDayDatas usados na avaliação
+PAIR_DAY_DATA_FIELDS = """
+        pairAddress {
+          id
+          name
+        }
+        date
+        dailyVolumeUSD
+        dailyTxns
+        dailyVolumeToken0
+        dailyVolumeToken1
+        reserve0
+        reserve1
+        reserveUSD
+        totalSupply
+"""
+
+# Corpo e cabeçalhos de uma consulta GraphQL
+def graphql_request(query, variables=None):
+    headers = {
+        "Content-Type": "application/json",
+        "Authorization": "Bearer " + get_api_key()
+    }
+    
+    payload = {"query": query}
+    if variables:
+        payload["variables"] = variables
+    return payload, headers
+
+def check_graphql_result(result):
+    if result.get("errors"):
+        raise ApiResponseError(f"Erro na consulta GraphQL: {result['errors']}", "nodereal")
+    return result
+
+# Função para fazer uma consulta GraphQL; falhas levantam ApiError (ou uma subclasse)
+def make_graphql_query(query, variables=None):
+    payload, headers = graphql_request(query, variables)
+    return check_graphql_result(nodereal_client().post_json(graphql_url(), payload, headers=headers))
+
+# Variante asyncio de make_graphql_query (sessão aiohttp compartilhada da NodeReal)
+async def make_graphql_query_async(query, variables=None):
+    payload, headers = graphql_request(query, variables)
+    return check_graphql_result(await nodereal_async_client().post_json(graphql_url(), payload, headers=headers))
+
+# Monta uma consulta com um alias por par; os endereços vão como variáveis, não no texto
+def build_pairs_query(count):
+    parameters = ", ".join(f"$pair{i}: String!" for i in range(count))
+    selections = "".join(
+        f"""
+      pair{i}: pairDayDatas(first: 1, skip: 0, where: {{date_gt: $dateGt, pairAddress: $pair{i}}}) {{{PAIR_DAY_DATA_FIELDS}      }}"""
+        for i in range(count)
+    )
+    return f"query PairDayDatas($dateGt: Int!, {parameters}) {{{selections}\n    }}"
+
+# Consulta paginada do histórico: cada alias tem o seu cursor (a última data já recebida)
+def build_history_query(count):
+    parameters = ", ".join(f"$pair{i}: String!, $after{i}: Int!" for i in range(count))
+    selections = "".join(
+        f"""
+      pair{i}: pairDayDatas(first: $first, orderBy: date, orderDirection: asc, where: {{date_gt: $after{i}, pairAddress: $pair{i}}}) {{{PAIR_DAY_DATA_FIELDS}      }}"""
+        for i in range(count)
+    )
+    return f"query PairDayHistory($first: Int!, {parameters}) {{{selections}\n    }}"
+
+def iter_pair_day_datas(pair_addresses, cursors=None, page_size=HISTORY_PAGE_SIZE,
+                        pairs_per_query=HISTORY_PAIRS_PER_QUERY):
+    """
+    Percorre o histórico diário completo de vários pares, página por página.
+
+    A paginação usa a data como cursor (`date_gt` + `orderBy: date`), e não `skip`, que
+    fica lento e limitado em históricos longos. Cada consulta leva até `pairs_per_query`
+    pares, cada um com o seu cursor; um par sai da rodada quando devolve menos de
+    `page_size` dias.
+
+    Args:
+        pair_addresses (list): Endereços dos pares.
+        cursors (dict, opcional): {endereço: último timestamp já obtido}, para retomar.
+        page_size (int): Dias por página de cada par.
+        pairs_per_query (int): Pares por consulta GraphQL.
+
+    Yields:
+        tuple: (endereço do par, lista de registros de pairDayDatas em ordem de data).
+    """
+    cursors = {address: (cursors or {}).get(address) or 0 for address in dict.fromkeys(pair_addresses)}
+    pending = list(cursors)
+    while pending:
+        next_round = []
+        for start in range(0, len(pending), pairs_per_query):
+            chunk = pending[start:start + pairs_per_query]
+            variables = {"first": page_size}
+            for i, address in enumerate(chunk):
+                variables[f"pair{i}"] = address.lower()
+                variables[f"after{i}"] = cursors[address]
+            data = make_graphql_query(build_history_query(len(chunk)), variables).get("data") or {}
+            for i, address in enumerate(chunk):
+                day_datas = data.get(f"pair{i}") or []
+                if day_datas:
+                    cursors[address] = int(day_datas[-1]["date"])
+                    yield address, day_datas
+                if len(day_datas) == page_size:
+                    next_round.append(address)
+        pending = next_round
+
+def backfill_pair_day_datas(pair_addresses, store, page_size=HISTORY_PAGE_SIZE,
+                            pairs_per_query=HISTORY_PAIRS_PER_QUERY):
+    """
+    Grava o histórico diário dos pares em um `PairHistoryStore`, retomando da última
+    data gravada de cada par: a primeira execução baixa tudo e as seguintes só os dias novos.
+    As páginas são gravadas à medida que chegam (nada do histórico fica todo em memória).
+
+    Returns:
+        dict: {endereço do par: dias novos gravados}.
+    """
+    cursors = {address: store.last_date(address) for address in pair_addresses}
+    added = {address: 0 for address in pair_addresses}
+    for address, day_datas in iter_pair_day_datas(pair_addresses, cursors, page_size, pairs_per_query):
+        added[address] += store.append(address, day_datas)
+    return added
+
+# Consulta vários pares de tokens com uma requisição por lote de `chunk_size` pares
+def get_pairs_data(pair_addresses, chunk_size=PAIR_CHUNK_SIZE, date_gt=1659312000):
+    """
+    Busca os dados diários de vários pares de tokens em consultas GraphQL agrupadas.
+
+    Cada par vira um alias (`pair0`, `pair1`, ...) da mesma consulta, com a mesma semântica
+    de `get_pair_data` (primeiro registro após `date_gt`). Listas grandes são divididas em
+    lotes de `chunk_size` pares, uma requisição por lote.
+
+    O dicionário devolvido é um retrato único dos pares: passe-o para
+    `calculate_total_asppbr_reserve` e `calcular_valor_unitario_e_mercado` para que
+    reservas e TVL de uma mesma avaliação usem os mesmos dados, sem buscá-los de novo.
+
+    Args:
+        pair_addresses (list): Endereços dos pares.
+        chunk_size (int): Pares por consulta.
+        date_gt (int): Considera apenas registros posteriores a este timestamp.
+
+    Returns:
+        dict: {endereço do par: dados do par ou None, se não houver registro}.
+    """
+    pairs = {}
+    for chunk, (query, variables) in pair_chunks(pair_addresses, chunk_size, date_gt):
+        collect_pairs(chunk, make_graphql_query(query, variables), pairs)
+    return pairs
+
+# Lotes de get_pairs_data: (endereços do lote, (consulta, variáveis))
+def pair_chunks(pair_addresses, chunk_size, date_gt):
+    unique = list(dict.fromkeys(pair_addresses))
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        variables = {"dateGt": date_gt, **{f"pair{i}": address for i, address in enumerate(chunk)}}
+        yield chunk, (build_pairs_query(len(chunk)), variables)
+
+def collect_pairs(chunk, result, pairs):
+    data = result.get("data") or {}
+    for i, address in enumerate(chunk):
+        day_datas = data.get(f"pair{i}")
+        if day_datas:
+            pairs[address] = day_datas[0]
+        else:
+            logger.warning(f"Erro na consulta para o par de tokens: {address}")
+            pairs[address] = None
+
+# Variante asyncio de get_pairs_data: os lotes são consultados ao mesmo tempo
+async def get_pairs_data_async(pair_addresses, chunk_size=PAIR_CHUNK_SIZE, date_gt=1659312000):
+    chunks = list(pair_chunks(pair_addresses, chunk_size, date_gt))
+    results = await asyncio.gather(*(make_graphql_query_async(query, variables) for _, (query, variables) in chunks))
+    pairs = {}
+    for (chunk, _), result in zip(chunks, results):
+        collect_pairs(chunk, result, pairs)
+    return pairs
+
+# Função para consultar dados de pares de tokens com verificação robusta
+def get_pair_data(pair_address):
+    return get_pairs_data([pair_address])[pair_address]
+
+async def get_pair_data_async(pair_address):
+    return (await get_pairs_data_async([pair_address]))[pair_address]
+
+# Função para calcular o TVL
+def calculate_tvl(reserve_usd):
+    return float(reserve_usd) if reserve_usd else 0.0
+
+# Função para calcular o valor unitário de cada token
+def calcular_valor_unitario(tvl_total, total_tokens):
+    return tvl_total / total_tokens if total_tokens else 0.0
+
+# Função para calcular o valor de mercado total dos tokens ASPPBR
+def calcular_valor_mercado(valor_unitario, total_tokens):
+    return valor_unitario * total_tokens if total_tokens else 0.0
+
+# Função para calcular o valor total da reserva do token ASPPBR
+# `snapshot` (de get_pairs_data) evita buscar os pares de novo dentro de uma mesma avaliação
+def calculate_total_asppbr_reserve(pair_addresses, snapshot=None):
+    if snapshot is None:
+        snapshot = get_pairs_data([pair_address for pair_address, _ in pair_addresses])
+    total_reserve = 0
+    for pair_address, _ in pair_addresses:
+        pair_data = snapshot[pair_address]
+        if pair_data is not None:
+            total_reserve += float(pair_data['reserve0'])  # Supondo que reserve0 é o ASPPBR
+    return total_reserve
+
+# Função para calcular o valor unitário e o valor de mercado do token ASPPBR
+def calcular_valor_unitario_e_mercado(pair_addresses):
+    total_tvl = 0
+    total_tokens_asppbr = 0
+    total_supply_asppbr = 21_000_000  # Total de tokens fixos
+
+    # Todos os pares em uma única consulta; o mesmo retrato serve ao TVL e às reservas
+    snapshot = get_pairs_data([pair_address for pair_address, _ in pair_addresses])
+
+    for pair_address, token_name in pair_addresses:
+        pair_data = snapshot[pair_address]
+        if pair_data is None:
+            continue
+        
+        # Calcula e acumula o TVL total
+        total_tvl += float(pair_data['reserveUSD'])
+        
+        # Acumula o total de tokens ASPPBR
+        total_tokens_asppbr += float(pair_data['reserve0'])  # Assumindo que reserve0 é a reserva do token ASPPBR
+
+        # Imprime informações sobre o par de tokens
+        print(f"### Par de Tokens: ASPPBR-{token_name}")
+        print(f"- Endereço do Par: {pair_address}")
+        print(f"- Data: {pair_data['date']}")
+        print(f"- Volume Diário em USD: ${float(pair_data['dailyVolumeUSD']):,.2f}")
+        print(f"- Transações Diárias: {pair_data['dailyTxns']}")
+        print(f"- Volume Diário do Token ASPPBR: {float(pair_data['dailyVolumeToken0']):,.2f}")
+        print(f"- Volume Diário do Token {token_name}: {float(pair_data['dailyVolumeToken1']):,.2f}")
+        print(f"- Reserva do Token ASPPBR: {float(pair_data['reserve0']):,.2f}")
+        print(f"- Reserva do Token {token_name}: {float(pair_data['reserve1']):,.2f}")
+        print(f"- Reserva Total em USD: ${float(pair_data['reserveUSD']):,.2f}")
+        print(f"- Total de Suprimento: {float(pair_data['totalSupply']):,.2f}")
+        
+        # Calcula e imprime o TVL
+        tvl = calculate_tvl(pair_data['reserveUSD'])
+        print(f"- TVL: ${tvl:,.2f}")
+        print()
+
+    # Calcula o valor unitário
+    valor_unitario = calcular_valor_unitario(total_tvl, total_tokens_asppbr)
+    
+    # Calcula o valor de mercado total dos tokens ASPPBR
+    valor_mercado_total = calcular_valor_mercado(valor_unitario, total_supply_asppbr)
+    
+    # Calcula o total da reserva de token ASPPBR
+    total_asppbr_reserve = calculate_total_asppbr_reserve(pair_addresses, snapshot)
+    
+    return valor_unitario, valor_mercado_total, total_tvl, total_tokens_asppbr, total_asppbr_reserve
+
+# Ponto de entrada de linha de comando: avaliação dos pares ASPPBR
+def main():
+    # Lista de endereços de pares de tokens para consultar
+    pair_addresses = ASPPBR_PAIRS
+
+    # Chama a função para calcular o valor unitário, o valor de mercado e o total das reservas
+    valor_unitario, valor_mercado_total, total_tvl, total_tokens_asppbr, total_asppbr_reserve = calcular_valor_unitario_e_mercado(pair_addresses)
+
+    # Imprime os resultados formatados
+    print(f"O valor unitário de cada token ASPPBR é: ${valor_unitario:,.2f}")
+    print(f"O valor de mercado total dos tokens ASPPBR é: ${valor_mercado_total:,.2f}")
+    print(f"Total das Reservas de TVL: ${total_tvl:,.2f}")
+    print(f"Total das Reservas de Token ASPPBR: ${total_asppbr_reserve:,.2f}")
+
+if __name__ == "__main__":
+    main()
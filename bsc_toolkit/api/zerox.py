@@ -0,0 +1,150 @@
+import asyncio
+import logging
+from typing import Dict, List, Tuple
+
+from ..env import get_env
+from ..http_client import ApiResponseError, get_async_client, get_client
+from ..price_cache import get_price_cache
+from ..price_stream import PriceStream
+
+logger = logging.getLogger(__name__)
+
+# Cliente HTTP compartilhado da API 0x (conexões reutilizadas entre consultas), criado no primeiro uso
+def zerox_client():
+    return get_client("0x", base_url="https://bsc.api.0x.org")
+
+# Obter API Key de variáveis de ambiente (só quando uma consulta for feita)
+def get_api_key() -> str:
+    api_key = get_env("ZEROX_API_KEY")
+    if not api_key:
+        raise ValueError("A chave da API não foi encontrada. Defina a variável de ambiente 'ZEROX_API_KEY'.")
+    return api_key
+
+def zerox_async_client():
+    return get_async_client("0x", base_url="https://bsc.api.0x.org")
+
+def check_price_args(sell_token: str, buy_token: str, sell_amount: int) -> None:
+    if not (sell_token and buy_token and sell_amount > 0):
+        raise ValueError("Parâmetros inválidos. Certifique-se de que os tokens e o valor de venda são válidos.")
+
+def price_request(sell_token: str, buy_token: str, sell_amount: int) -> Tuple[Dict, Dict]:
+    """
+    Parâmetros e cabeçalhos de uma consulta a /swap/v1/price.
+    """
+    check_price_args(sell_token, buy_token, sell_amount)
+    params = {
+        "sellToken": sell_token,
+        "buyToken": buy_token,
+        "sellAmount": sell_amount
+    }
+    headers = {
+        "0x-api-key": get_api_key()
+    }
+    return params, headers
+
+def parse_price(data: Dict) -> float:
+    price = data.get("price")
+    if not price:
+        raise ApiResponseError("Resposta da API não contém o campo 'price'.", "0x")
+    return float(price)
+
+def fetch_token_price(sell_token: str, buy_token: str, sell_amount: int) -> float:
+    """
+    Consulta o preço na API 0x sem passar pelo cache (usado pelo stream de preços).
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos.
+        ApiError: Se a solicitação falhar ou a resposta não contiver o preço.
+    """
+    params, headers = price_request(sell_token, buy_token, sell_amount)
+    return parse_price(zerox_client().get_json("/swap/v1/price", params=params, headers=headers))
+
+async def fetch_token_price_async(sell_token: str, buy_token: str, sell_amount: int) -> float:
+    """
+    Variante asyncio de `fetch_token_price`.
+    """
+    params, headers = price_request(sell_token, buy_token, sell_amount)
+    return parse_price(await zerox_async_client().get_json("/swap/v1/price", params=params, headers=headers))
+
+def price_key(sell_token: str, buy_token: str, sell_amount: int) -> Tuple[str, str]:
+    # O preço depende da quantidade vendida (impacto na liquidez), então ela faz parte da chave
+    return sell_token.lower(), f"{buy_token.lower()}:{sell_amount}"
+
+def get_token_price(sell_token: str, buy_token: str, sell_amount: int) -> float:
+    """
+    Obtém o preço de um token em relação a outro usando a API 0x.
+
+    Args:
+        sell_token (str): Endereço do token a ser vendido.
+        buy_token (str): Endereço do token a ser comprado.
+        sell_amount (int): Quantidade do token a ser vendido (em unidades menores, como wei).
+
+    Returns:
+        float: O preço do token em relação ao token de compra.
+
+    Raises:
+        ValueError: Se os parâmetros forem inválidos.
+        ApiError: Se a solicitação falhar ou a resposta não contiver o preço.
+    """
+    check_price_args(sell_token, buy_token, sell_amount)
+    return get_price_cache().get(
+        "0x", *price_key(sell_token, buy_token, sell_amount),
+        lambda: fetch_token_price(sell_token, buy_token, sell_amount),
+    )
+
+async def get_token_price_async(sell_token: str, buy_token: str, sell_amount: int) -> float:
+    """
+    Variante asyncio de `get_token_price`, com o mesmo cache: consultas simultâneas ao
+    mesmo par e quantidade fazem uma única requisição.
+    """
+    check_price_args(sell_token, buy_token, sell_amount)
+    return await get_price_cache().get_async(
+        "0x", *price_key(sell_token, buy_token, sell_amount),
+        lambda: fetch_token_price_async(sell_token, buy_token, sell_amount),
+    )
+
+async def watch_prices(pairs: List[Tuple[str, str, int]], **options) -> None:
+    """
+    Acompanha vários pares ao mesmo tempo e registra cada mudança de preço relevante.
+
+    As consultas usam o cliente assíncrono da 0x (nenhuma thread fica bloqueada em I/O);
+    a sessão é fechada quando o acompanhamento termina.
+
+    Args:
+        pairs (list): Tuplas (token vendido, token comprado, quantidade vendida).
+        **options: Repassadas a `PriceStream` (max_concurrency, min_interval, threshold, ...).
+    """
+    stream = PriceStream(fetch_token_price_async, **options)
+    for pair in pairs:
+        stream.add_pair(*pair)
+    try:
+        async with stream:
+            async for update in stream:
+                logger.info(
+                    f"{update.sell_token} -> {update.buy_token}: {update.price:.6f} ({update.change:+.2%})"
+                )
+    finally:
+        await zerox_async_client().close()
+
+def main():
+    sell_token = "0x0697AB2B003FD2Cbaea2dF1ef9b404E45bE59d4C"  # Endereço do ASPPBR
+    buy_token = "0x55d398326f99059fF775485246999027B3197955"  # Endereço do USDT
+    sell_amount = 10_000_000  # 10 USDC (USDC tem uma unidade base de 6)
+
+    get_api_key()  # Falha logo se a chave não estiver configurada
+
+    # Outros pares podem ser acrescentados à lista; todos são consultados em paralelo
+    pairs = [(sell_token, buy_token, sell_amount)]
+
+    # Configuração do logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s"
+    )
+    try:
+        asyncio.run(watch_prices(pairs, min_interval=5.0, max_interval=60.0))
+    except KeyboardInterrupt:
+        logger.info("Execução interrompida pelo usuário.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+import os
+import threading
+from typing import Optional
+
+_loaded = False
+_lock = threading.Lock()
+
+
+def get_env(name: str, default: Optional[str] = None) -> Optional[str]:
+    """
+    Lê uma variável de ambiente, carregando o arquivo `.env` na primeira chamada.
+
+    Nenhum módulo do pacote lê o `.env` ao ser importado; a leitura acontece apenas
+    quando alguma configuração (chave de API, URL de nó, ...) é de fato necessária.
+    """
+    global _loaded
+    if not _loaded:
+        with _lock:
+            if not _loaded:
+                from dotenv import load_dotenv
+
+                load_dotenv()
+                _loaded = True
+    return os.getenv(name, default)
@@ -0,0 +1,266 @@
+import logging
+import threading
+from bisect import bisect_left, insort
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Nível -> percentil das taxas de cada bloco (rewardPercentiles do eth_feeHistory)
+DEFAULT_LEVELS: Dict[str, float] = {"safe": 25.0, "propose": 50.0, "fast": 90.0}
+
+# Blocos pedidos por chamada ao eth_feeHistory (os nós costumam limitar a 1024)
+FEE_HISTORY_MAX_BLOCKS = 1024
+
+# Um bloco: (número, taxa base, gasUsedRatio, preços por nível em wei)
+BlockFees = Tuple[int, int, float, Tuple[int, ...]]
+
+
+class RollingPercentile:
+    """
+    Percentil de uma janela deslizante, mantido incrementalmente.
+
+    Os valores ficam em ordem de chegada (para descartar o mais antigo) e em uma lista
+    ordenada (inserção e remoção com busca binária), de modo que consultar o percentil
+    é só indexar a lista ordenada.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._window: Deque[int] = deque()
+        self._sorted: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._window)
+
+    def add(self, value: int) -> None:
+        if len(self._window) == self.size:
+            old = self._window.popleft()
+            del self._sorted[bisect_left(self._sorted, old)]
+        self._window.append(value)
+        insort(self._sorted, value)
+
+    def percentile(self, p: float) -> Optional[int]:
+        if not self._sorted:
+            return None
+        index = min(len(self._sorted) - 1, int(p / 100 * len(self._sorted)))
+        return self._sorted[index]
+
+
+class GasOracle:
+    """
+    Oráculo de gás local, alimentado pelos nós RPC em vez da BscScan.
+
+    Mantém um buffer circular com as taxas dos últimos `blocks` blocos, obtidas com
+    `eth_feeHistory` (ou, se o nó não o suportar, lendo os blocos com as transações
+    via `eth_getBlockByNumber` em lote). Para cada nível (safe/propose/fast) guarda o
+    preço do percentil correspondente em cada bloco e atualiza incrementalmente a
+    mediana (`window_percentile`) desses preços na janela a cada bloco novo. Blocos
+    vazios entram no buffer, mas não nas janelas: na BSC a taxa base é zero e eles
+    puxariam as estimativas para zero.
+
+    `update()` busca apenas os blocos que ainda não foram vistos; `start()` faz isso
+    em uma thread de fundo a cada `poll_interval` segundos. As consultas (`oracle`,
+    `gas_price`) são respondidas da memória.
+
+    Args:
+        rpc: `NodePool` ou `JsonRpcClient` (qualquer objeto com `call` e `batch`).
+        blocks (int): Tamanho da janela, em blocos.
+        levels (dict): Nível -> percentil das taxas de cada bloco.
+        window_percentile (float): Percentil, na janela, dos preços de cada nível.
+        poll_interval (float): Intervalo entre atualizações em segundo plano, em segundos.
+        follow_blocks (int): Blocos pedidos em cada atualização depois da carga inicial.
+    """
+
+    def __init__(
+        self,
+        rpc,
+        blocks: int = 200,
+        levels: Optional[Dict[str, float]] = None,
+        window_percentile: float = 50.0,
+        poll_interval: float = 1.5,
+        follow_blocks: int = 8,
+    ):
+        self.rpc = rpc
+        self.blocks = blocks
+        self.levels = dict(levels or DEFAULT_LEVELS)
+        self.window_percentile = window_percentile
+        self.poll_interval = poll_interval
+        self.follow_blocks = follow_blocks
+
+        self._buffer: Deque[BlockFees] = deque(maxlen=blocks)
+        self._windows = {level: RollingPercentile(blocks) for level in self.levels}
+        self._last_block: Optional[int] = None
+        self._use_fee_history = True
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # Coleta
+
+    def update(self) -> int:
+        """
+        Busca os blocos novos desde a última atualização e os acrescenta às janelas.
+
+        Returns:
+            int: Quantidade de blocos novos.
+        """
+        count = self.blocks if self._last_block is None else self.follow_blocks
+        fees = self._collect(count, "latest")
+        if self._last_block is not None and fees and fees[0][0] > self._last_block + 1:
+            # Lacuna maior que `follow_blocks` (ex.: atualização atrasada): busca o que faltou
+            gap = min(fees[0][0] - self._last_block - 1, self.blocks)
+            fees = self._collect(gap, hex(fees[0][0] - 1)) + fees
+
+        added = 0
+        with self._lock:
+            for block in fees:
+                if self._last_block is not None and block[0] <= self._last_block:
+                    continue
+                self._add(block)
+                added += 1
+        return added
+
+    def _add(self, block: BlockFees) -> None:
+        number, _, gas_used_ratio, prices = block
+        self._buffer.append(block)
+        self._last_block = number
+        if gas_used_ratio > 0:
+            for window, price in zip(self._windows.values(), prices):
+                window.add(price)
+
+    def _collect(self, count: int, newest: str) -> List[BlockFees]:
+        from .rpc.client import JsonRpcError
+
+        if self._use_fee_history:
+            try:
+                return self._fee_history(count, newest)
+            except JsonRpcError as e:
+                if e.code != -32601:
+                    raise
+                logger.info("Nó sem eth_feeHistory; lendo os blocos com as transações.")
+                self._use_fee_history = False
+        return self._block_fees(count, newest)
+
+    def _fee_history(self, count: int, newest: str) -> List[BlockFees]:
+        fees: List[BlockFees] = []
+        percentiles = list(self.levels.values())
+        while count > 0:
+            history = self.rpc.call("eth_feeHistory", [hex(min(count, FEE_HISTORY_MAX_BLOCKS)), newest, percentiles])
+            oldest = int(history["oldestBlock"], 16)
+            ratios = history.get("gasUsedRatio") or []
+            base_fees = history.get("baseFeePerGas") or []
+            rewards = history.get("reward") or [[]] * len(ratios)
+            chunk = []
+            for i, ratio in enumerate(ratios):
+                base_fee = int(base_fees[i], 16) if i < len(base_fees) else 0
+                chunk.append((oldest + i, base_fee, ratio, tuple(base_fee + int(r, 16) for r in rewards[i])))
+            fees = chunk + fees
+            if not ratios or oldest == 0:
+                break
+            count -= len(ratios)
+            newest = hex(oldest - 1)
+        return fees
+
+    def _block_fees(self, count: int, newest: str) -> List[BlockFees]:
+        last = int(self.rpc.call("eth_blockNumber"), 16) if newest == "latest" else int(newest, 16)
+        numbers = range(max(0, last - count + 1), last + 1)
+        blocks = self.rpc.batch([("eth_getBlockByNumber", [hex(number), True]) for number in numbers])
+        fees = []
+        for number, block in zip(numbers, blocks):
+            if isinstance(block, Exception) or not block:
+                continue
+            base_fee = int(block.get("baseFeePerGas") or "0x0", 16)
+            prices = sorted(int(tx.get("gasPrice") or "0x0", 16) for tx in block.get("transactions", []))
+            gas_limit = int(block.get("gasLimit") or "0x0", 16)
+            ratio = int(block.get("gasUsed") or "0x0", 16) / gas_limit if gas_limit else 0.0
+            fees.append((number, base_fee, ratio, tuple(
+                prices[min(len(prices) - 1, int(p / 100 * len(prices)))] if prices else base_fee
+                for p in self.levels.values()
+            )))
+        return fees
+
+    # Atualização em segundo plano
+
+    def start(self) -> "GasOracle":
+        """
+        Faz a carga inicial e passa a acompanhar os blocos novos em uma thread de fundo.
+        """
+        if self._thread is None:
+            self.update()
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="gas-oracle", daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.update()
+            except Exception as e:
+                # As consultas continuam respondendo com a janela atual
+                logger.warning(f"Falha ao atualizar o oráculo de gás: {e}")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "GasOracle":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    # Consultas
+
+    def gas_price(self, level: str = "propose") -> int:
+        """
+        Preço do gás, em wei, para um nível (safe, propose, fast).
+
+        Raises:
+            KeyError: Se o nível não existir.
+        """
+        if self._last_block is None:
+            self.update()
+        with self._lock:
+            price = self._windows[level].percentile(self.window_percentile)
+            if price is None and self._buffer:
+                price = self._buffer[-1][1]
+        return price or 0
+
+    def oracle(self) -> Dict[str, str]:
+        """
+        Estimativas no mesmo formato do `gasoracle` da BscScan: "LastBlock",
+        "SafeGasPrice", "ProposeGasPrice" e "FastGasPrice" (em Gwei), "suggestBaseFee"
+        (Gwei) e "gasUsedRatio" (últimos 5 blocos, separados por vírgula).
+        """
+        if self._last_block is None:
+            self.update()
+        with self._lock:
+            prices = {level: window.percentile(self.window_percentile) for level, window in self._windows.items()}
+            recent = list(self._buffer)[-5:]
+            base_fee = recent[-1][1] if recent else 0
+            result = {"LastBlock": str(self._last_block)}
+        for level, key in (("safe", "SafeGasPrice"), ("propose", "ProposeGasPrice"), ("fast", "FastGasPrice")):
+            if level in prices:
+                result[key] = format_gwei(base_fee if prices[level] is None else prices[level])
+        result["suggestBaseFee"] = format_gwei(base_fee)
+        result["gasUsedRatio"] = ",".join(repr(float(block[2])) for block in recent)
+        return result
+
+    def blocks_seen(self) -> List[BlockFees]:
+        """
+        Conteúdo atual do buffer circular, do bloco mais antigo para o mais novo.
+        """
+        with self._lock:
+            return list(self._buffer)
+
+
+def format_gwei(wei: int) -> str:
+    """
+    Formata um valor em wei como Gwei, sem zeros à direita (ex.: 1500000000 -> "1.5").
+    """
+    whole, fraction = divmod(int(wei), 10**9)
+    return f"{whole}.{fraction:09d}".rstrip("0").rstrip(".") if fraction else str(whole)
@@ -0,0 +1,541 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .metrics import record_http
+
+logger = logging.getLogger(__name__)
+
+# (conexão, leitura), em segundos
+DEFAULT_TIMEOUT: Tuple[float, float] = (3.05, 15.0)
+# Status HTTP que justificam uma nova tentativa
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+# Requisições simultâneas por provedor no cliente assíncrono
+DEFAULT_MAX_CONCURRENCY = 10
+
+
+class ApiError(Exception):
+    """
+    Erro base das chamadas às APIs externas (BscScan, CoinGecko, CoinMarketCap, 0x, NodeReal).
+
+    Attributes:
+        provider (str): Nome do provedor.
+        url (str): URL chamada.
+        status (int, opcional): Status HTTP, quando houver resposta.
+    """
+
+    def __init__(self, message: str, provider: str = "", url: str = "", status: Optional[int] = None):
+        super().__init__(message)
+        self.provider = provider
+        self.url = url
+        self.status = status
+
+
+class ApiTimeoutError(ApiError):
+    """A requisição excedeu o timeout de conexão ou de leitura."""
+
+
+class ApiConnectionError(ApiError):
+    """Não foi possível conectar ao provedor (DNS, conexão recusada, TLS)."""
+
+
+class ApiHTTPError(ApiError):
+    """
+    O provedor respondeu com um status HTTP de erro.
+
+    Attributes:
+        body (str): Início do corpo da resposta (muitos provedores descrevem o erro em JSON).
+    """
+
+    def __init__(self, message: str, provider: str = "", url: str = "", status: Optional[int] = None,
+                 body: str = ""):
+        super().__init__(message, provider, url, status)
+        self.body = body
+
+    def json(self) -> Any:
+        """
+        Corpo da resposta decodificado como JSON, ou None se não for JSON.
+        """
+        try:
+            return json.loads(self.body)
+        except ValueError:
+            return None
+
+
+class ApiRateLimitError(ApiHTTPError):
+    """
+    O provedor recusou a requisição por limite de taxa ou de créditos (429).
+
+    Attributes:
+        retry_after (float, opcional): Segundos sugeridos pelo provedor antes de tentar de novo.
+    """
+
+    def __init__(self, message: str, provider: str = "", url: str = "", status: Optional[int] = 429,
+                 body: str = "", retry_after: Optional[float] = None):
+        super().__init__(message, provider, url, status, body)
+        self.retry_after = retry_after
+
+
+class ApiResponseError(ApiError):
+    """A resposta chegou, mas não é JSON válido ou não tem o formato esperado."""
+
+
+_API_KEY_PARAM = re.compile(r"((?:api_?key|key)=)[^&\s'\"]+", re.IGNORECASE)
+
+
+def _retry_after(response: Any) -> Optional[float]:
+    value = response.headers.get("Retry-After")
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+class _ClientBase:
+    """
+    Configuração comum aos clientes síncrono e assíncrono: URL base, timeouts, política de
+    novas tentativas e ocultação de chaves de API.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        base_url: str = "",
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        secrets: Iterable[str] = (),
+        retry_status: Iterable[int] = RETRY_STATUS,
+    ):
+        self.provider = provider
+        self.retry_status = frozenset(retry_status)
+        self.secrets = [secret for secret in secrets if secret]
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def _url(self, url: str) -> str:
+        if url.startswith(("http://", "https://")) or not self.base_url:
+            return url
+        return f"{self.base_url}/{url.lstrip('/')}"
+
+    def _redact(self, text: str) -> str:
+        """
+        Remove chaves de API de URLs e mensagens antes de registrá-las ou levantá-las.
+        """
+        text = _API_KEY_PARAM.sub(r"\1***", text)
+        for secret in self.secrets:
+            text = text.replace(secret, "***")
+        return text
+
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        delay = random.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+
+class HttpClient(_ClientBase):
+    """
+    Cliente HTTP de um provedor, com pool de conexões keep-alive, timeouts e novas tentativas.
+
+    - Uma única `requests.Session` por provedor: conexões TCP/TLS são reutilizadas entre chamadas.
+    - Timeouts de conexão e leitura em todas as requisições.
+    - Respostas comprimidas (gzip/deflate) são aceitas e descompactadas automaticamente.
+    - 429, 5xx, timeouts e falhas de conexão são repetidos com backoff exponencial e jitter
+      ("full jitter"); `Retry-After` é respeitado quando presente.
+    - Erros viram exceções tipadas (`ApiError` e subclasses) em vez de mensagens impressas.
+    - Cada tentativa é registrada em `bsc_toolkit.metrics` (latência, status, tamanho da
+      resposta, erros e novas tentativas, por provedor e caminho).
+
+    Args:
+        provider (str): Nome do provedor (usado nas mensagens e exceções).
+        base_url (str, opcional): Prefixo aplicado a caminhos relativos.
+        headers (dict, opcional): Cabeçalhos enviados em todas as requisições.
+        timeout (float | tuple): Timeout padrão (conexão, leitura).
+        max_retries (int): Novas tentativas após a primeira.
+        backoff (float): Base do backoff exponencial, em segundos.
+        max_backoff (float): Espera máxima entre tentativas, em segundos.
+        pool_maxsize (int): Conexões mantidas abertas por host.
+        secrets (Iterable[str], opcional): Valores (ex.: chaves de API na URL) ocultados nas mensagens de erro.
+        retry_status (Iterable[int]): Status HTTP repetidos automaticamente. Quem controla o próprio
+            limite de taxa (ex.: um agendador) pode retirar o 429 daqui.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        base_url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        pool_maxsize: int = 10,
+        secrets: Iterable[str] = (),
+        retry_status: Iterable[int] = RETRY_STATUS,
+    ):
+        super().__init__(provider, base_url, timeout, max_retries, backoff, max_backoff, secrets, retry_status)
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept": "application/json", "Accept-Encoding": "gzip, deflate"})
+        if headers:
+            self.session.headers.update(headers)
+
+    def request(self, method: str, url: str, retry: bool = True, **kwargs) -> requests.Response:
+        """
+        Executa uma requisição com timeouts e novas tentativas.
+
+        Args:
+            method (str): Método HTTP.
+            url (str): URL absoluta ou caminho relativo a `base_url`.
+            retry (bool): Se False, não repete a requisição em caso de falha.
+            **kwargs: Repassados a `requests.Session.request` (params, json, headers, ...).
+
+        Returns:
+            requests.Response: Resposta com status 2xx.
+
+        Raises:
+            ApiTimeoutError, ApiConnectionError, ApiRateLimitError, ApiHTTPError.
+        """
+        url = self._url(url)
+        kwargs.setdefault("timeout", self.timeout)
+        retries = self.max_retries if retry else 0
+
+        safe_url = self._redact(url.split("?")[0])
+        endpoint = urlsplit(safe_url).path or "/"
+
+        attempt = 0
+        while True:
+            started = time.perf_counter()
+            status: Optional[int] = None
+            size: Optional[int] = None
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.exceptions.Timeout as e:
+                kind = "timeout"
+                error: ApiError = ApiTimeoutError(
+                    self._redact(f"{self.provider}: a solicitação expirou ({e})"), self.provider, safe_url
+                )
+            except requests.exceptions.ConnectionError as e:
+                kind = "connection"
+                error = ApiConnectionError(self._redact(f"{self.provider}: erro de conexão ({e})"), self.provider, safe_url)
+            except requests.exceptions.RequestException as e:
+                record_http(self.provider, endpoint, None, time.perf_counter() - started, error="request")
+                raise ApiError(self._redact(f"{self.provider}: erro na solicitação ({e})"), self.provider, safe_url) from e
+            else:
+                status = response.status_code
+                size = len(response.content)
+                if response.ok:
+                    record_http(self.provider, endpoint, status, time.perf_counter() - started, size)
+                    return response
+                kind = f"http_{status}"
+                message = f"{self.provider}: HTTP {status} em {safe_url}"
+                body = self._redact(response.text[:2000])
+                if status == 429:
+                    error = ApiRateLimitError(message, self.provider, safe_url, status, body, _retry_after(response))
+                else:
+                    error = ApiHTTPError(message, self.provider, safe_url, status, body)
+
+            retrying = attempt < retries and (status is None or status in self.retry_status)
+            record_http(self.provider, endpoint, status, time.perf_counter() - started, size, kind, retrying)
+            if not retrying:
+                raise error
+            logger.warning(f"{error}; nova tentativa {attempt + 1}/{retries}.")
+            time.sleep(self._retry_delay(attempt, getattr(error, "retry_after", None)))
+            attempt += 1
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> requests.Response:
+        return self.request("GET", url, params=params, **kwargs)
+
+    def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        GET que devolve o corpo decodificado como JSON.
+
+        Raises:
+            ApiResponseError: Se o corpo não for JSON válido.
+        """
+        return self._json(self.get(url, params=params, **kwargs))
+
+    def post_json(self, url: str, payload: Any, retry: bool = True, **kwargs) -> Any:
+        """
+        POST com corpo JSON que devolve a resposta decodificada como JSON.
+        """
+        return self._json(self.request("POST", url, json=payload, retry=retry, **kwargs))
+
+    def _json(self, response: requests.Response) -> Any:
+        try:
+            return response.json()
+        except ValueError as e:
+            raise ApiResponseError(
+                f"{self.provider}: resposta JSON inválida ({e})",
+                self.provider, self._redact(response.url.split("?")[0]), response.status_code,
+            ) from e
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class AsyncHttpClient(_ClientBase):
+    """
+    Versão asyncio do `HttpClient` (aiohttp), com os mesmos timeouts, novas tentativas,
+    exceções tipadas e métricas.
+
+    - Uma única `aiohttp.ClientSession` por provedor, criada no primeiro uso dentro do
+      event loop. Se o cliente for usado em outro loop, a sessão anterior é fechada (ou,
+      se o loop dela já terminou, desligada do conector, que é fechado) antes da nova.
+    - Um semáforo limita as requisições em andamento a `max_concurrency`: centenas de
+      chamadas disparadas com `asyncio.gather` esperam a vez em vez de abrir centenas de
+      conexões. As esperas entre tentativas não ocupam vaga.
+    - Parâmetros de query com valor None são omitidos, como na `requests`, para que as
+      variantes assíncronas das APIs enviem exatamente as mesmas requisições.
+
+    Feche as sessões com `await close_async_clients()` antes de encerrar o event loop.
+
+    Args:
+        provider (str): Nome do provedor (usado nas mensagens e exceções).
+        base_url (str, opcional): Prefixo aplicado a caminhos relativos.
+        headers (dict, opcional): Cabeçalhos enviados em todas as requisições.
+        timeout (float | tuple): Timeout padrão (conexão, leitura).
+        max_retries (int): Novas tentativas após a primeira.
+        backoff (float): Base do backoff exponencial, em segundos.
+        max_backoff (float): Espera máxima entre tentativas, em segundos.
+        max_concurrency (int): Requisições simultâneas (e conexões abertas) com o provedor.
+        secrets (Iterable[str], opcional): Valores ocultados nas mensagens de erro.
+        retry_status (Iterable[int]): Status HTTP repetidos automaticamente.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        base_url: str = "",
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Union[float, Tuple[float, float]] = DEFAULT_TIMEOUT,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        secrets: Iterable[str] = (),
+        retry_status: Iterable[int] = RETRY_STATUS,
+    ):
+        super().__init__(provider, base_url, timeout, max_retries, backoff, max_backoff, secrets, retry_status)
+        self.headers = {"Accept": "application/json", "Accept-Encoding": "gzip, deflate", **(headers or {})}
+        self.max_concurrency = max_concurrency
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._session = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @staticmethod
+    def _client_timeout(timeout: Union[float, Tuple[float, float]]):
+        import aiohttp
+
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        return aiohttp.ClientTimeout(sock_connect=connect, sock_read=read)
+
+    def _bind(self):
+        """
+        Sessão e semáforo do event loop atual, criados na primeira requisição feita nele.
+        """
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._session is None or self._session.closed:
+            self._release(self._session, self._loop)
+            self._loop = loop
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                timeout=self._client_timeout(self.timeout),
+                connector=aiohttp.TCPConnector(limit_per_host=self.max_concurrency),
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session, self._semaphore
+
+    @staticmethod
+    def _release(session, loop) -> None:
+        """
+        Fecha a sessão de um event loop anterior, ao trocar de loop.
+        """
+        if session is None or session.closed:
+            return
+        if loop is not None and loop.is_running():
+            # O loop antigo continua rodando (em outra thread): a sessão é fechada nele
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+            return
+        # O loop antigo terminou e não há onde aguardar `session.close()`: o conector é
+        # fechado direto e a sessão é desligada dele (sem avisos de sessão não fechada)
+        connector = session.connector
+        session.detach()
+        if connector is not None:
+            connector.close()
+
+    async def request(self, method: str, url: str, retry: bool = True, **kwargs) -> bytes:
+        """
+        Executa uma requisição com timeouts e novas tentativas.
+
+        Args:
+            method (str): Método HTTP.
+            url (str): URL absoluta ou caminho relativo a `base_url`.
+            retry (bool): Se False, não repete a requisição em caso de falha.
+            **kwargs: Repassados a `aiohttp.ClientSession.request` (params, json, headers, ...);
+                `timeout` aceita o mesmo formato do construtor.
+
+        Returns:
+            bytes: Corpo de uma resposta com status de sucesso.
+
+        Raises:
+            ApiTimeoutError, ApiConnectionError, ApiRateLimitError, ApiHTTPError.
+        """
+        import aiohttp
+
+        session, semaphore = self._bind()
+        url = self._url(url)
+        if "timeout" in kwargs:
+            kwargs["timeout"] = self._client_timeout(kwargs["timeout"])
+        if kwargs.get("params"):
+            kwargs["params"] = {key: value for key, value in kwargs["params"].items() if value is not None}
+        retries = self.max_retries if retry else 0
+
+        safe_url = self._redact(url.split("?")[0])
+        endpoint = urlsplit(safe_url).path or "/"
+
+        attempt = 0
+        while True:
+            status: Optional[int] = None
+            size: Optional[int] = None
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    async with session.request(method, url, **kwargs) as response:
+                        status = response.status
+                        body = await response.read()
+                except asyncio.TimeoutError as e:
+                    kind = "timeout"
+                    error: ApiError = ApiTimeoutError(
+                        self._redact(f"{self.provider}: a solicitação expirou ({e!r})"), self.provider, safe_url
+                    )
+                except aiohttp.ClientConnectionError as e:
+                    kind = "connection"
+                    error = ApiConnectionError(self._redact(f"{self.provider}: erro de conexão ({e})"), self.provider, safe_url)
+                except aiohttp.ClientError as e:
+                    record_http(self.provider, endpoint, None, time.perf_counter() - started, error="request")
+                    raise ApiError(self._redact(f"{self.provider}: erro na solicitação ({e})"), self.provider, safe_url) from e
+                else:
+                    size = len(body)
+                    if status < 400:
+                        record_http(self.provider, endpoint, status, time.perf_counter() - started, size)
+                        return body
+                    kind = f"http_{status}"
+                    message = f"{self.provider}: HTTP {status} em {safe_url}"
+                    text = self._redact(body[:2000].decode("utf-8", "replace"))
+                    if status == 429:
+                        error = ApiRateLimitError(message, self.provider, safe_url, status, text, _retry_after(response))
+                    else:
+                        error = ApiHTTPError(message, self.provider, safe_url, status, text)
+
+            retrying = attempt < retries and (status is None or status in self.retry_status)
+            record_http(self.provider, endpoint, status, time.perf_counter() - started, size, kind, retrying)
+            if not retrying:
+                raise error
+            logger.warning(f"{error}; nova tentativa {attempt + 1}/{retries}.")
+            await asyncio.sleep(self._retry_delay(attempt, getattr(error, "retry_after", None)))
+            attempt += 1
+
+    async def get_json(self, url: str, params: Optional[Dict[str, Any]] = None, **kwargs) -> Any:
+        """
+        GET que devolve o corpo decodificado como JSON.
+
+        Raises:
+            ApiResponseError: Se o corpo não for JSON válido.
+        """
+        return self._json(await self.request("GET", url, params=params, **kwargs), url)
+
+    async def post_json(self, url: str, payload: Any, retry: bool = True, **kwargs) -> Any:
+        """
+        POST com corpo JSON que devolve a resposta decodificada como JSON.
+        """
+        return self._json(await self.request("POST", url, json=payload, retry=retry, **kwargs), url)
+
+    def _json(self, body: bytes, url: str) -> Any:
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            raise ApiResponseError(
+                f"{self.provider}: resposta JSON inválida ({e})",
+                self.provider, self._redact(self._url(url).split("?")[0]),
+            ) from e
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._loop = self._session = self._semaphore = None
+
+
+_clients: Dict[str, HttpClient] = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(provider: str, **kwargs) -> HttpClient:
+    """
+    Devolve o cliente compartilhado de um provedor, criando-o na primeira chamada.
+
+    Todos os módulos que falam com o mesmo provedor reutilizam o mesmo pool de conexões.
+    `kwargs` (base_url, headers, timeout, ...) só são usados na criação.
+    """
+    with _clients_lock:
+        client = _clients.get(provider)
+        if client is None:
+            client = _clients[provider] = HttpClient(provider, **kwargs)
+        return client
+
+
+def close_clients() -> None:
+    """
+    Fecha todas as conexões abertas pelos clientes compartilhados.
+    """
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
+_async_clients: Dict[str, AsyncHttpClient] = {}
+
+
+def get_async_client(provider: str, **kwargs) -> AsyncHttpClient:
+    """
+    Devolve o cliente assíncrono compartilhado de um provedor, criando-o na primeira chamada.
+
+    Todas as variantes assíncronas que falam com o mesmo provedor dividem a mesma sessão e
+    o mesmo limite de concorrência. `kwargs` (base_url, max_concurrency, ...) só são usados
+    na criação.
+    """
+    with _clients_lock:
+        client = _async_clients.get(provider)
+        if client is None:
+            client = _async_clients[provider] = AsyncHttpClient(provider, **kwargs)
+        return client
+
+
+async def close_async_clients() -> None:
+    """
+    Fecha as sessões abertas pelos clientes assíncronos compartilhados.
+    """
+    with _clients_lock:
+        clients = list(_async_clients.values())
+        _async_clients.clear()
+    for client in clients:
+        await client.close()
@@ -0,0 +1,3 @@
+from .balances import BalanceScanner
+from .token_cache import TokenMetadataCache
+from .token_info import decode_token_field, format_contract_info, query_contracts_info
@@ -0,0 +1,250 @@
+"""
+Leitura de `balanceOf` de muitos titulares em muitos tokens BEP-20 via Multicall3.
+
+    python -m bsc_toolkit.inspector.balances titulares.txt [--output saldos.jsonl]
+
+Os tokens são os de `BEP20_CONTRACT_ANALYSIS_*` (ou `--token`), e os titulares vêm de um
+arquivo com um endereço por linha. Cada saldo sai como uma linha JSON assim que o seu
+lote termina.
+"""
+import argparse
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice, product
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from eth_abi import encode
+from eth_utils import function_abi_to_4byte_selector
+
+from ..env import get_env
+from ..rpc import JsonRpcError, NodePool, NoHealthyNodeError, RpcTransportError
+from ..rpc.client import block_param
+from ..rpc.multicall import aggregate3_request, decode_aggregate3, safe_decode
+from .contract_analysis import load_bep20_abi
+from .token_cache import checksum_address
+
+logger = logging.getLogger(__name__)
+
+# Pares (token, titular) por eth_call agregado
+DEFAULT_BALANCE_CHUNK = 500
+
+# Um saldo: (token, titular, saldo em unidades mínimas ou None se a leitura falhou)
+Balance = Tuple[str, str, Optional[int]]
+
+# Trechos das mensagens de um eth_call que reverteu ou estourou o gás
+REVERT_ERROR_MARKERS = ("revert", "out of gas", "gas required exceeds", "gas limit")
+
+
+def is_revert_error(error: JsonRpcError) -> bool:
+    """
+    Indica se o `eth_call` falhou na execução (revert ou gás), e não por causa do nó.
+    """
+    message = str(error).lower()
+    return error.code == 3 or any(marker in message for marker in REVERT_ERROR_MARKERS)
+
+
+def balance_of_selector(abi: Optional[List[dict]] = None) -> bytes:
+    """
+    Seletor de `balanceOf(address)` a partir da ABI BEP-20 do pacote.
+    """
+    entry = next(item for item in abi or load_bep20_abi() if item.get("name") == "balanceOf")
+    return function_abi_to_4byte_selector(entry)
+
+
+class BalanceScanner:
+    """
+    Lê `balanceOf` para muitos pares (token, titular) em poucos `eth_call`.
+
+    Os pares são agrupados em lotes de `chunk_size` sub-chamadas `aggregate3` do
+    Multicall3, e os lotes são distribuídos em rodízio entre os nós saudáveis do pool,
+    com até `workers` lotes em andamento. Todas as leituras ficam fixadas no mesmo
+    bloco (por padrão, o último que todos os nós do ranking já têm), de modo que os
+    saldos são consistentes entre si. Um lote cujo nó falha é refeito pelo pool (com
+    failover); um `eth_call` agregado que reverte inteiro (ex.: limite de gás) é dividido
+    ao meio. Outros erros do nó e pares malformados falham só as suas entradas.
+
+    Os resultados são gerados à medida que os lotes terminam, sem esperar a varredura
+    inteira; `stats()` informa chamadas por segundo.
+
+    Args:
+        pool (NodePool): Pool de nós conectados.
+        chunk_size (int): Sub-chamadas por eth_call agregado.
+        workers (int, opcional): Lotes simultâneos (padrão: 2 por nó saudável).
+    """
+
+    def __init__(self, pool: NodePool, chunk_size: int = DEFAULT_BALANCE_CHUNK, workers: Optional[int] = None):
+        self.pool = pool
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.selector = balance_of_selector()
+        self.block_number: Optional[int] = None
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._requests = 0
+        self._failed = 0
+        self._started: Optional[float] = None
+        self._elapsed = 0.0
+
+    def scan(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        block_identifier: Optional[int] = None,
+    ) -> Iterator[Balance]:
+        """
+        Lê os saldos dos pares (token, titular), gerando-os conforme os lotes terminam.
+
+        Args:
+            pairs (Iterable): Pares (token, titular); consumidos aos poucos.
+            block_identifier (int, opcional): Bloco fixo das leituras (padrão: `NodePool.common_block()`).
+
+        Yields:
+            Balance: (token, titular, saldo), na ordem em que os lotes terminam.
+        """
+        nodes = self.pool.ranking()
+        if not nodes:
+            raise NoHealthyNodeError("Nenhum nó RPC saudável disponível.")
+        if block_identifier is None:
+            # Os lotes vão para todos os nós saudáveis: o bloco precisa existir em cada um
+            block_identifier = self.pool.common_block()
+        self.block_number = block_identifier
+        workers = self.workers or 2 * len(nodes)
+
+        pairs = iter(pairs)
+        chunks = iter(lambda: list(islice(pairs, self.chunk_size)), [])
+        self._started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="balance-scanner") as executor:
+            pending = set()
+            for index, chunk in enumerate(chunks):
+                # Janela limitada: os pares de entrada são consumidos conforme os lotes terminam
+                while len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield from future.result()
+                node = nodes[index % len(nodes)]
+                pending.add(executor.submit(self._read_chunk, chunk, node, block_identifier))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        self._elapsed = time.perf_counter() - self._started
+        self._started = None
+
+    def scan_product(self, tokens: Sequence[str], holders: Iterable[str],
+                     block_identifier: Optional[int] = None) -> Iterator[Balance]:
+        """
+        `scan` de todos os tokens para cada titular.
+        """
+        return self.scan(((token, holder) for holder, token in product(holders, tokens)), block_identifier)
+
+    def _read_chunk(self, chunk: List[Tuple[str, str]], node, block_identifier: int) -> List[Balance]:
+        # Pares malformados (ex.: uma linha inválida no arquivo de titulares) falham sozinhos
+        pairs, calls, balances = [], [], []
+        for token, holder in chunk:
+            try:
+                calls.append((checksum_address(token),
+                              self.selector + encode(["address"], [checksum_address(holder)])))
+            except (ValueError, TypeError) as e:
+                logger.error(f"Par inválido ({token}, {holder}): {e}")
+                balances.append((token, holder, None))
+                continue
+            pairs.append((token, holder))
+        if balances:
+            with self._lock:
+                self._calls += len(balances)
+                self._failed += len(balances)
+        if pairs:
+            balances.extend(self._read_calls(pairs, calls, node, block_identifier))
+        return balances
+
+    def _read_calls(self, pairs: List[Tuple[str, str]], calls: List[Tuple[str, bytes]], node,
+                    block_identifier: int) -> List[Balance]:
+        request = ["eth_call", [aggregate3_request(calls), block_param(block_identifier)]]
+        try:
+            try:
+                with self._lock:
+                    self._requests += 1
+                reply = node.client.call(*request)
+            except RpcTransportError as e:
+                logger.warning(f"Lote de {len(pairs)} saldos falhou em {node.url} ({e}); usando o pool.")
+                with self._lock:
+                    self._requests += 1
+                reply = self.pool.call(*request)
+            results = decode_aggregate3(reply)
+        except (JsonRpcError, ValueError) as e:
+            # Só um eth_call agregado que reverte inteiro (ex.: limite de gás) é dividido; outros
+            # erros (bloco inexistente no nó, limite de requisições, transporte) falhariam em cada metade
+            if len(pairs) > 1 and isinstance(e, JsonRpcError) and is_revert_error(e):
+                middle = len(pairs) // 2
+                return (self._read_calls(pairs[:middle], calls[:middle], node, block_identifier)
+                        + self._read_calls(pairs[middle:], calls[middle:], node, block_identifier))
+            logger.error(f"Falha ao ler {len(pairs)} saldos: {e}")
+            results = [(False, b"")] * len(pairs)
+
+        balances = []
+        failed = 0
+        for (token, holder), (success, data) in zip(pairs, results):
+            decoded = safe_decode(["uint256"], data) if success else None
+            balances.append((token, holder, decoded[0] if decoded else None))
+            failed += decoded is None
+        with self._lock:
+            self._calls += len(pairs)
+            self._failed += failed
+        return balances
+
+    def stats(self) -> Dict:
+        """
+        Sub-chamadas lidas, requisições, falhas, duração e chamadas por segundo (da varredura atual ou da última).
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._started if self._started else self._elapsed
+            return {
+                "block_number": self.block_number,
+                "calls": self._calls,
+                "requests": self._requests,
+                "failed": self._failed,
+                "seconds": elapsed,
+                "calls_per_second": self._calls / elapsed if elapsed else 0.0,
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("holders", help="Arquivo com um endereço de titular por linha")
+    parser.add_argument("--token", action="append", help="Token a consultar (repetível); padrão: BEP20_CONTRACT_ANALYSIS_*")
+    parser.add_argument("--output", help="Arquivo JSON Lines de saída (padrão: saída padrão)")
+    parser.add_argument("--block", type=int, help="Bloco das leituras (padrão: o último)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_BALANCE_CHUNK, help="Sub-chamadas por eth_call")
+    args = parser.parse_args()
+
+    tokens = args.token or [
+        address for address in (get_env(f"BEP20_CONTRACT_ANALYSIS_{i}") for i in range(1, 7)) if address
+    ]
+    with open(args.holders) as file:
+        holders = [line.strip() for line in file if line.strip()]
+
+    scanner = BalanceScanner(NodePool(), chunk_size=args.chunk_size)
+    output = open(args.output, "w") if args.output else sys.stdout
+    try:
+        last_report = time.monotonic()
+        for token, holder, balance in scanner.scan_product(tokens, holders, args.block):
+            output.write(json.dumps({"token": token, "holder": holder, "balance": balance,
+                                     "block": scanner.block_number}) + "\n")
+            if time.monotonic() - last_report >= 5:
+                stats = scanner.stats()
+                print(f"{stats['calls']} saldos, {stats['calls_per_second']:,.0f} chamadas/s", file=sys.stderr)
+                last_report = time.monotonic()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    stats = scanner.stats()
+    print(f"{stats['calls']} saldos no bloco {stats['block_number']} em {stats['seconds']:.2f}s "
+          f"({stats['calls_per_second']:,.0f} chamadas/s, {stats['requests']} requisições, "
+          f"{stats['failed']} falhas)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import json
+from functools import lru_cache
+from pathlib import Path
+
+from ..env import get_env
+from ..rpc import NodePool
+from .token_cache import TokenMetadataCache, checksum_address
+from .token_info import format_contract_info, query_contracts_info
+
+# ABI BEP-20 distribuída junto com o pacote (independe do diretório atual)
+BEP20_ABI_PATH = Path(__file__).resolve().parent / "bep20_contract.abi"
+
+@lru_cache(maxsize=None)
+def load_bep20_abi(path=BEP20_ABI_PATH):
+    """
+    Lê a ABI BEP-20 no primeiro uso e a reutiliza nas chamadas seguintes.
+    """
+    with open(path, 'r') as abi_file:
+        return json.load(abi_file)
+
+def connect_to_node(node_urls):
+    """
+    Função para sondar em paralelo, com prazo máximo, todos os nós RPC da lista.
+    Retorna o pool de nós ordenado por latência e atraso de blocos, com failover automático.
+    """
+    node_pool = NodePool(node_urls)
+    node_pool.probe()
+    for node in node_pool.nodes:
+        if node.healthy:
+            print(f"Connected to {node.url}. Latest Block Number: {node.latest_block} ({node.latency * 1000:.0f} ms)")
+        else:
+            print(f"Failed to connect to {node.url}: {node.error}")
+    return node_pool
+
+def query_contract_info(contract_address, web3, default_account, contract_abi=None, cache=None):
+    """
+    Consulta informações sobre um contrato BEP-20.
+    Retorna um dicionário com os detalhes do contrato ou None em caso de erro.
+    Sem `contract_abi`, usa a ABI BEP-20 do pacote.
+    Com um `TokenMetadataCache` (`cache`), um token conhecido não faz nenhuma chamada
+    enquanto o totalSupply estiver válido; depois disso, só o totalSupply é relido (junto
+    com o número do bloco, em uma única requisição em lote).
+    """
+    contract_abi = contract_abi or load_bep20_abi()
+    try:
+        entry = cache.get_many([contract_address]).get(checksum_address(contract_address)) if cache else None
+        if entry and entry["supply_fresh"]:
+            return format_contract_info(
+                contract_address, entry["symbol"], entry["name"], entry["decimals"], entry["total_supply"]
+            )
+
+        # Estabelecendo a conexão com o contrato
+        contract = web3.eth.contract(address=contract_address, abi=contract_abi)
+
+        if cache is not None:
+            # Leituras e número do bloco em uma única requisição; o bloco é gravado com o totalSupply
+            fields = ["totalSupply"] if entry else ["symbol", "name", "decimals", "totalSupply"]
+            with web3.batch_requests() as batch:
+                batch.add(web3.eth.get_block_number())
+                for field in fields:
+                    batch.add(getattr(contract.functions, field)())
+                block_number, *values = batch.execute()
+            values = dict(zip(fields, values))
+            if entry:
+                cache.store_supplies({contract_address: values["totalSupply"]}, block_number)
+                values.update(symbol=entry["symbol"], name=entry["name"], decimals=entry["decimals"])
+            else:
+                cache.store([dict(values, address=contract_address)], block_number)
+            return format_contract_info(
+                contract_address, values["symbol"], values["name"], values["decimals"], values["totalSupply"]
+            )
+
+        # Consultando informações do contrato
+        symbol = contract.functions.symbol().call()
+        name = contract.functions.name().call()
+        decimals = contract.functions.decimals().call()
+        total_supply = contract.functions.totalSupply().call()
+        token_type = "Fungível"  # Assumindo que todos os tokens são fungíveis
+
+        # Formatando as informações de oferta total
+        total_supply_formatted = f"{total_supply:,} {symbol}"
+
+        # Retornando informações do contrato como um dicionário
+        return {
+            "symbol": symbol,
+            "name": name,
+            "contract_address": contract_address,
+            "decimals": decimals,
+            "total_supply": total_supply_formatted,
+            "token_type": token_type
+        }
+    except Exception as e:
+        print(f"Error querying contract {contract_address}: {e}")
+        return None
+
+# Ponto de entrada de linha de comando: inspeção dos contratos configurados no .env
+def main():
+    # Definir constantes e variáveis
+    # Lista de URLs dos nós RPC
+    node_urls = [
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_1"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_2"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_3"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_4"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_5"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_6"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_7"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_8"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_9"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_10"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_11"),
+        get_env("BINANCE_SMART_CHAIN_MAINNET_NODE_URL_12")
+    ]
+
+    default_account = get_env("MAINNET_DEFAULT_ACCOUNT")
+    private_key = get_env("MAINNET_PRIVATE_KEY")
+    contract_address = get_env("MAINNET_CONTRACT_ADDRESS")
+
+    # Lista de destinatários
+    contract_addresses = [    
+        get_env("BEP20_CONTRACT_ANALYSIS_1"), 
+        get_env("BEP20_CONTRACT_ANALYSIS_2"), 
+        get_env("BEP20_CONTRACT_ANALYSIS_3"), 
+        get_env("BEP20_CONTRACT_ANALYSIS_4"), 
+        get_env("BEP20_CONTRACT_ANALYSIS_5"), 
+        get_env("BEP20_CONTRACT_ANALYSIS_6")    
+    ]
+
+
+    gwei_to_usd = 0.000000001
+
+    node_pool = connect_to_node(node_urls)
+    connections = node_pool.connections()
+
+    if connections:
+        print("-" * 50)
+        print("Connection Successful")
+        print("Connected to the following nodes:")
+        for connection in connections:
+            print("URL:", connection["url"])
+            print("Latest Block Number:", connection["latest_block"])
+            print("-" * 50)
+    else:
+        print("No successful connections established.")
+
+    for connection_info in connections:
+        if connection_info:
+            print("-" * 50)
+            print("Connection Successful")
+            print("Connected to:", connection_info["url"])
+            print("Latest Block Number:", connection_info["latest_block"])
+            print("-" * 50)
+            web3 = connection_info["web3"]
+            break
+    else:
+        print("No successful connections established.")
+
+    # Consulta de todos os contratos em lote (Multicall3 + JSON-RPC batch) no melhor nó do pool;
+    # name, symbol e decimals de tokens já inspecionados vêm do cache em disco
+    with TokenMetadataCache(get_env("TOKEN_METADATA_CACHE", "token_metadata.sqlite3")) as cache:
+        contracts_info = query_contracts_info(contract_addresses, node_pool, cache=cache)
+
+    for address, contract_info in zip(contract_addresses, contracts_info):
+        if contract_info:
+            print("-" * 50)
+            print(f"Contract Address: {contract_info['contract_address']}")
+            print(f"Name: {contract_info['name']}")
+            print(f"Symbol: {contract_info['symbol']}")
+            print(f"Decimals: {contract_info['decimals']}")
+            print(f"Total Supply: {contract_info['total_supply']}")
+            print(f"Token Type: {contract_info['token_type']}")
+            print("-" * 50)
+        else:
+            print(f"Failed to query contract {address}")
+
+if __name__ == "__main__":
+    main()
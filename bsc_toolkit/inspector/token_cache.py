@@ -0,0 +1,157 @@
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Sequence
+
+from eth_utils import to_checksum_address
+
+BSC_CHAIN_ID = 56
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS token_metadata (
+    chain_id INTEGER NOT NULL,
+    address TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    name TEXT NOT NULL,
+    decimals INTEGER NOT NULL,
+    total_supply TEXT,
+    supply_block INTEGER,
+    supply_time REAL,
+    PRIMARY KEY (chain_id, address)
+) WITHOUT ROWID
+"""
+
+
+@lru_cache(maxsize=65536)
+def checksum_address(address: str) -> str:
+    """
+    `to_checksum_address` com memória: o keccak do checksum dominaria uma consulta ao cache.
+    """
+    return to_checksum_address(address)
+
+
+class TokenMetadataCache:
+    """
+    Cache persistente (SQLite) dos metadados de contratos BEP-20.
+
+    `name`, `symbol` e `decimals` não mudam depois que o contrato é implantado e ficam
+    guardados para sempre; `totalSupply` é guardado com o número do bloco em que foi
+    lido e o momento da leitura, e deixa de valer após `max_supply_age` segundos.
+    A chave é (chain id, endereço em checksum), então o mesmo arquivo pode servir a
+    mais de uma rede. O total supply é gravado como texto (uint256 não cabe no INTEGER
+    do SQLite).
+
+    Args:
+        path (str): Arquivo do banco (criado se não existir; ":memory:" para testes).
+        chain_id (int): Rede das entradas (padrão: BSC mainnet).
+        max_supply_age (float): Idade máxima do totalSupply, em segundos.
+    """
+
+    def __init__(self, path: str = "token_metadata.sqlite3", chain_id: int = BSC_CHAIN_ID,
+                 max_supply_age: float = 300.0):
+        self.path = path
+        self.chain_id = chain_id
+        self.max_supply_age = max_supply_age
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(SCHEMA)
+        self._connection.commit()
+
+    def get_many(self, addresses: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Entradas conhecidas entre `addresses`, por endereço em checksum.
+
+        Cada entrada tem symbol, name, decimals, total_supply (int ou None),
+        supply_block, supply_time e supply_fresh (se o totalSupply ainda vale).
+        """
+        addresses = list(dict.fromkeys(checksum_address(address) for address in addresses))
+        rows = []
+        with self._lock:
+            # Consultas em blocos, abaixo do limite de parâmetros do SQLite
+            for start in range(0, len(addresses), 500):
+                chunk = addresses[start:start + 500]
+                rows.extend(self._connection.execute(
+                    "SELECT address, symbol, name, decimals, total_supply, supply_block, supply_time "
+                    f"FROM token_metadata WHERE chain_id = ? AND address IN ({','.join('?' * len(chunk))})",
+                    [self.chain_id, *chunk],
+                ).fetchall())
+
+        now = time.time()
+        entries = {}
+        for address, symbol, name, decimals, total_supply, supply_block, supply_time in rows:
+            entries[address] = {
+                "symbol": symbol,
+                "name": name,
+                "decimals": decimals,
+                "total_supply": int(total_supply) if total_supply is not None else None,
+                "supply_block": supply_block,
+                "supply_time": supply_time,
+                "supply_fresh": total_supply is not None and supply_time is not None
+                and now - supply_time <= self.max_supply_age,
+            }
+        return entries
+
+    def store(self, tokens: Sequence[Dict], block_number: Optional[int] = None) -> None:
+        """
+        Grava os metadados completos de vários tokens (symbol, name, decimals e totalSupply).
+
+        Args:
+            tokens (Sequence[dict]): Dicionários com address, symbol, name, decimals e totalSupply
+                (None quando o totalSupply não deve ser gravado).
+            block_number (int, opcional): Bloco em que o totalSupply foi lido.
+        """
+        now = time.time()
+        rows = [
+            (self.chain_id, checksum_address(token["address"]), token["symbol"], token["name"], token["decimals"],
+             *((str(token["totalSupply"]), block_number, now) if token.get("totalSupply") is not None
+               else (None, None, None)))
+            for token in tokens
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO token_metadata VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows,
+            )
+            self._connection.commit()
+
+    def store_supplies(self, supplies: Dict[str, int], block_number: Optional[int] = None) -> None:
+        """
+        Atualiza apenas o totalSupply (e seu bloco) de tokens já conhecidos.
+        """
+        now = time.time()
+        rows = [
+            (str(total_supply), block_number, now, self.chain_id, checksum_address(address))
+            for address, total_supply in supplies.items()
+        ]
+        with self._lock:
+            self._connection.executemany(
+                "UPDATE token_metadata SET total_supply = ?, supply_block = ?, supply_time = ? "
+                "WHERE chain_id = ? AND address = ?", rows,
+            )
+            self._connection.commit()
+
+    def invalidate(self, addresses: Optional[Iterable[str]] = None) -> None:
+        """
+        Remove entradas da rede do cache: todas ou as de alguns endereços.
+        """
+        with self._lock:
+            if addresses is None:
+                self._connection.execute("DELETE FROM token_metadata WHERE chain_id = ?", (self.chain_id,))
+            else:
+                self._connection.executemany(
+                    "DELETE FROM token_metadata WHERE chain_id = ? AND address = ?",
+                    [(self.chain_id, checksum_address(address)) for address in addresses],
+                )
+            self._connection.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "TokenMetadataCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,270 @@
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+from eth_abi import decode
+from eth_utils import function_signature_to_4byte_selector, is_address, to_checksum_address
+
+from ..rpc.client import JsonRpcClient, JsonRpcError, RpcTransportError, block_param
+from ..rpc.multicall import aggregate3_request, decode_aggregate3
+from ..rpc.node_pool import NodePool
+from .token_cache import TokenMetadataCache, checksum_address
+
+logger = logging.getLogger(__name__)
+
+# Campos lidos de cada contrato BEP-20, na ordem das sub-chamadas
+TOKEN_FIELDS = ("symbol", "name", "decimals", "totalSupply")
+FIELD_CALLDATA = {field: function_signature_to_4byte_selector(f"{field}()") for field in TOKEN_FIELDS}
+
+# Quantidade de tokens por eth_call agregado (4 sub-chamadas por token)
+DEFAULT_MULTICALL_CHUNK = 200
+# Quantidade de tokens por requisição JSON-RPC batch (4 eth_call por token)
+DEFAULT_BATCH_CHUNK = 50
+# Quantidade de eth_call agregados enviados juntos em uma requisição HTTP
+DEFAULT_REQUESTS_PER_BATCH = 10
+
+
+def format_contract_info(contract_address: str, symbol: str, name: str, decimals: int, total_supply: int) -> Dict:
+    """
+    Monta o dicionário de detalhes de um contrato no mesmo formato de `query_contract_info`.
+    """
+    return {
+        "symbol": symbol,
+        "name": name,
+        "contract_address": contract_address,
+        "decimals": decimals,
+        "total_supply": f"{total_supply:,} {symbol}",
+        "token_type": "Fungível",  # Assumindo que todos os tokens são fungíveis
+    }
+
+
+def decode_token_field(field: str, data: Union[bytes, str]) -> Any:
+    """
+    Decodifica o retorno de uma das funções de `TOKEN_FIELDS`.
+
+    Tokens antigos/não conformes às vezes devolvem `bytes32` em `symbol`/`name`
+    em vez de `string`; esse formato também é aceito.
+
+    Raises:
+        ValueError: Se o retorno estiver vazio ou não puder ser decodificado.
+    """
+    if isinstance(data, str):
+        data = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    if not data:
+        raise ValueError(f"{field}() retornou vazio (o endereço é um contrato BEP-20?)")
+
+    try:
+        if field in ("symbol", "name"):
+            if len(data) == 32:
+                return data.rstrip(b"\x00").decode("utf-8", errors="replace")
+            return decode(["string"], data)[0]
+        (value,) = decode(["uint256"], data)
+    except Exception as e:
+        raise ValueError(f"Retorno inválido de {field}(): {e}") from e
+
+    if field == "decimals" and value > 255:
+        raise ValueError(f"decimals() fora do intervalo de uint8: {value}")
+    return value
+
+
+def query_contracts_info(
+    contract_addresses: Sequence[Optional[str]],
+    rpc: JsonRpcClient,
+    method: str = "multicall",
+    chunk_size: Optional[int] = None,
+    block_identifier: Union[str, int] = "latest",
+    requests_per_batch: int = DEFAULT_REQUESTS_PER_BATCH,
+    cache: Optional[TokenMetadataCache] = None,
+) -> List[Optional[Dict]]:
+    """
+    Consulta symbol, name, decimals e totalSupply de vários contratos BEP-20 em poucas requisições.
+
+    Dois modos estão disponíveis:
+      - "multicall": as leituras de `chunk_size` tokens viram um único `eth_call` ao
+        Multicall3 (`aggregate3` com `allowFailure`), e vários desses `eth_call` seguem
+        juntos em uma requisição JSON-RPC batch;
+      - "batch": cada leitura é um `eth_call` próprio, agrupado em requisições JSON-RPC batch.
+
+    Um contrato que reverte ou não segue o padrão falha apenas a sua própria entrada.
+    Se um `eth_call` agregado inteiro falhar, seus tokens são refeitos no modo "batch".
+
+    Com um `TokenMetadataCache`, tokens conhecidos não são lidos de novo: name, symbol e
+    decimals vêm do cache e só o totalSupply vencido é relido (uma chamada por token).
+    As leituras ficam fixadas no bloco atual (com um `NodePool`, o último que todos os nós
+    do ranking já têm), que é gravado junto com o totalSupply; se o bloco não puder ser
+    obtido, as leituras usam `block_identifier` e o totalSupply não é gravado.
+
+    Args:
+        contract_addresses (Sequence[str]): Endereços dos contratos.
+        rpc (JsonRpcClient | NodePool): Cliente do nó RPC ou pool de nós.
+        method (str): "multicall" ou "batch".
+        chunk_size (int, opcional): Tokens por agregação/lote.
+        block_identifier (str | int): Bloco em que as leituras são feitas.
+        requests_per_batch (int): `eth_call` agregados por requisição HTTP (modo "multicall").
+        cache (TokenMetadataCache, opcional): Cache persistente de metadados.
+
+    Returns:
+        list: Para cada endereço, o dicionário de `format_contract_info` ou None em caso de erro.
+    """
+    if method not in ("multicall", "batch"):
+        raise ValueError(f"Método de consulta inválido: {method}")
+
+    valid: List[int] = []
+    for index, address in enumerate(contract_addresses):
+        if address and is_address(address):
+            valid.append(index)
+        else:
+            logger.error(f"Error querying contract {address}: endereço inválido")
+
+    known = cache.get_many(contract_addresses[i] for i in valid) if cache is not None else {}
+    values: List[Optional[Dict]] = [None] * len(contract_addresses)
+    full: List[int] = []
+    supply_only: List[int] = []
+    for i in valid:
+        entry = known.get(checksum_address(contract_addresses[i]))
+        if entry is None:
+            full.append(i)
+            continue
+        values[i] = {field: entry[field] for field in ("symbol", "name", "decimals")}
+        if entry["supply_fresh"]:
+            values[i]["totalSupply"] = entry["total_supply"]
+        else:
+            supply_only.append(i)
+
+    pinned = isinstance(block_identifier, int)
+    if cache is not None and (full or supply_only) and not pinned:
+        # O bloco da leitura é gravado junto com o totalSupply; com um pool, as leituras podem
+        # ir para qualquer nó do ranking, então o bloco precisa existir em todos
+        try:
+            if isinstance(rpc, NodePool):
+                block_identifier = rpc.common_block()
+            else:
+                block_identifier = int(rpc.call("eth_blockNumber"), 16)
+            pinned = True
+        except JsonRpcError as e:
+            logger.warning(f"Não foi possível fixar o bloco das leituras ({e}); usando '{block_identifier}'.")
+
+    fetched: List[Optional[Dict]] = [None] * len(contract_addresses)
+    for indexes, fields in ((full, TOKEN_FIELDS), (supply_only, ("totalSupply",))):
+        if not indexes:
+            continue
+        if method == "batch":
+            _query_batch(contract_addresses, indexes, fields, rpc, chunk_size or DEFAULT_BATCH_CHUNK,
+                         block_identifier, fetched)
+        else:
+            _query_multicall(
+                contract_addresses, indexes, fields, rpc, chunk_size or DEFAULT_MULTICALL_CHUNK,
+                block_identifier, requests_per_batch, fetched,
+            )
+
+    for i in full:
+        values[i] = fetched[i]
+    for i in supply_only:
+        # Sem o totalSupply atual, o token falha como falharia sem o cache
+        values[i] = dict(values[i], totalSupply=fetched[i]["totalSupply"]) if fetched[i] is not None else None
+
+    if cache is not None and pinned:
+        cache.store([dict(values[i], address=contract_addresses[i]) for i in full if values[i] is not None],
+                    block_identifier)
+        cache.store_supplies({contract_addresses[i]: values[i]["totalSupply"]
+                              for i in supply_only if values[i] is not None}, block_identifier)
+    elif cache is not None:
+        # Sem bloco fixo, o totalSupply lido não tem bloco conhecido: só os metadados são gravados
+        cache.store([dict(values[i], address=contract_addresses[i], totalSupply=None)
+                     for i in full if values[i] is not None])
+
+    return [
+        format_contract_info(contract_addresses[i], v["symbol"], v["name"], v["decimals"], v["totalSupply"])
+        if (v := values[i]) is not None else None
+        for i in range(len(contract_addresses))
+    ]
+
+
+def _chunks(items: List[int], size: int) -> List[List[int]]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _safe_batch(rpc: JsonRpcClient, calls: List) -> List:
+    """
+    Envia um lote; se a requisição HTTP inteira falhar, cada chamada recebe o mesmo erro.
+    """
+    try:
+        return rpc.batch(calls)
+    except RpcTransportError as e:
+        return [e] * len(calls)
+
+
+def _decode_values(address: str, fields: Sequence[str], raw: Sequence[Union[bytes, str, Exception]]) -> Optional[Dict]:
+    """
+    Decodifica os retornos brutos de um token ({campo: valor}), ou None (com log) em caso de falha.
+    """
+    try:
+        values = {}
+        for field, data in zip(fields, raw):
+            if isinstance(data, Exception):
+                raise ValueError(f"{field}() falhou: {data}")
+            values[field] = decode_token_field(field, data)
+    except ValueError as e:
+        logger.error(f"Error querying contract {address}: {e}")
+        return None
+    return values
+
+
+def _query_batch(addresses, indexes, fields, rpc, chunk_size, block_identifier, results) -> None:
+    block = block_param(block_identifier)
+    for chunk in _chunks(indexes, chunk_size):
+        calls = [
+            ("eth_call", [{"to": to_checksum_address(addresses[i]), "data": "0x" + FIELD_CALLDATA[field].hex()}, block])
+            for i in chunk
+            for field in fields
+        ]
+        replies = _safe_batch(rpc, calls)
+        for position, i in enumerate(chunk):
+            raw = replies[position * len(fields):(position + 1) * len(fields)]
+            results[i] = _decode_values(addresses[i], fields, raw)
+
+
+def _query_multicall(addresses, indexes, fields, rpc, chunk_size, block_identifier, requests_per_batch,
+                     results) -> None:
+    block = block_param(block_identifier)
+    chunks = _chunks(indexes, chunk_size)
+    failed: List[int] = []
+
+    for group in _chunks(list(range(len(chunks))), max(1, requests_per_batch)):
+        calls = []
+        for c in group:
+            subcalls = [
+                (addresses[i], FIELD_CALLDATA[field])
+                for i in chunks[c]
+                for field in fields
+            ]
+            calls.append(("eth_call", [aggregate3_request(subcalls), block]))
+        try:
+            replies = rpc.batch(calls)
+        except RpcTransportError as e:
+            for c in group:
+                for i in chunks[c]:
+                    logger.error(f"Error querying contract {addresses[i]}: {e}")
+            continue
+
+        for c, reply in zip(group, replies):
+            chunk = chunks[c]
+            decoded = None
+            if not isinstance(reply, JsonRpcError):
+                try:
+                    decoded = decode_aggregate3(reply)
+                except Exception as e:
+                    reply = JsonRpcError(f"Retorno inválido do Multicall3: {e}")
+            if decoded is None or len(decoded) != len(chunk) * len(fields):
+                logger.warning(f"Multicall3 falhou para {len(chunk)} contratos ({reply}); repetindo em modo batch.")
+                failed.extend(chunk)
+                continue
+
+            for position, i in enumerate(chunk):
+                raw = [
+                    data if success else JsonRpcError("execution reverted")
+                    for success, data in decoded[position * len(fields):(position + 1) * len(fields)]
+                ]
+                results[i] = _decode_values(addresses[i], fields, raw)
+
+    if failed:
+        _query_batch(addresses, failed, fields, rpc, DEFAULT_BATCH_CHUNK, block_identifier, results)
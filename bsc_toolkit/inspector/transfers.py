@@ -0,0 +1,435 @@
+"""
+Indexador dos eventos `Transfer` dos tokens BEP-20 analisados pelo Inspetor.
+
+Busca `eth_getLogs` em faixas de blocos distribuídas entre os nós do pool, decodifica os
+eventos em lote e os grava em um armazenamento colunar local, append-only, com um
+checkpoint por contrato: execuções seguintes buscam apenas os blocos novos.
+
+    python -m bsc_toolkit.inspector.transfers --store transfer_logs --from-block 20000000 [contratos]
+
+Sem contratos na linha de comando, indexa os de `BEP20_CONTRACT_ANALYSIS_*`.
+"""
+import argparse
+import json
+import logging
+import mmap
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..env import get_env
+from ..rpc import JsonRpcError, NodePool, NoHealthyNodeError, RpcTransportError
+from .token_cache import checksum_address
+
+logger = logging.getLogger(__name__)
+
+# keccak("Transfer(address,address,uint256)")
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# Coluna -> (tipo NumPy, bytes por linha); endereços, hashes e valores ficam como bytes brutos
+TRANSFER_COLUMNS: Dict[str, Tuple[type, int]] = {
+    "block_number": (np.int64, 1),
+    "log_index": (np.int64, 1),
+    "tx_hash": (np.uint8, 32),
+    "sender": (np.uint8, 20),
+    "recipient": (np.uint8, 20),
+    "value": (np.uint8, 32),
+}
+
+# Blocos por eth_getLogs (limite inicial; é reduzido quando o nó recusa a faixa)
+DEFAULT_LOG_RANGE = 2000
+
+# Blocos recentes deixados de fora, para não gravar eventos que ainda podem ser revertidos
+DEFAULT_CONFIRMATIONS = 15
+
+# Trechos das mensagens com que os nós recusam uma faixa grande demais ou com eventos demais
+RANGE_ERROR_MARKERS = ("more than", "too many", "limit exceeded", "block range", "range is too",
+                       "response size", "too large")
+
+
+def is_range_error(error: JsonRpcError) -> bool:
+    """
+    Indica se o nó recusou o `eth_getLogs` pelo tamanho da faixa ou da resposta.
+    """
+    message = str(error).lower()
+    return error.code == -32005 or any(marker in message for marker in RANGE_ERROR_MARKERS)
+
+
+def decode_transfer_logs(logs: Sequence[dict]) -> Dict[str, np.ndarray]:
+    """
+    Decodifica eventos `Transfer` em colunas, de uma vez para todos os eventos.
+
+    Os tópicos e dados hexadecimais são concatenados e convertidos com um único
+    `bytes.fromhex` por campo. Eventos que não seguem o formato BEP-20 (ex.: valor
+    indexado, como no ERC-721) são descartados.
+
+    Returns:
+        dict: {coluna: array}, com as colunas de `TRANSFER_COLUMNS`.
+    """
+    logs = [log for log in logs if len(log["topics"]) == 3 and len(log["data"]) == 66 and not log.get("removed")]
+    count = len(logs)
+
+    def raw(values: Iterator[str], width: int) -> np.ndarray:
+        return np.frombuffer(bytes.fromhex("".join(values)), dtype=np.uint8).reshape(count, width)
+
+    return {
+        "block_number": np.array([int(log["blockNumber"], 16) for log in logs], dtype=np.int64),
+        "log_index": np.array([int(log["logIndex"], 16) for log in logs], dtype=np.int64),
+        "tx_hash": raw((log["transactionHash"][2:] for log in logs), 32),
+        "sender": raw((log["topics"][1][2:] for log in logs), 32)[:, 12:],
+        "recipient": raw((log["topics"][2][2:] for log in logs), 32)[:, 12:],
+        "value": raw((log["data"][2:] for log in logs), 32),
+    }
+
+
+def token_amounts(values: np.ndarray, decimals: int = 18) -> np.ndarray:
+    """
+    Converte a coluna `value` (uint256 big-endian, 32 bytes por linha) em float64 com `decimals` casas.
+    """
+    words = np.ascontiguousarray(values).view(">u8").astype(np.float64)
+    scale = 2.0 ** (64 * np.arange(3, -1, -1))
+    return words @ scale / 10.0 ** decimals
+
+
+def format_addresses(addresses: np.ndarray) -> List[str]:
+    """
+    Converte uma coluna de endereços (20 bytes por linha) em strings hexadecimais.
+    """
+    return ["0x" + row.tobytes().hex() for row in addresses]
+
+
+class TransferLogStore:
+    """
+    Armazenamento colunar, append-only, dos eventos `Transfer` de vários contratos.
+
+    Cada contrato tem um diretório com um arquivo por coluna e um `meta.json` com a
+    quantidade de linhas confirmadas e o checkpoint (`next_block`, o primeiro bloco
+    ainda não indexado). Como no `PairHistoryStore`, os dados são gravados antes do
+    `meta.json` (substituído com `os.replace`); uma gravação interrompida deixa apenas
+    bytes a mais no fim das colunas, truncados na gravação seguinte.
+
+    Args:
+        path (str): Diretório do armazenamento (criado se não existir).
+    """
+
+    def __init__(self, path: str = "transfer_logs"):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._meta: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _contract_dir(self, address: str) -> Path:
+        return self.path / address.lower()
+
+    def _load_meta(self, address: str) -> dict:
+        address = address.lower()
+        meta = self._meta.get(address)
+        if meta is None:
+            try:
+                with open(self._contract_dir(address) / "meta.json") as file:
+                    meta = json.load(file)
+            except FileNotFoundError:
+                meta = {"address": address, "rows": 0, "next_block": None}
+            self._meta[address] = meta
+        return meta
+
+    def contracts(self) -> List[str]:
+        """
+        Endereços (em minúsculas) dos contratos com checkpoint gravado.
+        """
+        return sorted(entry.name for entry in self.path.iterdir() if (entry / "meta.json").exists())
+
+    def next_block(self, address: str) -> Optional[int]:
+        """
+        Checkpoint de um contrato: primeiro bloco ainda não indexado (None se nunca indexado).
+        """
+        with self._lock:
+            return self._load_meta(address)["next_block"]
+
+    def rows(self, address: str) -> int:
+        with self._lock:
+            return self._load_meta(address)["rows"]
+
+    def append(self, address: str, columns: Dict[str, np.ndarray], next_block: int) -> int:
+        """
+        Acrescenta eventos decodificados e avança o checkpoint do contrato.
+
+        Args:
+            address (str): Contrato.
+            columns (dict): Colunas de `decode_transfer_logs` (em ordem de bloco).
+            next_block (int): Novo checkpoint (bloco seguinte ao último indexado).
+
+        Returns:
+            int: Quantidade de eventos gravados.
+        """
+        count = len(columns["block_number"])
+        with self._lock:
+            meta = self._load_meta(address)
+            directory = self._contract_dir(address)
+            directory.mkdir(exist_ok=True)
+            if count:
+                for column, (dtype, width) in TRANSFER_COLUMNS.items():
+                    with open(_column_file(directory, column), "ab") as file:
+                        file.truncate(meta["rows"] * np.dtype(dtype).itemsize * width)
+                        file.write(np.ascontiguousarray(columns[column], dtype=dtype).tobytes())
+
+            meta = dict(meta, rows=meta["rows"] + count, next_block=next_block)
+            temporary = directory / "meta.json.tmp"
+            with open(temporary, "w") as file:
+                json.dump(meta, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, directory / "meta.json")
+            self._meta[address.lower()] = meta
+        return count
+
+    def read(self, address: str, columns: Optional[Sequence[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Eventos de um contrato como arrays somente leitura mapeados do disco (sem cópia).
+
+        Returns:
+            dict: {coluna: array}; colunas de bytes têm forma (eventos, bytes por linha).
+        """
+        with self._lock:
+            rows = self._load_meta(address)["rows"]
+        directory = self._contract_dir(address)
+        series = {}
+        for column in columns or TRANSFER_COLUMNS:
+            dtype, width = TRANSFER_COLUMNS[column]
+            dtype = np.dtype(dtype)
+            shape = (rows, width) if width > 1 else (rows,)
+            if rows:
+                with open(_column_file(directory, column), "rb") as file:
+                    buffer = mmap.mmap(file.fileno(), rows * dtype.itemsize * width, access=mmap.ACCESS_READ)
+                series[column] = np.frombuffer(buffer, dtype=dtype, count=rows * width).reshape(shape)
+            else:
+                series[column] = np.empty(shape, dtype=dtype)
+        return series
+
+    def refresh(self) -> None:
+        """
+        Esquece os metadados em memória (ex.: depois que outro processo gravou no diretório).
+        """
+        with self._lock:
+            self._meta.clear()
+
+
+def _column_file(directory: Path, column: str) -> str:
+    dtype = np.dtype(TRANSFER_COLUMNS[column][0])
+    return os.path.join(directory, f"{column}.{dtype.kind}{dtype.itemsize}")
+
+
+class TransferIndexer:
+    """
+    Indexa os eventos `Transfer` de vários contratos em paralelo entre os nós do pool.
+
+    Os blocos de cada contrato, do checkpoint até `confirmations` blocos antes do
+    último, são divididos em faixas de até `range_size` blocos, distribuídas em rodízio
+    entre os nós saudáveis (um nó que cai é substituído pelo failover do pool). Quando
+    um nó recusa uma faixa (eventos ou blocos demais), ela é dividida ao meio até
+    passar, e as faixas seguintes daquele contrato já partem do tamanho que funcionou,
+    voltando a crescer aos poucos. As faixas terminam fora de ordem, mas são gravadas
+    em ordem, de modo que o checkpoint só avança sobre blocos já indexados.
+
+    Args:
+        pool (NodePool): Pool de nós conectados.
+        store (TransferLogStore): Armazenamento dos eventos.
+        range_size (int): Tamanho máximo de uma faixa, em blocos.
+        workers (int, opcional): Faixas simultâneas (padrão: 2 por nó saudável).
+        confirmations (int): Blocos recentes deixados de fora.
+    """
+
+    def __init__(
+        self,
+        pool: NodePool,
+        store: TransferLogStore,
+        range_size: int = DEFAULT_LOG_RANGE,
+        workers: Optional[int] = None,
+        confirmations: int = DEFAULT_CONFIRMATIONS,
+    ):
+        self.pool = pool
+        self.store = store
+        self.range_size = range_size
+        self.workers = workers
+        self.confirmations = confirmations
+        self._spans: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._blocks = 0
+        self._logs = 0
+        self._requests = 0
+        self._splits = 0
+        self._started: Optional[float] = None
+        self._elapsed = 0.0
+
+    def index(self, contracts: Sequence[str], from_block: int = 0, to_block: Optional[int] = None) -> Dict[str, int]:
+        """
+        Indexa os contratos do checkpoint de cada um (ou de `from_block`) até `to_block`.
+
+        Args:
+            contracts (Sequence[str]): Contratos BEP-20.
+            from_block (int): Primeiro bloco dos contratos ainda sem checkpoint.
+            to_block (int, opcional): Último bloco (padrão: o último menos `confirmations`).
+
+        Returns:
+            dict: Eventos novos gravados, por contrato (em checksum).
+        """
+        nodes = self.pool.ranking()
+        if not nodes:
+            raise NoHealthyNodeError("Nenhum nó RPC saudável disponível.")
+        if to_block is None:
+            to_block = int(self.pool.call("eth_blockNumber"), 16) - self.confirmations
+        workers = self.workers or 2 * len(nodes)
+
+        contracts = [checksum_address(contract) for contract in dict.fromkeys(contracts)]
+        cursors = {}
+        for contract in contracts:
+            checkpoint = self.store.next_block(contract)
+            cursors[contract] = from_block if checkpoint is None else checkpoint
+            self._spans.setdefault(contract, self.range_size)
+        # Faixas terminadas, à espera das anteriores: contrato -> {início: (fim, colunas)}
+        completed: Dict[str, Dict[int, Tuple[int, Dict[str, np.ndarray]]]] = {c: {} for c in contracts}
+        added = dict.fromkeys(contracts, 0)
+
+        # Próximo bloco a gravar de cada contrato (os cursores avançam à frente, ao gerar as faixas)
+        next_blocks = dict(cursors)
+
+        def flush(contract: str) -> None:
+            ready = completed[contract]
+            while next_blocks[contract] in ready:
+                end, columns = ready.pop(next_blocks[contract])
+                added[contract] += self.store.append(contract, columns, end + 1)
+                next_blocks[contract] = end + 1
+
+        self._started = time.perf_counter()
+        last_report = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="transfer-indexer") as executor:
+            pending = set()
+
+            def collect(done) -> None:
+                for future in done:
+                    contract, start, end, columns = future.result()
+                    completed[contract][start] = (end, columns)
+                    flush(contract)
+
+            for index, (contract, start, end) in enumerate(self._ranges(cursors, to_block)):
+                while len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    collect(done)
+                    if time.monotonic() - last_report >= 5:
+                        self._report()
+                        last_report = time.monotonic()
+                node = nodes[index % len(nodes)]
+                pending.add(executor.submit(self._fetch, contract, start, end, node))
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        self._elapsed = time.perf_counter() - self._started
+        self._started = None
+        self._report()
+        return added
+
+    def _ranges(self, cursors: Dict[str, int], to_block: int) -> Iterator[Tuple[str, int, int]]:
+        # Alterna entre os contratos; o tamanho de cada faixa é lido na hora, já com os ajustes
+        active = [contract for contract in cursors if cursors[contract] <= to_block]
+        while active:
+            for contract in list(active):
+                start = cursors[contract]
+                end = min(to_block, start + self._spans[contract] - 1)
+                yield contract, start, end
+                cursors[contract] = end + 1
+                if end == to_block:
+                    active.remove(contract)
+
+    def _fetch(self, contract: str, start: int, end: int, node) -> Tuple[str, int, int, Dict[str, np.ndarray]]:
+        logs, accepted = self._get_logs(contract, start, end, node)
+        columns = decode_transfer_logs(logs)
+        with self._lock:
+            self._blocks += end - start + 1
+            self._logs += len(columns["block_number"])
+            if accepted == end - start + 1:
+                # Faixa aceita inteira: volta a crescer aos poucos até o limite configurado
+                self._spans[contract] = min(self.range_size, max(self._spans[contract], accepted * 5 // 4))
+            else:
+                # Faixa dividida: as próximas começam do maior pedaço que o nó aceitou
+                self._spans[contract] = accepted
+        return contract, start, end, columns
+
+    def _get_logs(self, contract: str, start: int, end: int, node) -> Tuple[List[dict], int]:
+        """
+        Eventos da faixa e o tamanho do maior pedaço aceito pelo nó (a faixa inteira, se não houve divisão).
+        """
+        params = [{"address": contract, "fromBlock": hex(start), "toBlock": hex(end), "topics": [TRANSFER_TOPIC]}]
+        with self._lock:
+            self._requests += 1
+        try:
+            try:
+                return node.client.call("eth_getLogs", params), end - start + 1
+            except RpcTransportError as e:
+                logger.warning(f"eth_getLogs {start}-{end} falhou em {node.url} ({e}); usando o pool.")
+                return self.pool.call("eth_getLogs", params), end - start + 1
+        except JsonRpcError as e:
+            if isinstance(e, RpcTransportError) or not is_range_error(e) or start == end:
+                raise
+            middle = (start + end) // 2
+            with self._lock:
+                self._splits += 1
+                self._spans[contract] = min(self._spans[contract], middle - start + 1)
+            logger.debug(f"{contract}: faixa {start}-{end} recusada ({e}); dividindo.")
+            left, left_accepted = self._get_logs(contract, start, middle, node)
+            right, right_accepted = self._get_logs(contract, middle + 1, end, node)
+            return left + right, max(left_accepted, right_accepted)
+
+    def _report(self) -> None:
+        stats = self.stats()
+        logger.info(f"{stats['blocks']} blocos, {stats['logs']} eventos em {stats['seconds']:.1f}s "
+                    f"({stats['blocks_per_second']:,.0f} blocos/s, {stats['logs_per_second']:,.0f} eventos/s)")
+
+    def stats(self) -> Dict:
+        """
+        Blocos e eventos indexados, requisições, divisões de faixa, duração e vazão (blocos/s e eventos/s).
+        """
+        with self._lock:
+            elapsed = time.perf_counter() - self._started if self._started else self._elapsed
+            return {
+                "blocks": self._blocks,
+                "logs": self._logs,
+                "requests": self._requests,
+                "splits": self._splits,
+                "seconds": elapsed,
+                "blocks_per_second": self._blocks / elapsed if elapsed else 0.0,
+                "logs_per_second": self._logs / elapsed if elapsed else 0.0,
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("contracts", nargs="*", help="Contratos a indexar (padrão: BEP20_CONTRACT_ANALYSIS_*)")
+    parser.add_argument("--store", default="transfer_logs", help="Diretório do armazenamento")
+    parser.add_argument("--from-block", type=int, default=0, help="Primeiro bloco dos contratos sem checkpoint")
+    parser.add_argument("--to-block", type=int, help="Último bloco (padrão: o último confirmado)")
+    parser.add_argument("--range-size", type=int, default=DEFAULT_LOG_RANGE, help="Blocos por eth_getLogs")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    contracts = args.contracts or [
+        address for address in (get_env(f"BEP20_CONTRACT_ANALYSIS_{i}") for i in range(1, 7)) if address
+    ]
+    store = TransferLogStore(args.store)
+    indexer = TransferIndexer(NodePool(), store, range_size=args.range_size)
+    added = indexer.index(contracts, args.from_block, args.to_block)
+    for contract, count in added.items():
+        print(f"{contract}: {count} eventos novos, {store.rows(contract)} no total "
+              f"(próximo bloco: {store.next_block(contract)})")
+    stats = indexer.stats()
+    print(f"{stats['blocks']} blocos e {stats['logs']} eventos em {stats['seconds']:.2f}s "
+          f"({stats['blocks_per_second']:,.0f} blocos/s, {stats['logs_per_second']:,.0f} eventos/s, "
+          f"{stats['requests']} requisições, {stats['splits']} faixas divididas)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,542 @@
+"""
+Listagem completa da CoinMarketCap (`/v1/cryptocurrency/listings/latest`) em um retrato colunar.
+
+`ListingsSync` percorre todas as páginas da listagem (até 5.000 moedas por requisição, em
+várias moedas de cotação) e monta um `ListingsSnapshot`:
+
+- um array estruturado com os campos de cada ativo (id, rank, suprimentos, ...) e os
+  símbolos, nomes e slugs em arrays de texto;
+- um array estruturado por moeda de cotação com preço, volume, capitalização e variações;
+- índices ordenados por id e por símbolo, consultados com busca binária.
+
+Consultas (`rows`, `find`, `top`) rodam sobre os arrays, sem montar um dicionário por
+moeda, e cada atualização é comparada com o retrato anterior (`ListingsDiff`: ativos que
+entraram e saíram, mudanças de rank e de preço). O retrato é gravado em um `.npz`, para que
+a execução seguinte calcule a diferença em relação à anterior.
+
+    python -m bsc_toolkit.listings --convert USD,EUR,BRL --snapshot listings.npz --top 20
+"""
+import argparse
+import logging
+import os
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Moedas por requisição aceitas por /listings/latest
+LISTINGS_PAGE_SIZE = 5000
+
+# Campos numéricos de cada ativo; inteiros ausentes viram 0 e decimais ausentes, NaN
+ASSET_DTYPE = np.dtype([
+    ("id", np.int64),
+    ("cmc_rank", np.int64),
+    ("num_market_pairs", np.int64),
+    ("circulating_supply", np.float64),
+    ("total_supply", np.float64),
+    ("max_supply", np.float64),
+])
+
+# Campos de `quote.<moeda>`; ausentes viram NaN
+QUOTE_DTYPE = np.dtype([
+    ("price", np.float64),
+    ("volume_24h", np.float64),
+    ("volume_change_24h", np.float64),
+    ("percent_change_1h", np.float64),
+    ("percent_change_24h", np.float64),
+    ("percent_change_7d", np.float64),
+    ("percent_change_30d", np.float64),
+    ("market_cap", np.float64),
+    ("market_cap_dominance", np.float64),
+    ("fully_diluted_market_cap", np.float64),
+])
+
+
+class ListingsSnapshot:
+    """
+    Retrato colunar de uma listagem: a linha i de cada array é o mesmo ativo.
+
+    Args:
+        assets (np.ndarray): Array estruturado com `ASSET_DTYPE`.
+        symbols (np.ndarray): Símbolos dos ativos.
+        names (np.ndarray): Nomes dos ativos.
+        slugs (np.ndarray): Slugs dos ativos.
+        quotes (dict): {moeda de cotação: array estruturado com `QUOTE_DTYPE`}.
+        timestamp (float, opcional): Instante da coleta (epoch, em segundos).
+    """
+
+    def __init__(
+        self,
+        assets: np.ndarray,
+        symbols: np.ndarray,
+        names: np.ndarray,
+        slugs: np.ndarray,
+        quotes: Dict[str, np.ndarray],
+        timestamp: Optional[float] = None,
+    ):
+        self.assets = assets
+        self.symbols = symbols
+        self.names = names
+        self.slugs = slugs
+        self.quotes = quotes
+        self.timestamp = timestamp
+
+        # Índices: ids em ordem crescente e símbolos (maiúsculos) ordenados, empatados pelo rank
+        self._id_order = np.argsort(assets["id"], kind="stable")
+        self._sorted_ids = assets["id"][self._id_order]
+        keys = np.char.upper(symbols.astype(str))
+        self._symbol_order = np.lexsort((self._rank_key(), keys))
+        self._sorted_symbols = keys[self._symbol_order]
+
+    @classmethod
+    def from_listings(cls, listings: Sequence[Dict], currencies: Sequence[str],
+                      timestamp: Optional[float] = None) -> "ListingsSnapshot":
+        """
+        Monta o retrato a partir dos registros de /listings/latest (campo "data" das páginas).
+        """
+        assets = np.empty(len(listings), dtype=ASSET_DTYPE)
+        for field in ASSET_DTYPE.names:
+            if ASSET_DTYPE[field].kind == "i":
+                assets[field] = [row.get(field) or 0 for row in listings]
+            else:
+                # None vira NaN na conversão para float64
+                assets[field] = np.array([row.get(field) for row in listings], dtype=np.float64)
+
+        quotes = {}
+        for currency in currencies:
+            rows = [(row.get("quote") or {}).get(currency) or {} for row in listings]
+            quote = np.empty(len(listings), dtype=QUOTE_DTYPE)
+            for field in QUOTE_DTYPE.names:
+                quote[field] = np.array([row.get(field) for row in rows], dtype=np.float64)
+            quotes[currency] = quote
+
+        return cls(
+            assets,
+            np.array([row.get("symbol") or "" for row in listings], dtype=str),
+            np.array([row.get("name") or "" for row in listings], dtype=str),
+            np.array([row.get("slug") or "" for row in listings], dtype=str),
+            quotes,
+            time.time() if timestamp is None else timestamp,
+        )
+
+    def __len__(self) -> int:
+        return len(self.assets)
+
+    @property
+    def currencies(self) -> List[str]:
+        return list(self.quotes)
+
+    def _rank_key(self) -> np.ndarray:
+        # Ativos sem rank (0) vão para o fim
+        ranks = self.assets["cmc_rank"]
+        return np.where(ranks > 0, ranks, np.iinfo(np.int64).max)
+
+    # Consultas
+
+    def rows(self, ids: Union[Sequence[int], np.ndarray]) -> np.ndarray:
+        """
+        Linhas de vários ids de uma vez (-1 para ids ausentes do retrato).
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self._sorted_ids):
+            return np.full(ids.shape, -1, dtype=np.int64)
+        positions = np.minimum(np.searchsorted(self._sorted_ids, ids), len(self._sorted_ids) - 1)
+        return np.where(self._sorted_ids[positions] == ids, self._id_order[positions], -1)
+
+    def row(self, asset_id: int) -> Optional[int]:
+        """
+        Linha de um id, ou None se ele não estiver no retrato.
+        """
+        row = int(self.rows([asset_id])[0])
+        return row if row >= 0 else None
+
+    def find(self, symbol: str) -> np.ndarray:
+        """
+        Linhas dos ativos com um símbolo (sem diferenciar maiúsculas), da melhor posição no
+        rank para a pior. Símbolos não são únicos na CoinMarketCap: o primeiro é o mais
+        relevante.
+        """
+        key = symbol.upper()
+        start = np.searchsorted(self._sorted_symbols, key, side="left")
+        stop = np.searchsorted(self._sorted_symbols, key, side="right")
+        return self._symbol_order[start:stop]
+
+    def column(self, field: str, currency: Optional[str] = None) -> np.ndarray:
+        """
+        Coluna de um campo do ativo (`ASSET_DTYPE`) ou da cotação (`QUOTE_DTYPE`) em uma moeda
+        (padrão: a primeira moeda do retrato). Devolve uma visão, sem cópia.
+
+        Raises:
+            KeyError: Se o campo ou a moeda não existirem no retrato.
+        """
+        if field in ASSET_DTYPE.names:
+            return self.assets[field]
+        if field not in QUOTE_DTYPE.names:
+            raise KeyError(f"Campo desconhecido: {field}")
+        return self.quotes[currency or self.currencies[0]][field]
+
+    def top(
+        self,
+        n: int = 10,
+        by: str = "market_cap",
+        currency: Optional[str] = None,
+        ascending: bool = False,
+        where: Optional[np.ndarray] = None,
+    ) -> np.ndarray:
+        """
+        Linhas dos `n` ativos com os maiores (ou menores) valores de um campo.
+
+        Só os `n` primeiros são ordenados (`argpartition`); valores ausentes (NaN) ficam de fora.
+
+        Args:
+            n (int): Quantidade de linhas.
+            by (str): Campo do ativo ou da cotação (ex.: "market_cap", "percent_change_24h").
+            currency (str, opcional): Moeda de cotação (padrão: a primeira do retrato).
+            ascending (bool): Se True, os menores valores primeiro.
+            where (np.ndarray, opcional): Máscara booleana das linhas elegíveis
+                (ex.: `snapshot.column("volume_24h") > 1e6`).
+
+        Returns:
+            np.ndarray: Linhas, na ordem do ranking.
+        """
+        values = np.asarray(self.column(by, currency), dtype=np.float64)
+        eligible = ~np.isnan(values)
+        if where is not None:
+            eligible &= where
+        candidates = np.flatnonzero(eligible)
+        keys = values[candidates] if ascending else -values[candidates]
+        if n < len(candidates):
+            partition = np.argpartition(keys, n - 1)[:n]
+            candidates, keys = candidates[partition], keys[partition]
+        return candidates[np.argsort(keys, kind="stable")][:max(n, 0)]
+
+    def record(self, row: int, currency: Optional[str] = None) -> Dict:
+        """
+        Um ativo como dicionário (para exibição): campos do ativo e a cotação em `currency`.
+        """
+        record = {"symbol": str(self.symbols[row]), "name": str(self.names[row]), "slug": str(self.slugs[row])}
+        record.update((field, self.assets[field][row].item()) for field in ASSET_DTYPE.names)
+        currency = currency or self.currencies[0]
+        record["currency"] = currency
+        record.update((field, self.quotes[currency][field][row].item()) for field in QUOTE_DTYPE.names)
+        return record
+
+    def diff(self, previous: "ListingsSnapshot") -> "ListingsDiff":
+        """
+        Compara com um retrato anterior: ativos novos e removidos, mudanças de rank e a
+        variação relativa do preço em cada moeda presente nos dois retratos.
+        """
+        previous_rows = previous.rows(self.assets["id"])
+        common = previous_rows >= 0
+        rows = np.flatnonzero(common)
+        previous_rows = previous_rows[common]
+        removed = previous.assets["id"][self.rows(previous.assets["id"]) < 0]
+
+        rank = self.assets["cmc_rank"][rows]
+        previous_rank = previous.assets["cmc_rank"][previous_rows]
+        price_change = {}
+        for currency in self.currencies:
+            if currency not in previous.quotes:
+                continue
+            now = self.quotes[currency]["price"][rows]
+            before = previous.quotes[currency]["price"][previous_rows]
+            change = np.full(len(rows), np.nan)
+            np.divide(now - before, before, out=change, where=(before != 0) & ~np.isnan(before))
+            price_change[currency] = change
+
+        return ListingsDiff(
+            added=np.flatnonzero(~common),
+            removed=removed,
+            rows=rows,
+            previous_rows=previous_rows,
+            rank_change=np.where((rank > 0) & (previous_rank > 0), previous_rank - rank, 0),
+            price_change=price_change,
+        )
+
+    # Persistência
+
+    def save(self, path: str) -> None:
+        """
+        Grava o retrato em um `.npz` (em um temporário renomeado, para nunca deixar um arquivo pela metade).
+        """
+        arrays = {
+            "assets": self.assets,
+            "symbols": self.symbols,
+            "names": self.names,
+            "slugs": self.slugs,
+            "timestamp": np.array(self.timestamp if self.timestamp is not None else np.nan),
+            "currencies": np.array(self.currencies, dtype=str),
+        }
+        arrays.update((f"quote_{currency}", quote) for currency, quote in self.quotes.items())
+        temporary = f"{path}.tmp"
+        with open(temporary, "wb") as file:
+            np.savez(file, **arrays)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ListingsSnapshot":
+        """
+        Carrega um retrato gravado com `save`.
+        """
+        with np.load(path) as data:
+            timestamp = float(data["timestamp"])
+            return cls(
+                data["assets"], data["symbols"], data["names"], data["slugs"],
+                {str(currency): data[f"quote_{currency}"] for currency in data["currencies"]},
+                None if np.isnan(timestamp) else timestamp,
+            )
+
+
+@dataclass
+class ListingsDiff:
+    """
+    Diferença entre dois retratos (`ListingsSnapshot.diff`).
+
+    As linhas de `rows`, `rank_change` e `price_change` estão alinhadas: a posição k
+    descreve o ativo da linha `rows[k]` do retrato atual (e `previous_rows[k]` do anterior).
+    """
+
+    added: np.ndarray  # Linhas do retrato atual que não existiam no anterior
+    removed: np.ndarray  # Ids do retrato anterior que saíram da listagem
+    rows: np.ndarray  # Linhas do retrato atual presentes nos dois
+    previous_rows: np.ndarray  # Linhas correspondentes no retrato anterior
+    rank_change: np.ndarray  # Rank anterior - rank atual (positivo = subiu)
+    price_change: Dict[str, np.ndarray]  # {moeda: variação relativa do preço; NaN sem preço anterior}
+
+    def movers(self, n: int = 10, currency: Optional[str] = None) -> np.ndarray:
+        """
+        Linhas do retrato atual com as maiores variações de preço (em módulo) em `currency`
+        (padrão: a primeira moeda de `price_change`); preços que não mudaram ficam de fora.
+        Vazio se a moeda não estiver nos dois retratos.
+        """
+        if currency is None:
+            currency = next(iter(self.price_change), None)
+        if currency not in self.price_change:
+            return np.empty(0, dtype=self.rows.dtype)
+        change = np.abs(self.price_change[currency])
+        known = np.flatnonzero(change > 0)
+        order = known[np.argsort(-change[known], kind="stable")][:n]
+        return self.rows[order]
+
+    def summary(self, threshold: float = 0.0) -> Dict:
+        """
+        Contagens da diferença: ativos novos, removidos, que mudaram de rank e cujo preço
+        variou mais que `threshold` (em cada moeda).
+        """
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "rank_changed": int(np.count_nonzero(self.rank_change)),
+            "price_changed": {
+                currency: int(np.count_nonzero(np.abs(np.nan_to_num(change)) > threshold))
+                for currency, change in self.price_change.items()
+            },
+        }
+
+
+class ListingsSync:
+    """
+    Sincroniza a listagem completa da CoinMarketCap em um `ListingsSnapshot`.
+
+    Cada grupo de moedas de cotação percorre a listagem inteira: a primeira página informa
+    o total de ativos (`status.total_count`) e as demais são pedidas em paralelo pelo
+    agendador da `CoinMarketCapAPI`, que respeita o limite por minuto e os créditos do
+    plano. Sem o total, as páginas são pedidas em sequência até vir uma incompleta. Um
+    ativo que mude de página entre duas requisições aparece só uma vez (pelo id).
+
+    Args:
+        api (CoinMarketCapAPI, opcional): Cliente da API (padrão: um novo, com a chave do `.env`).
+        currencies (Sequence[str]): Moedas de cotação (ex.: ["USD", "EUR", "BRL"]).
+        path (str, opcional): Arquivo `.npz` do último retrato: carregado na criação (para a
+            primeira diferença) e regravado a cada atualização.
+        page_size (int): Ativos por requisição (máximo 5.000).
+        converts_per_call (int, opcional): Moedas de cotação por requisição (padrão: todas
+            juntas, o mais barato em créditos). Planos que limitam as conversões por chamada
+            (o Basic aceita 1) precisam de grupos menores.
+        max_assets (int, opcional): Sincroniza apenas os `max_assets` primeiros do rank.
+    """
+
+    def __init__(
+        self,
+        api=None,
+        currencies: Sequence[str] = ("USD",),
+        path: Optional[str] = None,
+        page_size: int = LISTINGS_PAGE_SIZE,
+        converts_per_call: Optional[int] = None,
+        max_assets: Optional[int] = None,
+    ):
+        if not currencies:
+            raise ValueError("Informe ao menos uma moeda de cotação.")
+        self.api = api
+        self.currencies = [currency.upper() for currency in currencies]
+        self.path = path
+        self.page_size = min(page_size, LISTINGS_PAGE_SIZE)
+        self.converts_per_call = converts_per_call or len(self.currencies)
+        self.max_assets = max_assets
+        self.snapshot: Optional[ListingsSnapshot] = None
+        if path and os.path.exists(path):
+            self.snapshot = ListingsSnapshot.load(path)
+        self._stats = {"syncs": 0, "requests": 0, "assets": 0, "seconds": 0.0}
+
+    def _api(self):
+        if self.api is None:
+            from .api.coinmarketcap import CoinMarketCapAPI
+
+            self.api = CoinMarketCapAPI()
+        return self.api
+
+    def _pages(self, convert: str) -> Iterator[List[Dict]]:
+        api = self._api()
+        fetch = partial(api.get_latest_market_pairs, convert=convert)
+        limit = self.page_size if self.max_assets is None else min(self.page_size, self.max_assets)
+        first = fetch(start=1, limit=limit)
+        self._stats["requests"] += 1
+        yield first["data"]
+
+        reported = (first.get("status") or {}).get("total_count")
+        if reported is not None:
+            total = reported if self.max_assets is None else min(reported, self.max_assets)
+            pages = api.gather(*(
+                partial(fetch, start=start, limit=min(self.page_size, total - start + 1))
+                for start in range(1 + limit, total + 1, self.page_size)
+            ))
+            self._stats["requests"] += len(pages)
+            for page in pages:
+                yield page["data"]
+            return
+
+        # Sem o total: páginas em sequência até uma incompleta (ou até `max_assets`)
+        start, size = 1 + limit, len(first["data"])
+        while size == limit and (self.max_assets is None or start <= self.max_assets):
+            if self.max_assets is not None:
+                limit = min(self.page_size, self.max_assets - start + 1)
+            page = fetch(start=start, limit=limit)["data"]
+            self._stats["requests"] += 1
+            yield page
+            start, size = start + limit, len(page)
+
+    def fetch(self) -> List[Dict]:
+        """
+        Busca a listagem completa em todas as moedas de cotação.
+
+        Returns:
+            list: Registros de /listings/latest (um por ativo) com as cotações de todas as moedas.
+        """
+        listings: Dict[int, Dict] = {}
+        for i in range(0, len(self.currencies), self.converts_per_call):
+            convert = ",".join(self.currencies[i:i + self.converts_per_call])
+            for page in self._pages(convert):
+                for row in page:
+                    existing = listings.get(row["id"])
+                    if existing is None:
+                        listings[row["id"]] = dict(row, quote=dict(row.get("quote") or {}))
+                    else:
+                        existing["quote"].update(row.get("quote") or {})
+        return list(listings.values())
+
+    def refresh(self) -> Optional[ListingsDiff]:
+        """
+        Busca a listagem, troca o retrato atual e grava o novo (se houver `path`).
+
+        Returns:
+            ListingsDiff: Diferença em relação ao retrato anterior (None na primeira sincronização).
+
+        Raises:
+            ApiError: Se alguma página falhar (o retrato anterior é mantido).
+        """
+        started = time.perf_counter()
+        snapshot = ListingsSnapshot.from_listings(self.fetch(), self.currencies)
+        diff = snapshot.diff(self.snapshot) if self.snapshot is not None else None
+        self.snapshot = snapshot
+        if self.path:
+            snapshot.save(self.path)
+        elapsed = time.perf_counter() - started
+        self._stats["syncs"] += 1
+        self._stats["assets"] = len(snapshot)
+        self._stats["seconds"] = elapsed
+        logger.info(f"Listagem sincronizada: {len(snapshot)} ativos em {len(self.currencies)} moedas ({elapsed:.1f}s).")
+        return diff
+
+    def run(
+        self,
+        interval: float = 300.0,
+        on_update: Optional[Callable[[ListingsSnapshot, Optional[ListingsDiff]], None]] = None,
+        iterations: Optional[int] = None,
+    ) -> None:
+        """
+        Atualiza o retrato a cada `interval` segundos (para sempre, ou `iterations` vezes).
+        Falhas de uma atualização são registradas e a seguinte tenta de novo.
+        """
+        from .http_client import ApiError
+
+        done = 0
+        while iterations is None or done < iterations:
+            started = time.monotonic()
+            try:
+                diff = self.refresh()
+            except ApiError as e:
+                logger.warning(f"Falha ao sincronizar a listagem: {e}")
+            else:
+                if on_update:
+                    on_update(self.snapshot, diff)
+            done += 1
+            if iterations is None or done < iterations:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+
+    def stats(self) -> Dict:
+        """
+        Sincronizações feitas, requisições, ativos do último retrato e duração da última sincronização.
+        """
+        return dict(self._stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--convert", default="USD", help="Moedas de cotação, separadas por vírgula")
+    parser.add_argument("--snapshot", default="listings.npz", help="Arquivo do retrato (comparado na próxima execução)")
+    parser.add_argument("--converts-per-call", type=int, help="Moedas de cotação por requisição (Basic: 1)")
+    parser.add_argument("--max-assets", type=int, help="Sincroniza só os primeiros do rank")
+    parser.add_argument("--top", type=int, default=20, help="Ativos exibidos, por capitalização de mercado")
+    parser.add_argument("--interval", type=float, default=0.0,
+                        help="Segundos entre atualizações (0 = sincroniza uma vez e sai)")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    sync = ListingsSync(
+        currencies=args.convert.split(","), path=args.snapshot,
+        converts_per_call=args.converts_per_call, max_assets=args.max_assets,
+    )
+
+    def report(snapshot: ListingsSnapshot, diff: Optional[ListingsDiff]) -> None:
+        currency = snapshot.currencies[0]
+        print(f"{'#':>5}  {'símbolo':<10}{'nome':<28}{'preço':>18}{'cap. de mercado':>22}{'24h':>9}")
+        for row in snapshot.top(args.top, "market_cap", currency):
+            quote = snapshot.quotes[currency][row]
+            print(f"{snapshot.assets['cmc_rank'][row]:>5}  {snapshot.symbols[row]:<10}{snapshot.names[row][:27]:<28}"
+                  f"{quote['price']:>14,.6f} {currency:<3}{quote['market_cap']:>18,.0f} {currency:<3}"
+                  f"{quote['percent_change_24h']:>8.2f}%")
+        if diff is not None:
+            summary = diff.summary()
+            print(f"Desde o retrato anterior: {summary['added']} novos, {summary['removed']} removidos, "
+                  f"{summary['rank_changed']} mudaram de rank.")
+            if currency not in diff.price_change:
+                # O retrato anterior não tinha esta moeda: não há variação de preço a comparar
+                return
+            for row in diff.movers(5, currency):
+                # `diff.rows` está em ordem crescente
+                k = np.searchsorted(diff.rows, row)
+                print(f"  {snapshot.symbols[row]}: {diff.price_change[currency][k]:+.2%}")
+
+    if args.interval:
+        sync.run(args.interval, report)
+    else:
+        diff = sync.refresh()
+        report(sync.snapshot, diff)
+
+
+if __name__ == "__main__":
+    main()
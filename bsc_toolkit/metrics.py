@@ -0,0 +1,306 @@
+import logging
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Limites dos buckets de latência (segundos) e de tamanho de resposta (bytes)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Amostra de um coletor: (nome, tipo, ajuda, rótulos, valor)
+Sample = Tuple[str, str, str, Dict[str, str], float]
+
+
+class Counter:
+    """
+    Contador monotônico com rótulos (valores na ordem de `labelnames`).
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            values = list(self._values.items())
+        return [{"labels": dict(zip(self.labelnames, labels)), "value": value} for labels, value in values]
+
+
+class Histogram:
+    """
+    Histograma com buckets fixos (cumulativos na exposição, como no Prometheus), soma e contagem.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # Rótulos -> [contagem por bucket (+Inf no fim), soma, contagem]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            values = [(labels, list(entry[0]), entry[1], entry[2]) for labels, entry in self._values.items()]
+        samples = []
+        for labels, counts, total, count in values:
+            cumulative, running = {}, 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                running += bucket_count
+                cumulative["+Inf" if bound == float("inf") else repr(bound)] = running
+            samples.append({
+                "labels": dict(zip(self.labelnames, labels)),
+                "buckets": cumulative,
+                "sum": total,
+                "count": count,
+            })
+        return samples
+
+
+class MetricsRegistry:
+    """
+    Registro de métricas em memória com snapshot e exposição no formato texto do Prometheus.
+
+    As métricas de chamadas de saída (HTTP das APIs, JSON-RPC e Web3) são atualizadas
+    no caminho quente com um lock curto por métrica; coletores registrados com
+    `register_collector` (ex.: o cache de preços) só são lidos no snapshot/exposição.
+    `listeners` recebem cada chamada registrada (um "span" com provedor, operação,
+    duração e resultado), para integrar com um sistema de tracing externo.
+
+    Args:
+        enabled (bool): Se False, as funções `record_*` não fazem nada.
+    """
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics: Dict[str, Any] = {}
+        self._collectors: List[Callable[[], Iterable[Sample]]] = []
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (),
+                  buckets: Sequence[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def register_collector(self, collector: Callable[[], Iterable[Sample]]) -> None:
+        """
+        Registra uma função que produz amostras (contadores ou gauges) no momento da leitura.
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """
+        Registra um callback chamado com cada span registrado.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def emit(self, span: Dict[str, Any]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(span)
+            except Exception as e:
+                logger.error(f"Erro no listener de métricas: {e}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrato de todas as métricas: {nome: {"type", "help", "samples": [...]}}.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+            collectors = list(self._collectors)
+        snapshot = {
+            metric.name: {"type": metric.kind, "help": metric.help, "samples": metric.samples()}
+            for metric in metrics
+        }
+        for collector in collectors:
+            for name, kind, help, labels, value in collector():
+                entry = snapshot.setdefault(name, {"type": kind, "help": help, "samples": []})
+                entry["samples"].append({"labels": labels, "value": value})
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """
+        Exposição no formato texto do Prometheus (versão 0.0.4).
+        """
+        lines = []
+        for name, metric in sorted(self.snapshot().items()):
+            lines.append(f"# HELP {name} {metric['help']}")
+            lines.append(f"# TYPE {name} {metric['type']}")
+            for sample in metric["samples"]:
+                labels = sample["labels"]
+                if metric["type"] == "histogram":
+                    for bound, count in sample["buckets"].items():
+                        lines.append(f"{name}_bucket{_format_labels(dict(labels, le=bound))} {count}")
+                    lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(sample['sum'])}")
+                    lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+                else:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(sample['value'])}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+@lru_cache(maxsize=1024)
+def node_label(url: str) -> str:
+    """
+    Rótulo de baixa cardinalidade para uma URL: esquema, host e porta, sem credenciais,
+    caminho nem query (URLs de nós RPC costumam trazer a chave de API no caminho).
+    """
+    parts = urlsplit(url)
+    if not parts.hostname:
+        return url
+    port = f":{parts.port}" if parts.port else ""
+    return f"{parts.scheme}://{parts.hostname}{port}"
+
+
+# Registro padrão e métricas das chamadas de saída
+
+REGISTRY = MetricsRegistry()
+
+HTTP_DURATION = REGISTRY.histogram(
+    "bsc_http_request_duration_seconds", "Duração de cada tentativa de requisição HTTP às APIs.",
+    ("provider", "endpoint"),
+)
+HTTP_REQUESTS = REGISTRY.counter(
+    "bsc_http_requests_total", "Tentativas de requisição HTTP às APIs, por status ('error' = sem resposta).",
+    ("provider", "endpoint", "status"),
+)
+HTTP_ERRORS = REGISTRY.counter(
+    "bsc_http_errors_total", "Tentativas HTTP que falharam, por tipo de erro.", ("provider", "endpoint", "kind"),
+)
+HTTP_RETRIES = REGISTRY.counter(
+    "bsc_http_retries_total", "Novas tentativas de requisições HTTP.", ("provider", "endpoint"),
+)
+HTTP_RESPONSE_SIZE = REGISTRY.histogram(
+    "bsc_http_response_size_bytes", "Tamanho do corpo das respostas HTTP (descompactado).",
+    ("provider", "endpoint"), SIZE_BUCKETS,
+)
+RPC_DURATION = REGISTRY.histogram(
+    "bsc_rpc_request_duration_seconds", "Duração das requisições JSON-RPC (e Web3) aos nós.", ("node", "method"),
+)
+RPC_REQUESTS = REGISTRY.counter(
+    "bsc_rpc_requests_total", "Requisições JSON-RPC aos nós, por resultado.", ("node", "method", "outcome"),
+)
+RPC_RESPONSE_SIZE = REGISTRY.histogram(
+    "bsc_rpc_response_size_bytes", "Tamanho das respostas JSON-RPC.", ("node", "method"), SIZE_BUCKETS,
+)
+
+
+def record_http(provider: str, endpoint: str, status: Optional[int], seconds: float,
+                size: Optional[int] = None, error: Optional[str] = None, retry: bool = False) -> None:
+    """
+    Registra uma tentativa de requisição HTTP a uma API.
+
+    Args:
+        provider (str): Provedor (bscscan, coingecko, ...).
+        endpoint (str): Caminho chamado, já sem chaves de API.
+        status (int, opcional): Status HTTP (None se não houve resposta).
+        seconds (float): Duração da tentativa.
+        size (int, opcional): Bytes do corpo da resposta.
+        error (str, opcional): Tipo do erro (timeout, connection, http_503, ...).
+        retry (bool): Se a tentativa será repetida.
+    """
+    if not REGISTRY.enabled:
+        return
+    labels = (provider, endpoint)
+    HTTP_DURATION.observe(labels, seconds)
+    HTTP_REQUESTS.inc((provider, endpoint, "error" if status is None else str(status)))
+    if size is not None:
+        HTTP_RESPONSE_SIZE.observe(labels, size)
+    if error:
+        HTTP_ERRORS.inc((provider, endpoint, error))
+    if retry:
+        HTTP_RETRIES.inc(labels)
+    if REGISTRY._listeners:
+        REGISTRY.emit({"kind": "http", "provider": provider, "endpoint": endpoint, "status": status,
+                       "seconds": seconds, "size": size, "error": error, "retry": retry, "time": time.time()})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"{provider} {endpoint} -> {status or error} em {seconds * 1000:.1f} ms")
+
+
+def record_rpc(node: str, method: str, seconds: float, size: Optional[int] = None,
+               error: Optional[str] = None) -> None:
+    """
+    Registra uma requisição JSON-RPC (ou Web3) a um nó. `node` é a URL do nó (só o host é usado).
+    """
+    if not REGISTRY.enabled:
+        return
+    labels = (node_label(node), method)
+    RPC_DURATION.observe(labels, seconds)
+    RPC_REQUESTS.inc(labels + (error or "ok",))
+    if size is not None:
+        RPC_RESPONSE_SIZE.observe(labels, size)
+    if REGISTRY._listeners:
+        REGISTRY.emit({"kind": "rpc", "node": labels[0], "method": method, "seconds": seconds,
+                       "size": size, "error": error, "time": time.time()})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"{labels[0]} {method} -> {error or 'ok'} em {seconds * 1000:.1f} ms")
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """
+    Retrato das métricas do registro padrão.
+    """
+    return REGISTRY.snapshot()
+
+
+def to_prometheus() -> str:
+    """
+    Métricas do registro padrão no formato texto do Prometheus.
+    """
+    return REGISTRY.to_prometheus()
+
+
+def set_enabled(enabled: bool) -> None:
+    """
+    Liga ou desliga o registro de métricas das chamadas de saída.
+    """
+    REGISTRY.enabled = enabled
@@ -0,0 +1,177 @@
+"""
+Análises vetorizadas (NumPy) de avaliação e TVL dos pares ASPPBR.
+
+Em vez de calcular um par por vez com floats do Python, as séries de todos os pares
+e dias entram como matrizes (pares x dias) e todas as métricas saem em uma passada:
+TVL, reserva de ASPPBR, preço unitário implícito, valor de mercado, volume móvel de
+7 e 30 dias e participação de cada par na reserva. O resultado são arrays
+estruturados, sem nenhuma impressão; o preço unitário segue a mesma fórmula de
+`calcular_valor_unitario` (TVL total / reserva total de ASPPBR).
+"""
+from typing import Dict, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .pair_history import PairHistoryStore
+
+DAY = 86_400
+
+# Suprimento total fixo do ASPPBR (o mesmo de `calcular_valor_unitario_e_mercado`)
+ASPPBR_TOTAL_SUPPLY = 21_000_000
+
+VOLUME_WINDOWS = (7, 30)
+
+DAILY_DTYPE = np.dtype([
+    ("date", np.int64),
+    ("tvl", np.float64),
+    ("asppbr_reserve", np.float64),
+    ("unit_price", np.float64),
+    ("market_cap", np.float64),
+    ("volume_usd", np.float64),
+    ("volume_7d", np.float64),
+    ("volume_30d", np.float64),
+])
+
+PAIR_DTYPE = np.dtype([
+    ("tvl", np.float64),
+    ("unit_price", np.float64),
+    ("reserve_share", np.float64),
+    ("volume_usd", np.float64),
+    ("volume_7d", np.float64),
+    ("volume_30d", np.float64),
+])
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """
+    Soma móvel de `window` dias ao longo do último eixo (os primeiros dias somam o que houver).
+    """
+    cumulative = np.cumsum(values, axis=-1)
+    result = cumulative.copy()
+    result[..., window:] -= cumulative[..., :-window]
+    return result
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    # Divisão por zero vira 0, como em calcular_valor_unitario
+    out = np.zeros(np.broadcast(numerator, denominator).shape)
+    np.divide(numerator, denominator, out=out, where=denominator != 0)
+    return out
+
+
+def analyze(
+    dates: np.ndarray,
+    reserve0: np.ndarray,
+    reserve_usd: np.ndarray,
+    volume_usd: np.ndarray,
+    total_supply: Union[float, np.ndarray] = ASPPBR_TOTAL_SUPPLY,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula as métricas de avaliação de vários pares em vários dias.
+
+    Args:
+        dates (np.ndarray): Timestamps dos dias, forma (dias,).
+        reserve0 (np.ndarray): Reserva de ASPPBR de cada par, forma (pares, dias).
+        reserve_usd (np.ndarray): Reserva total em USD (TVL) de cada par, forma (pares, dias).
+        volume_usd (np.ndarray): Volume diário em USD de cada par, forma (pares, dias).
+        total_supply (float | np.ndarray): Suprimento de ASPPBR (escalar ou por dia).
+
+    Returns:
+        tuple: (`daily`, array estruturado (dias,) com `DAILY_DTYPE`, e `pairs`, array
+            estruturado (pares, dias) com `PAIR_DTYPE`). Valores ausentes (NaN) contam como 0.
+    """
+    reserve0 = np.nan_to_num(np.asarray(reserve0, dtype=np.float64))
+    tvl = np.nan_to_num(np.asarray(reserve_usd, dtype=np.float64))
+    volume = np.nan_to_num(np.asarray(volume_usd, dtype=np.float64))
+
+    total_tvl = tvl.sum(axis=0)
+    total_reserve = reserve0.sum(axis=0)
+    total_volume = volume.sum(axis=0)
+    pair_volume = {window: rolling_sum(volume, window) for window in VOLUME_WINDOWS}
+
+    daily = np.empty(len(dates), dtype=DAILY_DTYPE)
+    daily["date"] = dates
+    daily["tvl"] = total_tvl
+    daily["asppbr_reserve"] = total_reserve
+    daily["unit_price"] = _safe_divide(total_tvl, total_reserve)
+    daily["market_cap"] = daily["unit_price"] * total_supply
+    daily["volume_usd"] = total_volume
+    for window in VOLUME_WINDOWS:
+        # A soma das janelas por par é a janela do total: evita um segundo cumsum
+        daily[f"volume_{window}d"] = pair_volume[window].sum(axis=0)
+
+    pairs = np.empty(tvl.shape, dtype=PAIR_DTYPE)
+    pairs["tvl"] = tvl
+    pairs["unit_price"] = _safe_divide(tvl, reserve0)
+    pairs["reserve_share"] = _safe_divide(reserve0, total_reserve)
+    pairs["volume_usd"] = volume
+    for window in VOLUME_WINDOWS:
+        pairs[f"volume_{window}d"] = pair_volume[window]
+    return daily, pairs
+
+
+def align_series(
+    series: Sequence[Dict[str, np.ndarray]],
+    columns: Sequence[str] = ("reserve0", "reserve_usd", "daily_volume_usd"),
+    start: Optional[int] = None,
+    end: Optional[int] = None,
+) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Alinha as séries de vários pares em uma grade diária comum (pares x dias).
+
+    Dias sem registro de um par (sem negociações) repetem as reservas do dia anterior
+    e têm volume zero; antes do primeiro registro, tudo é zero.
+
+    Args:
+        series (Sequence[dict]): Séries de cada par ({coluna: array}, com "date"), como as de
+            `PairHistoryStore.read`.
+        columns (Sequence[str]): Colunas a alinhar.
+        start (int, opcional): Primeiro dia da grade (padrão: o mais antigo entre os pares).
+        end (int, opcional): Último dia da grade (padrão: o mais recente entre os pares).
+
+    Returns:
+        tuple: (datas da grade, {coluna: matriz (pares, dias)}).
+    """
+    nonempty = [s["date"] for s in series if len(s["date"])]
+    if start is None:
+        start = min((int(d[0]) for d in nonempty), default=0)
+    if end is None:
+        end = max((int(d[-1]) for d in nonempty), default=start - DAY)
+    dates = np.arange(start - start % DAY, end + 1, DAY, dtype=np.int64)
+
+    aligned = {column: np.zeros((len(series), len(dates))) for column in columns}
+    for row, s in enumerate(series):
+        if not len(s["date"]):
+            continue
+        positions = (np.asarray(s["date"]) - dates[0]) // DAY
+        inside = (positions >= 0) & (positions < len(dates))
+        positions = positions[inside]
+        # Índice do último registro em cada dia da grade (-1 antes do primeiro)
+        last = np.full(len(dates), -1, dtype=np.int64)
+        last[positions] = np.arange(len(positions))
+        last = np.maximum.accumulate(last)
+        known = last >= 0
+        for column in columns:
+            values = np.asarray(s[column])[inside]
+            if "volume" in column or column == "daily_txns":
+                aligned[column][row, positions] = values
+            else:
+                aligned[column][row, known] = values[last[known]]
+    return dates, aligned
+
+
+def analyze_store(
+    store: PairHistoryStore,
+    pair_addresses: Optional[Sequence[str]] = None,
+    total_supply: Union[float, np.ndarray] = ASPPBR_TOTAL_SUPPLY,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    `analyze` sobre o histórico gravado em um `PairHistoryStore` (padrão: todos os pares).
+
+    Returns:
+        tuple: (`daily`, `pairs`), como em `analyze`; a linha i de `pairs` é o par i de `pair_addresses`.
+    """
+    pair_addresses = list(pair_addresses or store.pairs())
+    columns = ("reserve0", "reserve_usd", "daily_volume_usd")
+    dates, aligned = align_series([store.read(address, ("date",) + columns) for address in pair_addresses], columns)
+    return analyze(dates, aligned["reserve0"], aligned["reserve_usd"], aligned["daily_volume_usd"], total_supply)
@@ -0,0 +1,188 @@
+"""
+Histórico diário dos pares da PancakeSwap (`pairDayDatas`) em um armazenamento colunar local.
+
+Cada par tem um diretório com um arquivo binário por campo (`date.i8`, `reserve0.f8`, ...)
+e um `meta.json` com a quantidade de linhas confirmadas. Novos dias são apenas acrescentados
+ao fim de cada coluna, e as leituras devolvem arrays somente leitura mapeados (mmap)
+sobre os arquivos, sem copiar os dados.
+
+    python -m bsc_toolkit.pair_history --store pair_history [endereços de pares adicionais]
+"""
+import argparse
+import json
+import logging
+import mmap
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Coluna -> (campo do pairDayDatas, tipo NumPy); os valores decimais da API viram float64
+COLUMNS: Dict[str, tuple] = {
+    "date": ("date", np.int64),
+    "daily_volume_usd": ("dailyVolumeUSD", np.float64),
+    "daily_txns": ("dailyTxns", np.int64),
+    "daily_volume_token0": ("dailyVolumeToken0", np.float64),
+    "daily_volume_token1": ("dailyVolumeToken1", np.float64),
+    "reserve0": ("reserve0", np.float64),
+    "reserve1": ("reserve1", np.float64),
+    "reserve_usd": ("reserveUSD", np.float64),
+    "total_supply": ("totalSupply", np.float64),
+}
+
+
+class PairHistoryStore:
+    """
+    Armazenamento colunar, append-only, do histórico diário de vários pares.
+
+    - `append` grava primeiro os dados de todas as colunas e só então atualiza o
+      `meta.json` (com `os.replace`, atômico): uma queda no meio de uma gravação deixa
+      bytes a mais no fim de alguma coluna, que são ignorados e truncados na próxima
+      gravação do par.
+    - Linhas com data menor ou igual à última gravada são descartadas, então repetir
+      uma página (ou retomar um backfill interrompido) não duplica dias.
+    - `read` devolve arrays somente leitura, mapeados dos arquivos, do tamanho confirmado.
+
+    Args:
+        path (str): Diretório do armazenamento (criado se não existir).
+    """
+
+    def __init__(self, path: str = "pair_history"):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._meta: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _pair_dir(self, address: str) -> Path:
+        return self.path / address.lower()
+
+    def _load_meta(self, address: str) -> dict:
+        address = address.lower()
+        meta = self._meta.get(address)
+        if meta is None:
+            try:
+                with open(self._pair_dir(address) / "meta.json") as file:
+                    meta = json.load(file)
+            except FileNotFoundError:
+                meta = {"address": address, "name": None, "rows": 0, "last_date": None}
+            self._meta[address] = meta
+        return meta
+
+    def pairs(self) -> List[str]:
+        """
+        Endereços (em minúsculas) dos pares com histórico gravado.
+        """
+        return sorted(entry.name for entry in self.path.iterdir() if (entry / "meta.json").exists())
+
+    def last_date(self, address: str) -> Optional[int]:
+        """
+        Timestamp do último dia gravado de um par (None se não houver nenhum).
+        """
+        with self._lock:
+            return self._load_meta(address)["last_date"]
+
+    def rows(self, address: str) -> int:
+        with self._lock:
+            return self._load_meta(address)["rows"]
+
+    def append(self, address: str, day_datas: Sequence[dict]) -> int:
+        """
+        Acrescenta os registros de `pairDayDatas` de um par (em ordem crescente de data).
+
+        Returns:
+            int: Quantidade de dias novos gravados.
+        """
+        with self._lock:
+            meta = self._load_meta(address)
+            last = meta["last_date"]
+            new = [row for row in day_datas if last is None or int(row["date"]) > last]
+            if not new:
+                return 0
+
+            directory = self._pair_dir(address)
+            directory.mkdir(exist_ok=True)
+            for column, (field, dtype) in COLUMNS.items():
+                values = np.array([row[field] for row in new], dtype=np.float64).astype(dtype)
+                with open(_column_file(directory, column), "ab") as file:
+                    # Descarta uma cauda de uma gravação interrompida antes de acrescentar
+                    file.truncate(meta["rows"] * np.dtype(dtype).itemsize)
+                    file.write(values.tobytes())
+
+            meta = dict(
+                meta,
+                name=meta["name"] or (new[-1].get("pairAddress") or {}).get("name"),
+                rows=meta["rows"] + len(new),
+                last_date=int(new[-1]["date"]),
+            )
+            temporary = directory / "meta.json.tmp"
+            with open(temporary, "w") as file:
+                json.dump(meta, file)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, directory / "meta.json")
+            self._meta[address.lower()] = meta
+        logger.debug(f"{address}: {len(new)} dias gravados (último: {meta['last_date']})")
+        return len(new)
+
+    def read(self, address: str, columns: Optional[Iterable[str]] = None) -> Dict[str, np.ndarray]:
+        """
+        Série histórica de um par como arrays somente leitura mapeados do disco (sem cópia).
+
+        Args:
+            address (str): Endereço do par.
+            columns (Iterable[str], opcional): Colunas desejadas (padrão: todas de `COLUMNS`).
+
+        Returns:
+            dict: {coluna: array}; arrays vazios se o par não tiver histórico.
+        """
+        with self._lock:
+            rows = self._load_meta(address)["rows"]
+        directory = self._pair_dir(address)
+        series = {}
+        for column in columns or COLUMNS:
+            dtype = np.dtype(COLUMNS[column][1])
+            if rows:
+                # mmap + frombuffer: o array aponta direto para as páginas do arquivo (np.memmap
+                # faz o mesmo, mas custa bem mais por arquivo aberto)
+                with open(_column_file(directory, column), "rb") as file:
+                    buffer = mmap.mmap(file.fileno(), rows * dtype.itemsize, access=mmap.ACCESS_READ)
+                series[column] = np.frombuffer(buffer, dtype=dtype, count=rows)
+            else:
+                series[column] = np.empty(0, dtype=dtype)
+        return series
+
+    def refresh(self) -> None:
+        """
+        Esquece os metadados em memória (ex.: depois que outro processo gravou no diretório).
+        """
+        with self._lock:
+            self._meta.clear()
+
+
+def _column_file(directory: Path, column: str) -> str:
+    dtype = np.dtype(COLUMNS[column][1])
+    return os.path.join(directory, f"{column}.{dtype.kind}{dtype.itemsize}")
+
+
+def main():
+    from .api.pancakeswap import ASPPBR_PAIRS, backfill_pair_day_datas
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pairs", nargs="*", help="Endereços de pares além dos pares ASPPBR")
+    parser.add_argument("--store", default="pair_history", help="Diretório do armazenamento")
+    args = parser.parse_args()
+
+    store = PairHistoryStore(args.store)
+    pair_addresses = [address for address, _ in ASPPBR_PAIRS] + args.pairs
+    added = backfill_pair_day_datas(pair_addresses, store)
+    for address in pair_addresses:
+        print(f"{address}: {added.get(address, 0)} dias novos, {store.rows(address)} no total "
+              f"(último: {store.last_date(address)})")
+
+
+if __name__ == "__main__":
+    main()
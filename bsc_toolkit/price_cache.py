@@ -0,0 +1,307 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from .metrics import REGISTRY, Sample
+
+logger = logging.getLogger(__name__)
+
+# (fonte, ativo, moeda de cotação)
+CacheKey = Tuple[str, str, str]
+
+# Fonte -> (ttl, janela stale), em segundos
+DEFAULT_TTLS: Dict[str, Tuple[float, float]] = {
+    "coingecko": (60.0, 300.0),
+    "coingecko.markets": (60.0, 300.0),
+    "bscscan": (30.0, 120.0),
+    # Cotações de swap mudam a cada bloco: uma consulta a cada 5 s ainda busca um preço novo
+    "0x": (2.0, 3.0),
+}
+
+
+class PriceCache:
+    """
+    Cache de preços em memória compartilhado pelas consultas de preço (CoinGecko, BscScan, 0x).
+
+    - Entradas indexadas por (fonte, ativo, moeda de cotação).
+    - Dentro do `ttl` a entrada é servida direto da memória.
+    - Entre `ttl` e `ttl + stale`, o valor antigo é devolvido imediatamente e uma única
+      atualização roda em segundo plano (stale-while-revalidate).
+    - Depois disso a entrada expira e a próxima consulta busca o valor de forma síncrona.
+    - No máximo `max_entries` entradas; as menos usadas recentemente são descartadas (LRU).
+
+    Args:
+        max_entries (int): Número máximo de entradas.
+        ttl (float): Validade padrão de uma entrada, em segundos.
+        stale (float): Janela padrão em que uma entrada vencida ainda é servida.
+        ttls (dict, opcional): Validade e janela por fonte: {fonte: (ttl, stale)}.
+        refresh_workers (int): Threads usadas nas atualizações em segundo plano.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        stale: float = 120.0,
+        ttls: Optional[Dict[str, Tuple[float, float]]] = None,
+        refresh_workers: int = 2,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale = stale
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+
+        # Chave -> (valor, instante em que foi obtido)
+        self._entries: "OrderedDict[CacheKey, Tuple[Any, float]]" = OrderedDict()
+        self._refreshing: Set[CacheKey] = set()
+        # Buscas assíncronas em andamento, compartilhadas por consultas simultâneas ao mesmo ativo
+        self._loading: Dict[CacheKey, "asyncio.Task"] = {}
+        self._tasks: Set["asyncio.Task"] = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=refresh_workers, thread_name_prefix="price-cache")
+        self._stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0, "evictions": 0}
+
+    def configure(self, source: str, ttl: float, stale: float = 0.0) -> None:
+        """
+        Define a validade e a janela stale de uma fonte.
+        """
+        with self._lock:
+            self.ttls[source] = (ttl, stale)
+
+    def _ttl(self, source: str) -> Tuple[float, float]:
+        return self.ttls.get(source, (self.ttl, self.stale))
+
+    def _store(self, source: str, quote: str, values: Dict[str, Any], fetched_at: float) -> None:
+        with self._lock:
+            for asset, value in values.items():
+                key = (source, asset, quote)
+                self._entries[key] = (value, fetched_at)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def _lookup(self, source: str, assets: Sequence[str], quote: str) -> Tuple[Dict[str, Any], List[str], List[str]]:
+        """
+        Separa os ativos em encontrados, ausentes (ou expirados) e a atualizar em segundo plano.
+        """
+        ttl, stale = self._ttl(source)
+        now = time.monotonic()
+        found: Dict[str, Any] = {}
+        missing: List[str] = []
+        to_refresh: List[str] = []
+        with self._lock:
+            for asset in dict.fromkeys(assets):
+                key = (source, asset, quote)
+                entry = self._entries.get(key)
+                age = None if entry is None else now - entry[1]
+                if age is not None and age < ttl:
+                    self._stats["hits"] += 1
+                elif age is not None and age < ttl + stale:
+                    self._stats["stale_hits"] += 1
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        to_refresh.append(asset)
+                else:
+                    self._stats["misses"] += 1
+                    missing.append(asset)
+                    continue
+                self._entries.move_to_end(key)
+                found[asset] = entry[0]
+        return found, missing, to_refresh
+
+    def get_many(
+        self,
+        source: str,
+        assets: Sequence[str],
+        quote: str,
+        loader: Callable[[List[str]], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """
+        Devolve os preços de vários ativos, buscando de uma só vez apenas os que faltam.
+
+        Args:
+            source (str): Fonte do preço (ex.: "coingecko").
+            assets (list): Ativos desejados.
+            quote (str): Moeda de cotação (ex.: "usd").
+            loader (Callable): Recebe a lista de ativos a buscar e devolve {ativo: valor}.
+                Ativos ausentes da resposta não são armazenados.
+
+        Returns:
+            dict: {ativo: valor} para os ativos encontrados, na ordem de `assets`.
+
+        Raises:
+            Exception: O que `loader` levantar ao buscar ativos que não estão no cache.
+        """
+        found, missing, to_refresh = self._lookup(source, assets, quote)
+        if to_refresh:
+            self._executor.submit(self._refresh, source, to_refresh, quote, loader)
+        if missing:
+            fetched_at = time.monotonic()
+            loaded = loader(missing)
+            self._store(source, quote, {asset: loaded[asset] for asset in missing if asset in loaded}, fetched_at)
+            found.update(loaded)
+        return {asset: found[asset] for asset in assets if asset in found}
+
+    def get(self, source: str, asset: str, quote: str, loader: Callable[[], Any]) -> Any:
+        """
+        Devolve o preço de um ativo, chamando `loader()` apenas se ele não estiver no cache.
+        """
+        return self.get_many(source, [asset], quote, lambda assets: {asset: loader()})[asset]
+
+    def _refresh(self, source: str, assets: List[str], quote: str, loader: Callable) -> None:
+        try:
+            fetched_at = time.monotonic()
+            loaded = loader(assets)
+            self._store(source, quote, {asset: loaded[asset] for asset in assets if asset in loaded}, fetched_at)
+            with self._lock:
+                self._stats["refreshes"] += 1
+        except Exception as e:
+            # O valor antigo continua sendo servido até sair da janela stale
+            logger.warning(f"Falha ao atualizar {source} {assets} em segundo plano: {e}")
+            with self._lock:
+                self._stats["refresh_errors"] += 1
+        finally:
+            with self._lock:
+                self._refreshing.difference_update((source, asset, quote) for asset in assets)
+
+    async def get_many_async(
+        self,
+        source: str,
+        assets: Sequence[str],
+        quote: str,
+        loader: Callable[[List[str]], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        """
+        Variante asyncio de `get_many`: `loader` é uma corrotina e as entradas são as mesmas
+        usadas pelas consultas síncronas.
+
+        Consultas simultâneas a um ativo que já está sendo buscado esperam essa busca em vez
+        de repeti-la: um `asyncio.gather` de cem consultas ao mesmo preço faz uma requisição.
+        """
+        found, missing, to_refresh = self._lookup(source, assets, quote)
+        loop = asyncio.get_running_loop()
+        if to_refresh:
+            self._track(loop.create_task(self._refresh_async(source, to_refresh, quote, loader)))
+        if missing:
+            loads = set()
+            own: List[str] = []
+            with self._lock:
+                for asset in missing:
+                    task = self._loading.get((source, asset, quote))
+                    if task is not None and task.get_loop() is loop:
+                        loads.add(task)
+                    else:
+                        own.append(asset)
+                if own:
+                    task = loop.create_task(self._load_async(source, own, quote, loader))
+                    for asset in own:
+                        self._loading[(source, asset, quote)] = task
+                    loads.add(task)
+            # `shield`: cancelar uma consulta não cancela a busca que outras estão esperando
+            for loaded in await asyncio.gather(*(asyncio.shield(task) for task in loads)):
+                found.update(loaded)
+        return {asset: found[asset] for asset in assets if asset in found}
+
+    async def get_async(self, source: str, asset: str, quote: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Variante asyncio de `get`: `loader` é uma corrotina sem argumentos.
+        """
+        async def load(assets: List[str]) -> Dict[str, Any]:
+            return {asset: await loader()}
+
+        return (await self.get_many_async(source, [asset], quote, load))[asset]
+
+    def _track(self, task: "asyncio.Task") -> None:
+        # O event loop guarda só referências fracas às tarefas
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_async(self, source: str, assets: List[str], quote: str, loader: Callable) -> Dict[str, Any]:
+        try:
+            fetched_at = time.monotonic()
+            loaded = await loader(assets)
+            self._store(source, quote, {asset: loaded[asset] for asset in assets if asset in loaded}, fetched_at)
+            return loaded
+        finally:
+            current = asyncio.current_task()
+            with self._lock:
+                for asset in assets:
+                    if self._loading.get((source, asset, quote)) is current:
+                        del self._loading[(source, asset, quote)]
+
+    async def _refresh_async(self, source: str, assets: List[str], quote: str, loader: Callable) -> None:
+        try:
+            fetched_at = time.monotonic()
+            loaded = await loader(assets)
+            self._store(source, quote, {asset: loaded[asset] for asset in assets if asset in loaded}, fetched_at)
+            with self._lock:
+                self._stats["refreshes"] += 1
+        except Exception as e:
+            logger.warning(f"Falha ao atualizar {source} {assets} em segundo plano: {e}")
+            with self._lock:
+                self._stats["refresh_errors"] += 1
+        finally:
+            with self._lock:
+                self._refreshing.difference_update((source, asset, quote) for asset in assets)
+
+    def invalidate(self, source: Optional[str] = None, assets: Optional[Iterable[str]] = None) -> None:
+        """
+        Remove entradas do cache: todas, as de uma fonte ou as de alguns ativos dela.
+        """
+        wanted = None if assets is None else set(assets)
+        with self._lock:
+            for key in list(self._entries):
+                if (source is None or key[0] == source) and (wanted is None or key[1] in wanted):
+                    del self._entries[key]
+
+    def stats(self) -> Dict:
+        """
+        Contadores de acertos, acertos stale, faltas, atualizações e descartes, e a taxa de acerto.
+        """
+        with self._lock:
+            stats = dict(self._stats, size=len(self._entries), max_entries=self.max_entries)
+        lookups = stats["hits"] + stats["stale_hits"] + stats["misses"]
+        stats["hit_rate"] = (stats["hits"] + stats["stale_hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def collect_metrics(self) -> Iterable[Sample]:
+        """
+        Amostras para o registro de métricas (`bsc_toolkit.metrics`): consultas por resultado,
+        taxa de acerto, atualizações em segundo plano, descartes e tamanho do cache.
+        """
+        stats = self.stats()
+        for result, key in (("hit", "hits"), ("stale", "stale_hits"), ("miss", "misses")):
+            yield ("bsc_price_cache_lookups_total", "counter", "Consultas ao cache de preços, por resultado.",
+                   {"result": result}, stats[key])
+        yield ("bsc_price_cache_hit_ratio", "gauge", "Fração das consultas atendidas pelo cache (inclui stale).",
+               {}, stats["hit_rate"])
+        for outcome, key in (("ok", "refreshes"), ("error", "refresh_errors")):
+            yield ("bsc_price_cache_refreshes_total", "counter", "Atualizações em segundo plano do cache de preços.",
+                   {"outcome": outcome}, stats[key])
+        yield ("bsc_price_cache_evictions_total", "counter", "Entradas descartadas pelo limite do cache (LRU).",
+               {}, stats["evictions"])
+        yield ("bsc_price_cache_entries", "gauge", "Entradas no cache de preços.", {}, stats["size"])
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_price_cache: Optional[PriceCache] = None
+_price_cache_lock = threading.Lock()
+
+
+def get_price_cache() -> PriceCache:
+    """
+    Devolve o cache de preços compartilhado por todos os módulos, criando-o na primeira chamada.
+    """
+    global _price_cache
+    with _price_cache_lock:
+        if _price_cache is None:
+            _price_cache = PriceCache()
+            REGISTRY.register_collector(_price_cache.collect_metrics)
+        return _price_cache
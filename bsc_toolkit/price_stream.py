@@ -0,0 +1,213 @@
+import asyncio
+import inspect
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# (token vendido, token comprado, quantidade vendida em unidades menores)
+Pair = Tuple[str, str, int]
+
+
+@dataclass
+class PriceUpdate:
+    """
+    Mudança de preço de um par entregue pelo `PriceStream`.
+    """
+
+    sell_token: str
+    buy_token: str
+    sell_amount: int
+    price: float
+    previous: Optional[float]
+    change: float  # Variação relativa desde o último preço entregue (0.0 no primeiro)
+    timestamp: float
+
+
+class PriceStream:
+    """
+    Acompanha o preço de muitos pares ao mesmo tempo com asyncio.
+
+    - Cada par tem seu próprio laço de consulta; um semáforo global limita quantas
+      consultas estão em andamento ao mesmo tempo (`max_concurrency`).
+    - O intervalo de cada par é adaptativo: cai pela metade quando o preço muda além do
+      limiar e cresce 50% quando fica estável, entre `min_interval` e `max_interval`.
+      Falhas também alongam o intervalo.
+    - Só variações relativas de pelo menos `threshold` são entregues, aos callbacks
+      registrados com `subscribe` e a quem iterar com `async for`.
+    - A fila de entrega é limitada (`queue_size`): se o consumidor atrasar, os pares
+      esperam para entregar em vez de acumular atualizações sem limite.
+
+    Args:
+        fetch (Callable): `fetch(sell_token, buy_token, sell_amount) -> float`, síncrona
+            (executada em threads) ou corrotina.
+        max_concurrency (int): Consultas simultâneas no total.
+        min_interval (float): Menor intervalo entre consultas de um par, em segundos.
+        max_interval (float): Maior intervalo entre consultas de um par, em segundos.
+        threshold (float): Variação relativa mínima para entregar um preço (0.001 = 0,1%).
+        queue_size (int): Capacidade da fila lida por `async for`.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str, str, int], Union[float, Awaitable[float]]],
+        max_concurrency: int = 8,
+        min_interval: float = 1.0,
+        max_interval: float = 60.0,
+        threshold: float = 0.001,
+        queue_size: int = 1000,
+    ):
+        self.fetch = fetch
+        self.max_concurrency = max_concurrency
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.threshold = threshold
+        self.queue_size = queue_size
+
+        self._pairs: List[Pair] = []
+        self._intervals: Dict[Pair, float] = {}
+        self._last: Dict[Pair, float] = {}
+        self._subscribers: List[Callable[[PriceUpdate], Union[None, Awaitable[None]]]] = []
+        self._queue: Optional["asyncio.Queue[Optional[PriceUpdate]]"] = None
+        self._tasks: List["asyncio.Task"] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._stopped: Optional[asyncio.Event] = None
+        self.polls = 0
+        self.errors = 0
+
+    def add_pair(self, sell_token: str, buy_token: str, sell_amount: int) -> None:
+        """
+        Acrescenta um par a acompanhar (pode ser chamado com o stream em execução).
+        """
+        pair = (sell_token, buy_token, sell_amount)
+        if pair in self._intervals:
+            return
+        self._pairs.append(pair)
+        self._intervals[pair] = self.min_interval
+        if self._semaphore is not None:
+            self._tasks.append(asyncio.get_running_loop().create_task(self._poll(pair)))
+
+    def subscribe(self, callback: Callable[[PriceUpdate], Union[None, Awaitable[None]]]) -> None:
+        """
+        Registra um callback (função ou corrotina) chamado a cada mudança entregue.
+        """
+        self._subscribers.append(callback)
+
+    def interval(self, sell_token: str, buy_token: str, sell_amount: int) -> float:
+        """
+        Intervalo atual de consulta de um par, em segundos.
+        """
+        return self._intervals[(sell_token, buy_token, sell_amount)]
+
+    # Execução
+
+    async def start(self) -> None:
+        """
+        Inicia um laço de consulta por par no event loop atual.
+        """
+        if self._semaphore is not None:
+            return
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._stopped = asyncio.Event()
+        if not inspect.iscoroutinefunction(self.fetch):
+            self._executor = ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="price-stream")
+        loop = asyncio.get_running_loop()
+        self._tasks = [loop.create_task(self._poll(pair)) for pair in self._pairs]
+
+    async def stop(self) -> None:
+        """
+        Interrompe todos os pares e encerra as iterações em andamento.
+        """
+        if self._stopped is None or self._stopped.is_set():
+            return
+        self._stopped.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._queue is not None:
+            # Sinaliza o fim para quem está em `async for`, descartando o que não foi lido
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+
+    async def run(self, duration: Optional[float] = None) -> None:
+        """
+        Executa o stream até `stop()` ser chamado ou por `duration` segundos.
+        """
+        await self.start()
+        try:
+            await asyncio.wait_for(self._stopped.wait(), duration)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            await self.stop()
+
+    async def __aenter__(self) -> "PriceStream":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.stop()
+
+    def __aiter__(self) -> AsyncIterator[PriceUpdate]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+        return self._iterate()
+
+    async def _iterate(self) -> AsyncIterator[PriceUpdate]:
+        while True:
+            update = await self._queue.get()
+            if update is None:
+                return
+            yield update
+
+    async def _fetch(self, pair: Pair) -> float:
+        async with self._semaphore:
+            if self._executor is None:
+                return await self.fetch(*pair)
+            return await asyncio.get_running_loop().run_in_executor(self._executor, self.fetch, *pair)
+
+    async def _poll(self, pair: Pair) -> None:
+        # Espalha o início para que centenas de pares não consultem todos no mesmo instante
+        await asyncio.sleep(random.uniform(0, self.min_interval))
+        while True:
+            interval = self._intervals[pair]
+            try:
+                price = await self._fetch(pair)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                self._intervals[pair] = min(self.max_interval, interval * 2)
+                logger.warning(f"Falha ao consultar {pair[0]}/{pair[1]}: {e}")
+            else:
+                self.polls += 1
+                previous = self._last.get(pair)
+                change = 0.0 if not previous else (price - previous) / previous
+                if previous is None or abs(change) >= self.threshold:
+                    self._last[pair] = price
+                    self._intervals[pair] = max(self.min_interval, interval / 2)
+                    await self._deliver(PriceUpdate(*pair, price, previous, change, time.time()))
+                else:
+                    self._intervals[pair] = min(self.max_interval, interval * 1.5)
+            await asyncio.sleep(self._intervals[pair])
+
+    async def _deliver(self, update: PriceUpdate) -> None:
+        for callback in self._subscribers:
+            try:
+                result = callback(update)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Erro no assinante de preços: {e}")
+        if self._queue is not None:
+            # Fila cheia: o par aguarda aqui (backpressure) até o consumidor ler
+            await self._queue.put(update)
@@ -0,0 +1,3 @@
+from .client import JsonRpcClient, JsonRpcError, RpcCall, RpcTransportError
+from .multicall import MULTICALL3_ADDRESS, aggregate3, decode_aggregate3, encode_aggregate3
+from .node_pool import NodePool, NodeStatus, NoHealthyNodeError, load_node_urls
@@ -0,0 +1,155 @@
+import itertools
+import time
+from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+
+import requests
+
+from ..metrics import record_rpc
+
+# Uma chamada JSON-RPC: (método, parâmetros)
+RpcCall = Tuple[str, Sequence[Any]]
+
+
+class JsonRpcError(Exception):
+    """
+    Erro devolvido por um nó JSON-RPC (campo "error" da resposta) ou falha de transporte.
+    """
+
+    def __init__(self, message: str, code: Optional[int] = None, data: Any = None):
+        super().__init__(message)
+        self.code = code
+        self.data = data
+
+
+class RpcTransportError(JsonRpcError):
+    """
+    Falha de transporte (timeout, conexão recusada, HTTP != 200, JSON inválido): o nó não respondeu.
+    """
+
+
+class JsonRpcClient:
+    """
+    Cliente JSON-RPC mínimo sobre HTTP com suporte a requisições em lote (batch).
+
+    Mantém uma única `requests.Session`, de modo que a conexão TCP/TLS com o nó é
+    reutilizada entre chamadas.
+
+    Args:
+        url (str): URL HTTP(S) do nó RPC.
+        timeout (float): Timeout de conexão/leitura em segundos.
+        session (requests.Session, opcional): Sessão a ser reutilizada.
+    """
+
+    def __init__(self, url: str, timeout: float = 10.0, session: Optional[requests.Session] = None):
+        self.url = url
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.http_requests = 0
+        self._ids = itertools.count(1)
+
+    def call(self, method: str, params: Sequence[Any] = ()) -> Any:
+        """
+        Executa uma única chamada JSON-RPC e retorna o campo "result".
+
+        Raises:
+            JsonRpcError: Se o nó devolver um erro.
+            RpcTransportError: Se a requisição HTTP falhar.
+        """
+        payload = {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": list(params)}
+        reply = self._post(payload, method)
+        if not isinstance(reply, dict):
+            raise JsonRpcError(f"Resposta inesperada para {method}: {reply!r}")
+        return _unwrap(reply)
+
+    def batch(self, calls: Iterable[RpcCall]) -> List[Union[Any, JsonRpcError]]:
+        """
+        Envia várias chamadas em uma única requisição HTTP (JSON-RPC batch).
+
+        Erros são isolados por item: a posição correspondente da lista retornada recebe
+        uma instância de `JsonRpcError` em vez do resultado.
+
+        Args:
+            calls (Iterable[RpcCall]): Pares (método, parâmetros).
+
+        Returns:
+            list: Resultados na mesma ordem das chamadas.
+
+        Raises:
+            RpcTransportError: Se a requisição HTTP inteira falhar.
+        """
+        payload = [
+            {"jsonrpc": "2.0", "id": next(self._ids), "method": method, "params": list(params)}
+            for method, params in calls
+        ]
+        if not payload:
+            return []
+
+        replies = self._post(payload, "batch")
+
+        if isinstance(replies, dict):
+            # Alguns nós respondem com um único objeto de erro quando recusam o lote inteiro
+            error = _as_error(replies.get("error") or {"message": f"Resposta inesperada: {replies!r}"})
+            return [error] * len(payload)
+
+        by_id = {reply.get("id"): reply for reply in replies if isinstance(reply, dict)}
+        results: List[Union[Any, JsonRpcError]] = []
+        for request in payload:
+            reply = by_id.get(request["id"])
+            if reply is None:
+                results.append(JsonRpcError(f"Sem resposta para {request['method']} (id {request['id']})"))
+                continue
+            try:
+                results.append(_unwrap(reply))
+            except JsonRpcError as e:
+                results.append(e)
+        return results
+
+    def _post(self, payload: Any, method: str) -> Any:
+        self.http_requests += 1
+        started = time.perf_counter()
+        try:
+            response = self.session.post(self.url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            reply = response.json()
+        except requests.exceptions.RequestException as e:
+            record_rpc(self.url, method, time.perf_counter() - started, error=_error_kind(e))
+            raise RpcTransportError(f"Erro na requisição ao nó {self.url}: {e}") from e
+        except ValueError as e:
+            record_rpc(self.url, method, time.perf_counter() - started, len(response.content), "invalid_json")
+            raise RpcTransportError(f"Resposta JSON inválida do nó {self.url}: {e}") from e
+        record_rpc(self.url, method, time.perf_counter() - started, len(response.content))
+        return reply
+
+    def close(self) -> None:
+        self.session.close()
+
+
+def block_param(block_identifier: Union[str, int]) -> str:
+    """
+    Converte um número de bloco (int) para o formato hexadecimal esperado pelo JSON-RPC.
+    """
+    return hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+
+
+def _error_kind(error: requests.exceptions.RequestException) -> str:
+    if isinstance(error, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "connection"
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return f"http_{error.response.status_code}"
+    return "request"
+
+
+def _as_error(error: Any) -> JsonRpcError:
+    if isinstance(error, dict):
+        return JsonRpcError(str(error.get("message", error)), error.get("code"), error.get("data"))
+    return JsonRpcError(str(error))
+
+
+def _unwrap(reply: dict) -> Any:
+    if reply.get("error") is not None:
+        raise _as_error(reply["error"])
+    if "result" not in reply:
+        raise JsonRpcError(f"Resultado não encontrado na resposta: {reply!r}")
+    return reply["result"]
@@ -0,0 +1,86 @@
+from typing import List, Optional, Sequence, Tuple, Union
+
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+from .client import JsonRpcClient, block_param
+
+# Multicall3 é implantado no mesmo endereço em praticamente todas as redes EVM, incluindo a BSC
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+AGGREGATE3_SELECTOR = function_signature_to_4byte_selector("aggregate3((address,bool,bytes)[])")
+
+# Uma sub-chamada: (endereço do contrato, calldata)
+Call = Tuple[str, bytes]
+# Resultado de uma sub-chamada: (sucesso, dados de retorno)
+CallResult = Tuple[bool, bytes]
+
+
+def encode_aggregate3(calls: Sequence[Call], allow_failure: bool = True) -> str:
+    """
+    Codifica uma chamada `aggregate3` do Multicall3.
+
+    Com `allow_failure=True` uma sub-chamada que reverte não derruba as demais.
+
+    Returns:
+        str: Calldata em hexadecimal, pronto para `eth_call`.
+    """
+    args = [(to_checksum_address(target), allow_failure, data) for target, data in calls]
+    return "0x" + (AGGREGATE3_SELECTOR + encode(["(address,bool,bytes)[]"], [args])).hex()
+
+
+def decode_aggregate3(return_data: Union[str, bytes]) -> List[CallResult]:
+    """
+    Decodifica o retorno de `aggregate3` em uma lista de (sucesso, dados).
+    """
+    if isinstance(return_data, str):
+        return_data = bytes.fromhex(return_data[2:] if return_data.startswith("0x") else return_data)
+    (results,) = decode(["(bool,bytes)[]"], return_data)
+    return [(bool(success), bytes(data)) for success, data in results]
+
+
+def aggregate3(
+    rpc: JsonRpcClient,
+    calls: Sequence[Call],
+    block_identifier: Union[str, int] = "latest",
+    multicall_address: str = MULTICALL3_ADDRESS,
+) -> List[CallResult]:
+    """
+    Executa várias chamadas de leitura em um único `eth_call` via Multicall3.
+
+    Args:
+        rpc (JsonRpcClient): Cliente do nó RPC.
+        calls (Sequence[Call]): Pares (contrato, calldata).
+        block_identifier (str | int): Bloco em que as leituras são feitas.
+        multicall_address (str): Endereço do contrato Multicall3.
+
+    Returns:
+        list: (sucesso, dados de retorno) para cada sub-chamada, na ordem recebida.
+
+    Raises:
+        JsonRpcError: Se o próprio `eth_call` falhar.
+    """
+    if not calls:
+        return []
+    result = rpc.call("eth_call", [aggregate3_request(calls, multicall_address), block_param(block_identifier)])
+    return decode_aggregate3(result)
+
+
+def aggregate3_request(calls: Sequence[Call], multicall_address: str = MULTICALL3_ADDRESS) -> dict:
+    """
+    Monta o objeto de transação do `eth_call` para um lote de sub-chamadas.
+    """
+    return {"to": multicall_address, "data": encode_aggregate3(calls)}
+
+
+def safe_decode(types: List[str], data: bytes) -> Optional[tuple]:
+    """
+    Decodifica dados ABI retornando None em vez de levantar exceção (retorno vazio ou malformado).
+    """
+    if not data:
+        return None
+    try:
+        return decode(types, data)
+    except Exception:
+        return None
+
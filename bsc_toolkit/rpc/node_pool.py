@@ -0,0 +1,373 @@
+import logging
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..env import get_env
+from .client import JsonRpcClient, JsonRpcError, RpcCall, RpcTransportError
+
+logger = logging.getLogger(__name__)
+
+# Variáveis de ambiente com as URLs dos nós da rede principal (1 a 12)
+NODE_URL_ENV_PREFIX = "BINANCE_SMART_CHAIN_MAINNET_NODE_URL_"
+MAX_NODE_URLS = 12
+
+
+def load_node_urls(prefix: str = NODE_URL_ENV_PREFIX, count: int = MAX_NODE_URLS) -> List[str]:
+    """
+    Monta a lista de nós RPC a partir das variáveis `<prefix>1` ... `<prefix><count>` (ambiente ou `.env`),
+    ignorando as não definidas.
+    """
+    urls = [get_env(f"{prefix}{i}") for i in range(1, count + 1)]
+    return [url for url in urls if url]
+
+
+class NoHealthyNodeError(RpcTransportError):
+    """
+    Nenhum nó do pool respondeu (todos falharam, expiraram ou estão atrasados).
+    """
+
+
+@dataclass
+class NodeStatus:
+    """
+    Estado de um nó do pool, atualizado a cada sondagem e a cada chamada.
+    """
+
+    url: str
+    client: JsonRpcClient = field(repr=False)
+    healthy: bool = False
+    latency: Optional[float] = None  # Média móvel exponencial, em segundos
+    latest_block: Optional[int] = None
+    block_lag: int = 0
+    failures: int = 0
+    error: Optional[str] = None
+    _web3: Any = field(default=None, repr=False)
+
+    @property
+    def web3(self):
+        """
+        Instância Web3 para o nó, criada na primeira utilização (mesmo timeout do pool).
+        """
+        if self._web3 is None:
+            from .web3_provider import instrumented_web3
+
+            self._web3 = instrumented_web3(self.url, self.client.timeout)
+        return self._web3
+
+    def observe_latency(self, seconds: float, weight: float = 0.2) -> None:
+        self.latency = seconds if self.latency is None else (1 - weight) * self.latency + weight * seconds
+
+    def as_connection(self) -> Dict:
+        """
+        Formato de dicionário usado pelos antigos `connect_to_node`.
+        """
+        return {"url": self.url, "web3": self.web3, "latest_block": self.latest_block}
+
+
+class NodePool:
+    """
+    Pool de nós RPC da BSC com sondagem concorrente, ranking e failover automático.
+
+    Todos os nós são sondados em paralelo (`eth_blockNumber`) com prazo máximo de
+    `probe_deadline` segundos: quem não responde a tempo ou está mais de
+    `max_block_lag` blocos atrás do nó mais adiantado fica fora do ranking.
+    Os nós saudáveis são ordenados por latência medida + penalidade por bloco de atraso.
+
+    Cada chamada vai para o melhor nó; uma falha de transporte (timeout, conexão)
+    marca o nó como indisponível e a chamada segue para o próximo do ranking.
+
+    A nova sondagem é preguiçosa: não há timer. A primeira consulta ao ranking depois de
+    `reprobe_interval` segundos dispara uma sondagem em segundo plano (a chamada segue
+    com o ranking atual, sem esperar), o que devolve ao ranking os nós que se recuperaram
+    e tira os que ficaram para trás. Um pool ocioso não percebe essas mudanças até a
+    próxima chamada; para atualizar antes dela, chame `probe()`.
+
+    O pool expõe `call`/`batch` como o `JsonRpcClient`, então pode ser usado no lugar dele.
+
+    Args:
+        urls (Iterable[str]): URLs dos nós. Por padrão, as variáveis `BINANCE_SMART_CHAIN_MAINNET_NODE_URL_*`.
+        timeout (float): Timeout de cada requisição a um nó, em segundos.
+        probe_deadline (float): Prazo total de uma sondagem, em segundos.
+        max_block_lag (int): Atraso máximo, em blocos, para um nó ser considerado saudável.
+        lag_penalty (float): Segundos somados à latência por bloco de atraso no ranking.
+        reprobe_interval (float): Idade mínima, em segundos, do ranking para a próxima
+            consulta disparar uma nova sondagem em segundo plano.
+        hedge_delay (float, opcional): Espera antes de duplicar uma chamada "hedged".
+            Por padrão, duas vezes a latência do melhor nó.
+    """
+
+    def __init__(
+        self,
+        urls: Optional[Iterable[str]] = None,
+        timeout: float = 5.0,
+        probe_deadline: float = 3.0,
+        max_block_lag: int = 5,
+        lag_penalty: float = 0.1,
+        reprobe_interval: float = 30.0,
+        hedge_delay: Optional[float] = None,
+    ):
+        urls = list(dict.fromkeys(load_node_urls() if urls is None else [u for u in urls if u]))
+        if not urls:
+            raise ValueError("Nenhuma URL de nó RPC configurada.")
+
+        self.timeout = timeout
+        self.probe_deadline = probe_deadline
+        self.max_block_lag = max_block_lag
+        self.lag_penalty = lag_penalty
+        self.reprobe_interval = reprobe_interval
+        self.hedge_delay = hedge_delay
+        self.nodes = [NodeStatus(url=url, client=JsonRpcClient(url, timeout=timeout)) for url in urls]
+
+        self._lock = threading.Lock()
+        self._ranking: List[NodeStatus] = []
+        self._last_probe = 0.0
+        self._reprobing = False
+        # Sondagens e chamadas "hedged" rodam neste executor
+        self._executor = ThreadPoolExecutor(max_workers=max(4, 2 * len(urls)), thread_name_prefix="node-pool")
+
+    # Sondagem e ranking
+
+    def probe(self) -> List[NodeStatus]:
+        """
+        Sonda todos os nós em paralelo, respeitando `probe_deadline`, e refaz o ranking.
+
+        Returns:
+            list: Nós saudáveis, do melhor para o pior.
+        """
+        started = time.monotonic()
+        futures = {self._executor.submit(self._probe_node, node): node for node in self.nodes}
+        done, pending = wait(futures, timeout=self.probe_deadline)
+
+        heights: Dict[str, int] = {}
+        with self._lock:
+            for future in done:
+                node = futures[future]
+                try:
+                    heights[node.url], elapsed = future.result()
+                    node.observe_latency(elapsed, weight=0.5)
+                    node.latest_block = heights[node.url]
+                    node.error = None
+                except Exception as e:
+                    node.healthy = False
+                    node.failures += 1
+                    node.error = str(e)
+            for future in pending:
+                node = futures[future]
+                node.healthy = False
+                node.failures += 1
+                node.error = f"sem resposta em {self.probe_deadline:.1f}s"
+
+            tip = max(heights.values(), default=0)
+            for node in self.nodes:
+                if node.url not in heights:
+                    continue
+                node.block_lag = tip - heights[node.url]
+                node.healthy = node.block_lag <= self.max_block_lag
+                if not node.healthy:
+                    node.error = f"{node.block_lag} blocos atrás"
+            self._rerank()
+            self._last_probe = time.monotonic()
+
+        logger.debug(f"Sondagem de {len(self.nodes)} nós em {time.monotonic() - started:.3f}s: "
+                     f"{len(self._ranking)} saudáveis")
+        return list(self._ranking)
+
+    def _probe_node(self, node: NodeStatus):
+        started = time.monotonic()
+        height = int(node.client.call("eth_blockNumber"), 16)
+        return height, time.monotonic() - started
+
+    def _score(self, node: NodeStatus) -> float:
+        return (node.latency or self.timeout) + node.block_lag * self.lag_penalty
+
+    def _rerank(self) -> None:
+        self._ranking = sorted((node for node in self.nodes if node.healthy), key=self._score)
+
+    def ranking(self) -> List[NodeStatus]:
+        """
+        Nós saudáveis, do melhor para o pior (sonda o pool na primeira utilização).
+        """
+        self._ensure_probed()
+        return list(self._ranking)
+
+    def best(self) -> NodeStatus:
+        """
+        Melhor nó saudável no momento.
+
+        Raises:
+            NoHealthyNodeError: Se nenhum nó estiver saudável.
+        """
+        ranking = self.ranking()
+        if not ranking:
+            raise NoHealthyNodeError("Nenhum nó RPC saudável disponível.")
+        return ranking[0]
+
+    def common_block(self) -> int:
+        """
+        Último bloco que todos os nós do ranking já têm: o menor topo entre eles.
+
+        Leituras distribuídas entre os nós devem ficar fixadas neste bloco; o último bloco
+        do nó mais adiantado pode ainda não existir nos que estão até `max_block_lag` atrás.
+
+        Raises:
+            NoHealthyNodeError: Se nenhum nó estiver saudável.
+        """
+        heights = [node.latest_block for node in self._candidates() if node.latest_block is not None]
+        if heights:
+            return min(heights)
+        return int(self.call("eth_blockNumber"), 16) - self.max_block_lag
+
+    def _ensure_probed(self) -> None:
+        if not self._last_probe:
+            self.probe()
+        elif time.monotonic() - self._last_probe >= self.reprobe_interval:
+            self._reprobe_in_background()
+
+    def _reprobe_in_background(self) -> None:
+        with self._lock:
+            if self._reprobing:
+                return
+            self._reprobing = True
+
+        def run():
+            try:
+                self.probe()
+            finally:
+                with self._lock:
+                    self._reprobing = False
+
+        self._executor.submit(run)
+
+    def _mark_failed(self, node: NodeStatus, error: Exception) -> None:
+        with self._lock:
+            node.healthy = False
+            node.failures += 1
+            node.error = str(error)
+            self._rerank()
+        logger.warning(f"Nó {node.url} indisponível ({error}); usando o próximo do ranking.")
+
+    # Chamadas
+
+    def _candidates(self) -> List[NodeStatus]:
+        ranking = self.ranking()
+        if not ranking:
+            # Todos caíram desde a última sondagem: tenta uma nova antes de desistir
+            ranking = self.probe()
+        if not ranking:
+            raise NoHealthyNodeError("Nenhum nó RPC saudável disponível.")
+        return ranking
+
+    def _execute(self, node: NodeStatus, fn, *args):
+        started = time.monotonic()
+        result = fn(node.client, *args)
+        with self._lock:
+            node.observe_latency(time.monotonic() - started)
+        return result
+
+    def _with_failover(self, fn, *args):
+        last_error: Optional[Exception] = None
+        for node in self._candidates():
+            try:
+                return self._execute(node, fn, *args)
+            except RpcTransportError as e:
+                self._mark_failed(node, e)
+                last_error = e
+        raise NoHealthyNodeError(f"Todos os nós RPC falharam: {last_error}")
+
+    def call(self, method: str, params: Sequence[Any] = (), hedge: bool = False) -> Any:
+        """
+        Executa uma chamada JSON-RPC no melhor nó, com failover para os seguintes.
+
+        Args:
+            method (str): Método JSON-RPC.
+            params (Sequence): Parâmetros.
+            hedge (bool): Se True, duplica a chamada no segundo melhor nó caso o primeiro
+                não responda dentro de `hedge_delay`; vale a primeira resposta.
+
+        Raises:
+            JsonRpcError: Erro devolvido pelo nó (ex.: execution reverted).
+            NoHealthyNodeError: Se nenhum nó responder.
+        """
+        if hedge:
+            return self._hedged(lambda client: client.call(method, params))
+        return self._with_failover(lambda client: client.call(method, params))
+
+    def batch(self, calls: Iterable[RpcCall], hedge: bool = False) -> List[Any]:
+        """
+        Envia um lote JSON-RPC ao melhor nó, com failover se a requisição inteira falhar.
+        """
+        calls = list(calls)
+        if hedge:
+            return self._hedged(lambda client: client.batch(calls))
+        return self._with_failover(lambda client: client.batch(calls))
+
+    def _hedged(self, fn):
+        candidates = self._candidates()
+        delay = self.hedge_delay
+        if delay is None:
+            delay = 2 * (candidates[0].latency or self.timeout / 4)
+
+        pending = {}
+        queue = list(candidates)
+        last_error: Optional[Exception] = None
+
+        def launch():
+            node = queue.pop(0)
+            pending[self._executor.submit(self._execute, node, fn)] = node
+
+        launch()
+        while pending:
+            # Enquanto houver nós de reserva, espera no máximo `delay` antes de duplicar a chamada
+            done, _ = wait(pending, timeout=delay if queue else None, return_when=FIRST_COMPLETED)
+            if not done:
+                launch()
+                continue
+            for future in done:
+                node = pending.pop(future)
+                try:
+                    return future.result()
+                except RpcTransportError as e:
+                    self._mark_failed(node, e)
+                    last_error = e
+                except JsonRpcError:
+                    # Erro legítimo do nó (ex.: revert): não adianta perguntar a outro
+                    raise
+            if not pending and queue:
+                launch()
+        raise NoHealthyNodeError(f"Todos os nós RPC falharam: {last_error}")
+
+    # Compatibilidade
+
+    def connect(self) -> Dict:
+        """
+        Lê o último bloco no melhor nó disponível (com failover) e o devolve no formato
+        de dicionário dos antigos `connect_to_node` ({"url", "web3", "latest_block"}).
+
+        Raises:
+            NoHealthyNodeError: Se nenhum nó responder.
+        """
+        last_error: Optional[Exception] = None
+        for node in self._candidates():
+            try:
+                height = int(self._execute(node, lambda client: client.call("eth_blockNumber")), 16)
+            except RpcTransportError as e:
+                self._mark_failed(node, e)
+                last_error = e
+                continue
+            node.latest_block = height
+            return node.as_connection()
+        raise NoHealthyNodeError(f"Todos os nós RPC falharam: {last_error}")
+
+    def connections(self) -> List[Dict]:
+        """
+        Nós saudáveis no formato de dicionário dos antigos `connect_to_node`, do melhor para o pior.
+        """
+        return [node.as_connection() for node in self.ranking()]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        for node in self.nodes:
+            node.client.close()
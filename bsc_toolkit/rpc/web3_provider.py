@@ -0,0 +1,57 @@
+import time
+from typing import Any, List, Tuple
+
+import requests
+from web3 import HTTPProvider
+
+from ..metrics import record_rpc
+
+
+class InstrumentedHTTPProvider(HTTPProvider):
+    """
+    `HTTPProvider` do Web3 que registra cada requisição em `bsc_toolkit.metrics`
+    (mesmas métricas do `JsonRpcClient`: latência e resultado por nó e método).
+
+    Fica fora de `bsc_toolkit.rpc.__init__` porque importar o web3 é caro; os pontos
+    que criam instâncias Web3 importam este módulo só quando precisam delas.
+    """
+
+    def make_request(self, method: str, params: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            response = super().make_request(method, params)
+        except Exception as e:
+            record_rpc(self.endpoint_uri, method, time.perf_counter() - started, error=_error_kind(e))
+            raise
+        error = "rpc_error" if isinstance(response, dict) and response.get("error") is not None else None
+        record_rpc(self.endpoint_uri, method, time.perf_counter() - started, error=error)
+        return response
+
+    def make_batch_request(self, batch_requests: List[Tuple[str, Any]]) -> Any:
+        started = time.perf_counter()
+        try:
+            response = super().make_batch_request(batch_requests)
+        except Exception as e:
+            record_rpc(self.endpoint_uri, "batch", time.perf_counter() - started, error=_error_kind(e))
+            raise
+        record_rpc(self.endpoint_uri, "batch", time.perf_counter() - started)
+        return response
+
+
+def _error_kind(error: Exception) -> str:
+    if isinstance(error, requests.exceptions.Timeout):
+        return "timeout"
+    if isinstance(error, requests.exceptions.ConnectionError):
+        return "connection"
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return f"http_{error.response.status_code}"
+    return "error"
+
+
+def instrumented_web3(url: str, timeout: float) -> Any:
+    """
+    Cria uma instância Web3 para `url` com o provedor instrumentado.
+    """
+    from web3 import Web3
+
+    return Web3(InstrumentedHTTPProvider(url, request_kwargs={"timeout": timeout}))
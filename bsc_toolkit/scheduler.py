@@ -0,0 +1,269 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from .http_client import ApiRateLimitError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CreditsExhaustedError(ApiRateLimitError):
+    """
+    A requisição não pôde ser admitida: o orçamento de créditos do período acabou
+    ou o provedor continuou recusando após todas as tentativas.
+    """
+
+
+class CreditScheduler:
+    """
+    Agendador de requisições que conhece o limite por minuto e o custo em créditos de cada chamada.
+
+    Em vez de uma pausa fixa após cada requisição, uma chamada é admitida assim que houver
+    espaço na janela deslizante de 60 s e créditos suficientes no período. Chamadas
+    independentes podem ser executadas em paralelo com `submit` (ou `gather`, para funções
+    que já chamam `execute`); todas passam pela mesma admissão. Corrotinas usam
+    `execute_async`, que espera sem bloquear o event loop e divide a mesma contabilidade.
+
+    Quando o provedor devolve 429 (limite por minuto ou créditos), a admissão é pausada
+    para todos (respeitando `Retry-After` ou com backoff exponencial) e a chamada volta
+    para a fila até `max_attempts` tentativas.
+
+    Args:
+        requests_per_minute (int): Requisições permitidas em qualquer janela de 60 s.
+        credit_limit (int, opcional): Créditos disponíveis em `credit_period` (None = sem limite).
+        credit_period (float): Duração do período de créditos, em segundos (padrão: um dia).
+        max_concurrency (int): Chamadas executadas em paralelo por `submit`/`gather`.
+        max_attempts (int): Tentativas por chamada diante de 429 antes de desistir.
+        backoff (float): Pausa inicial após um 429 sem `Retry-After`, em segundos.
+        max_backoff (float): Pausa máxima, em segundos.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = 30,
+        credit_limit: Optional[int] = None,
+        credit_period: float = 86_400.0,
+        max_concurrency: int = 4,
+        max_attempts: int = 5,
+        backoff: float = 2.0,
+        max_backoff: float = 60.0,
+    ):
+        self.requests_per_minute = requests_per_minute
+        self.credit_limit = credit_limit
+        self.credit_period = credit_period
+        self.max_concurrency = max_concurrency
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._requests: Deque[float] = deque()
+        self._credits: Deque[Tuple[float, float]] = deque()
+        self._credits_used = 0.0
+        self._paused_until = 0.0
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="credit-scheduler")
+
+    # Contabilidade
+
+    def _expire(self, now: float) -> None:
+        while self._requests and now - self._requests[0] >= 60.0:
+            self._requests.popleft()
+        while self._credits and now - self._credits[0][0] >= self.credit_period:
+            self._credits_used -= self._credits.popleft()[1]
+
+    def _wait_time(self, credits: float, now: float) -> float:
+        """
+        Segundos até a chamada poder ser admitida (0 = agora).
+        """
+        waits = [self._paused_until - now]
+        if len(self._requests) >= self.requests_per_minute:
+            waits.append(self._requests[0] + 60.0 - now)
+        if self.credit_limit is not None and self._credits_used + credits > self.credit_limit:
+            if credits > self.credit_limit or not self._credits:
+                raise CreditsExhaustedError(
+                    f"Chamada de {credits} créditos excede o orçamento de {self.credit_limit}.", status=None
+                )
+            # Espera o crédito mais antigo sair do período; repete o cálculo na próxima volta
+            waits.append(self._credits[0][0] + self.credit_period - now)
+        return max(waits)
+
+    def acquire(self, credits: float = 1, timeout: Optional[float] = None) -> None:
+        """
+        Bloqueia até haver espaço na janela por minuto e créditos suficientes, e registra o uso.
+
+        Raises:
+            CreditsExhaustedError: Se `timeout` expirar ou a chamada custar mais que o orçamento inteiro.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                wait = self._admit(credits, now)
+                if wait <= 0:
+                    return
+                if deadline is not None:
+                    if now >= deadline:
+                        raise CreditsExhaustedError("Tempo esgotado aguardando orçamento de requisições.", status=None)
+                    wait = min(wait, deadline - now)
+                self._condition.wait(wait)
+
+    async def acquire_async(self, credits: float = 1) -> None:
+        """
+        Variante asyncio de `acquire`: espera com `asyncio.sleep`, sem bloquear o event loop.
+        A contabilidade é a mesma das chamadas síncronas.
+        """
+        while True:
+            with self._condition:
+                wait = self._admit(credits, time.monotonic())
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _admit(self, credits: float, now: float) -> float:
+        """
+        Registra o uso e devolve 0 se a chamada puder ser admitida; senão, os segundos de espera.
+        Chamado com `_condition` adquirida.
+        """
+        self._expire(now)
+        wait = self._wait_time(credits, now)
+        if wait <= 0:
+            self._requests.append(now)
+            if credits:
+                self._credits.append((now, credits))
+                self._credits_used += credits
+        return wait
+
+    def reconcile(self, estimated: float, actual: float) -> None:
+        """
+        Ajusta o uso de créditos quando o provedor informa o custo real de uma chamada.
+        """
+        if actual == estimated:
+            return
+        with self._condition:
+            now = time.monotonic()
+            self._credits.append((now, actual - estimated))
+            self._credits_used += actual - estimated
+            self._condition.notify_all()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Suspende a admissão de novas chamadas por `seconds` segundos.
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"Limite do provedor atingido; novas requisições aguardam {seconds:.1f}s.")
+
+    def sync(self, requests_left: Optional[int] = None, credits_left: Optional[float] = None) -> None:
+        """
+        Alinha a contabilidade local ao que o provedor informa como restante.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._expire(now)
+            if requests_left is not None:
+                missing = self.requests_per_minute - requests_left - len(self._requests)
+                self._requests.extend([now] * max(0, missing))
+            if credits_left is not None and self.credit_limit is not None:
+                delta = self.credit_limit - credits_left - self._credits_used
+                if delta:
+                    self._credits.append((now, delta))
+                    self._credits_used += delta
+            self._condition.notify_all()
+
+    def budget(self) -> Dict:
+        """
+        Orçamento restante: requisições na janela atual, créditos no período e pausa em curso.
+        """
+        with self._condition:
+            now = time.monotonic()
+            self._expire(now)
+            return {
+                "requests_remaining": max(0, self.requests_per_minute - len(self._requests)),
+                "requests_per_minute": self.requests_per_minute,
+                "credits_remaining": None if self.credit_limit is None
+                else max(0.0, self.credit_limit - self._credits_used),
+                "credit_limit": self.credit_limit,
+                "paused_for": max(0.0, self._paused_until - now),
+            }
+
+    # Execução
+
+    def execute(self, fn: Callable[[], T], credits: float = 1) -> T:
+        """
+        Executa `fn` quando houver orçamento; diante de 429, pausa a admissão e tenta de novo.
+
+        Raises:
+            CreditsExhaustedError: Se o provedor continuar recusando após `max_attempts` tentativas.
+        """
+        for attempt in range(self.max_attempts):
+            self.acquire(credits)
+            try:
+                return fn()
+            except ApiRateLimitError as e:
+                if isinstance(e, CreditsExhaustedError):
+                    raise
+                delay = e.retry_after if e.retry_after is not None else self.backoff * 2 ** attempt
+                self.pause(min(delay, self.max_backoff))
+                last_error = e
+        raise CreditsExhaustedError(
+            f"Provedor recusou a requisição {self.max_attempts} vezes: {last_error}",
+            last_error.provider, last_error.url, last_error.status, last_error.body,
+        )
+
+    async def execute_async(self, fn: Callable[[], Awaitable[T]], credits: float = 1) -> T:
+        """
+        Variante asyncio de `execute`: `fn` devolve uma corrotina, e as pausas diante de 429
+        valem também para as chamadas síncronas (e vice-versa).
+
+        Raises:
+            CreditsExhaustedError: Se o provedor continuar recusando após `max_attempts` tentativas.
+        """
+        for attempt in range(self.max_attempts):
+            await self.acquire_async(credits)
+            try:
+                return await fn()
+            except ApiRateLimitError as e:
+                if isinstance(e, CreditsExhaustedError):
+                    raise
+                delay = e.retry_after if e.retry_after is not None else self.backoff * 2 ** attempt
+                self.pause(min(delay, self.max_backoff))
+                last_error = e
+        raise CreditsExhaustedError(
+            f"Provedor recusou a requisição {self.max_attempts} vezes: {last_error}",
+            last_error.provider, last_error.url, last_error.status, last_error.body,
+        )
+
+    def submit(self, fn: Callable[[], T], credits: float = 1) -> "Future[T]":
+        """
+        Agenda `fn` para execução em paralelo, sujeita à mesma admissão de `execute`.
+        """
+        return self._executor.submit(self.execute, fn, credits)
+
+    def gather(self, *fns: Callable[[], Any], return_exceptions: bool = False) -> List[Any]:
+        """
+        Executa em paralelo chamadas independentes que já passam por `execute` (ex.: métodos
+        de um cliente de API) e devolve os resultados na ordem recebida.
+
+        Args:
+            *fns: Funções sem argumentos.
+            return_exceptions (bool): Se True, exceções entram na lista em vez de serem levantadas.
+        """
+        futures = [self._executor.submit(fn) for fn in fns]
+        results: List[Any] = []
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+        return results
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,5 @@
+from .generation import WORD_SIZES, build_wallet_record, create_wallet_keys, generate_wallets_bulk, iter_wallet_keys
+from .hd import HDWallet
+from .keystore import KdfParams, export_keystores, import_keystores
+from .store import WalletStore
+from .vanity import VanityPattern, build_vanity_record, search_vanity_address
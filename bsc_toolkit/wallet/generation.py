@@ -0,0 +1,173 @@
+import os
+import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import mnemonic
+from eth_account import Account
+
+# Tamanho da frase-semente (palavras) -> força da entropia (bits)
+WORD_SIZES = {
+    12: 128,
+    15: 160,
+    18: 192,
+    21: 224,
+    24: 256,
+}
+
+# Instância por processo: o construtor de `Mnemonic` lê a lista de palavras do disco
+_mnemonic: Optional[mnemonic.Mnemonic] = None
+
+
+def _init_worker() -> None:
+    global _mnemonic
+    Account.enable_unaudited_hdwallet_features()  # Habilitar recursos de mnemônico
+    _mnemonic = mnemonic.Mnemonic("english")
+
+
+def create_wallet_keys(strength: int) -> Tuple[str, str, str]:
+    """
+    Gera uma frase-semente e deriva dela a conta padrão (m/44'/60'/0'/0/0).
+
+    Args:
+        strength (int): Força da entropia em bits (128, 160, 192, 224 ou 256).
+
+    Returns:
+        tuple: (chave privada em hexadecimal, endereço público, frase-semente).
+    """
+    if _mnemonic is None:
+        _init_worker()
+    seed_phrase = _mnemonic.generate(strength=strength)
+    account = Account.from_mnemonic(seed_phrase)
+    return account._private_key.hex(), account.address, seed_phrase
+
+
+def _generate_chunk(count: int, strength: int) -> List[Tuple[str, str, str]]:
+    return [create_wallet_keys(strength) for _ in range(count)]
+
+
+def build_wallet_record(
+    private_key: str,
+    public_address: str,
+    seed_phrase: str,
+    block_number: Optional[int],
+    node_url: Optional[str],
+    timestamp: Optional[str] = None,
+) -> Dict:
+    """
+    Monta o registro de uma carteira no formato salvo em `wallets.json`.
+    """
+    timestamp = timestamp or datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+    wallet_id = str(uuid.uuid5(uuid.NAMESPACE_DNS, f"{public_address}-{timestamp}-{block_number}"))
+    return {
+        "wallet_id": wallet_id,
+        "private_key": private_key,
+        "public_address": public_address,
+        "seed_phrase": seed_phrase,
+        "timestamp": timestamp,
+        "block_number": block_number,
+        "node_url": node_url,
+    }
+
+
+def iter_wallet_keys(
+    count: int,
+    strength: int = 128,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> Iterator[List[Tuple[str, str, str]]]:
+    """
+    Gera `count` carteiras em um pool de processos, devolvendo lotes à medida que ficam prontos.
+
+    A derivação (PBKDF2 + BIP-32) é limitada por CPU, então cada processo recebe lotes de
+    `chunk_size` carteiras. No máximo `2 * workers` lotes ficam pendentes de cada vez, o que
+    mantém a memória constante mesmo para centenas de milhares de carteiras.
+
+    Args:
+        count (int): Número de carteiras.
+        strength (int): Força da entropia em bits.
+        workers (int, opcional): Processos do pool. Padrão: número de CPUs.
+        chunk_size (int): Carteiras por tarefa enviada a um processo.
+
+    Yields:
+        list: Lotes de (chave privada, endereço público, frase-semente), na ordem em que terminam.
+    """
+    if strength not in WORD_SIZES.values():
+        raise ValueError(f"Força inválida: {strength}. Use uma de {sorted(WORD_SIZES.values())}.")
+    if count <= 0:
+        return
+
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        # Sem ganho com um pool de um processo só: evita o custo de criar e serializar
+        remaining = count
+        while remaining:
+            size = min(chunk_size, remaining)
+            remaining -= size
+            yield _generate_chunk(size, strength)
+        return
+
+    sizes = [chunk_size] * (count // chunk_size) + ([count % chunk_size] if count % chunk_size else [])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        pending = set()
+        for size in sizes:
+            pending.add(executor.submit(_generate_chunk, size, strength))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+
+def generate_wallets_bulk(
+    count: int,
+    strength: int,
+    sink: Callable[[List[Dict]], None],
+    block_number: Optional[int] = None,
+    node_url: Optional[str] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+    progress: Optional[Callable[[int, int, float], None]] = None,
+) -> Dict:
+    """
+    Gera carteiras em lote, sem interação, e entrega os registros a `sink` lote a lote.
+
+    O número do bloco e a URL do nó são lidos uma única vez pelo chamador e valem para
+    todo o lote, em vez de uma conexão RPC por carteira.
+
+    Args:
+        count (int): Número de carteiras.
+        strength (int): Força da entropia em bits.
+        sink (Callable): Recebe cada lote de registros (ex.: grava no armazenamento).
+        block_number (int, opcional): Último bloco lido da BSC.
+        node_url (str, opcional): Nó RPC de onde o bloco foi lido.
+        workers (int, opcional): Processos do pool. Padrão: número de CPUs.
+        chunk_size (int): Carteiras por tarefa.
+        progress (Callable, opcional): Chamado como `progress(geradas, total, carteiras_por_segundo)`.
+
+    Returns:
+        dict: {"count", "seconds", "wallets_per_second", "workers"}.
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    generated = 0
+    for keys in iter_wallet_keys(count, strength, workers, chunk_size):
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        sink([
+            build_wallet_record(private_key, public_address, seed_phrase, block_number, node_url, timestamp)
+            for private_key, public_address, seed_phrase in keys
+        ])
+        generated += len(keys)
+        if progress:
+            progress(generated, count, generated / (time.perf_counter() - started))
+
+    elapsed = time.perf_counter() - started
+    return {
+        "count": generated,
+        "seconds": elapsed,
+        "wallets_per_second": generated / elapsed if elapsed else 0.0,
+        "workers": workers,
+    }
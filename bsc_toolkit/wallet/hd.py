@@ -0,0 +1,166 @@
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Iterator, List, Optional, Tuple
+
+from eth_account.hdaccount import seed_from_mnemonic
+from eth_account.hdaccount._utils import SECP256K1_N, ec_point, hmac_sha512
+from eth_account.hdaccount.deterministic import HardNode, Node, SoftNode, derive_child_key
+from eth_keys import keys
+
+from .generation import WORD_SIZES
+
+# Caminho BIP-44 das contas Ethereum/BSC; as contas são m/44'/60'/<conta>'/<troca>/<índice>
+BIP44_PREFIX = "m/44'/60'"
+
+# Uma conta derivada: (índice, chave privada em hexadecimal, endereço público)
+DerivedAccount = Tuple[int, str, str]
+
+# Chave estendida: (chave privada, chain code)
+ExtendedKey = Tuple[bytes, bytes]
+
+
+def derive_path(seed: bytes, nodes: List[Node]) -> ExtendedKey:
+    """
+    Deriva a chave estendida BIP-32 de um caminho a partir da semente (64 bytes).
+    """
+    master = hmac_sha512(b"Bitcoin seed", seed)
+    key, chain_code = master[:32], master[32:]
+    for node in nodes:
+        key, chain_code = derive_child_key(key, chain_code, node)
+    return key, chain_code
+
+
+def derive_children(parent: ExtendedKey, start: int, stop: int) -> List[DerivedAccount]:
+    """
+    Deriva os filhos não endurecidos `start..stop-1` de uma chave estendida.
+
+    O ponto público do pai é calculado uma única vez; cada filho custa um HMAC-SHA512,
+    uma soma modular e a multiplicação de curva do próprio endereço.
+    """
+    key, chain_code = parent
+    parent_point = ec_point(key)
+    accounts = []
+    for index in range(start, stop):
+        child_key, _ = _soft_child(key, chain_code, parent_point, index)
+        accounts.append((index, child_key.hex(), keys.PrivateKey(child_key).public_key.to_checksum_address()))
+    return accounts
+
+
+def _soft_child(key: bytes, chain_code: bytes, parent_point: bytes, index: int) -> ExtendedKey:
+    digest = hmac_sha512(chain_code, parent_point + index.to_bytes(4, "big"))
+    tweak = int.from_bytes(digest[:32], "big")
+    child = (tweak + int.from_bytes(key, "big")) % SECP256K1_N
+    if tweak >= SECP256K1_N or child == 0:
+        # Chave inválida (probabilidade < 2**-127): mesma regra do BIP-32 usada pelo eth_account
+        return derive_child_key(key, chain_code, SoftNode(index))
+    return child.to_bytes(32, "big"), digest[32:]
+
+
+class HDWallet:
+    """
+    Várias contas de uma mesma frase-semente, com a semente esticada uma única vez.
+
+    `Account.from_mnemonic` refaz, a cada conta, o PBKDF2 de 2048 rodadas da semente e
+    toda a derivação BIP-32 desde a chave mestra. Aqui a semente e a chave estendida do
+    nível de troca (m/44'/60'/<conta>'/<troca>) são calculadas no construtor e guardadas;
+    cada endereço m/.../<troca>/i deriva só o último nível. As chaves e endereços são os
+    mesmos de `Account.from_mnemonic(frase, account_path=wallet.path(i))`.
+
+    Args:
+        seed_phrase (str): Frase-semente BIP-39.
+        passphrase (str): Senha opcional da frase (BIP-39).
+        account (int): Conta BIP-44 (nível endurecido).
+        change (int): Nível de troca (0 = endereços externos).
+    """
+
+    def __init__(self, seed_phrase: str, passphrase: str = "", account: int = 0, change: int = 0):
+        self.seed_phrase = seed_phrase
+        self.account = account
+        self.change = change
+        seed = seed_from_mnemonic(seed_phrase, passphrase)
+        nodes = [HardNode(44), HardNode(60), HardNode(account), SoftNode(change)]
+        self._extended_key = derive_path(seed, nodes)
+
+    @classmethod
+    def generate(cls, strength: int = 128, **kwargs) -> "HDWallet":
+        """
+        Cria uma carteira HD com uma nova frase-semente da força indicada (em bits).
+        """
+        import mnemonic
+
+        if strength not in WORD_SIZES.values():
+            raise ValueError(f"Força inválida: {strength}. Use uma de {sorted(WORD_SIZES.values())}.")
+        return cls(mnemonic.Mnemonic("english").generate(strength=strength), **kwargs)
+
+    @property
+    def base_path(self) -> str:
+        return f"{BIP44_PREFIX}/{self.account}'/{self.change}"
+
+    def path(self, index: int) -> str:
+        """
+        Caminho de derivação completo da conta `index`.
+        """
+        return f"{self.base_path}/{index}"
+
+    def derive(self, index: int) -> Tuple[str, str]:
+        """
+        Deriva uma conta.
+
+        Returns:
+            tuple: (chave privada em hexadecimal, endereço público).
+        """
+        _, private_key, address = derive_children(self._extended_key, index, index + 1)[0]
+        return private_key, address
+
+    def derive_range(self, start: int, stop: int) -> List[DerivedAccount]:
+        """
+        Deriva as contas `start..stop-1` de uma vez.
+
+        Returns:
+            list: (índice, chave privada, endereço) de cada conta, em ordem.
+        """
+        return derive_children(self._extended_key, start, stop)
+
+    def iter_accounts(self, start: int = 0, stop: Optional[int] = None, chunk_size: int = 64) -> Iterator[DerivedAccount]:
+        """
+        Deriva as contas sob demanda, a partir de `start` (sem fim se `stop` for None).
+        """
+        while stop is None or start < stop:
+            end = start + chunk_size if stop is None else min(stop, start + chunk_size)
+            yield from derive_children(self._extended_key, start, end)
+            start = end
+
+    def iter_ranges(
+        self,
+        count: int,
+        start: int = 0,
+        workers: Optional[int] = None,
+        chunk_size: int = 256,
+    ) -> Iterator[List[DerivedAccount]]:
+        """
+        Deriva `count` contas a partir de `start` em um pool de processos, por faixas de índices.
+
+        Cada processo recebe apenas a chave estendida do nível de troca e uma faixa de
+        `chunk_size` índices; no máximo `2 * workers` faixas ficam pendentes de cada vez.
+
+        Yields:
+            list: Faixas de (índice, chave privada, endereço), na ordem em que terminam
+                (cada faixa em ordem de índice).
+        """
+        workers = workers or os.cpu_count() or 1
+        ranges = [(first, min(start + count, first + chunk_size)) for first in range(start, start + count, chunk_size)]
+        if workers == 1:
+            for first, stop in ranges:
+                yield self.derive_range(first, stop)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for first, stop in ranges:
+                pending.add(executor.submit(derive_children, self._extended_key, first, stop))
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+            for future in pending:
+                yield future.result()
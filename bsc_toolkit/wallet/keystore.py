@@ -0,0 +1,240 @@
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import eth_keyfile
+
+from .generation import build_wallet_record
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KdfParams:
+    """
+    Parâmetros da derivação da chave de um lote de keystores.
+
+    Args:
+        kdf (str): "scrypt" ou "pbkdf2".
+        work_factor (int, opcional): `n` do scrypt ou iterações do PBKDF2 (padrão do
+            eth-keyfile: 262144 e 1000000). Cada passo abaixo do padrão torna a exportação
+            mais rápida e o keystore mais fácil de atacar por força bruta.
+        salt_size (int): Tamanho do sal, em bytes.
+    """
+
+    kdf: str = "scrypt"
+    work_factor: Optional[int] = None
+    salt_size: int = 16
+
+    def __post_init__(self):
+        if self.kdf not in ("scrypt", "pbkdf2"):
+            raise ValueError(f"KDF inválida: {self.kdf}. Use scrypt ou pbkdf2.")
+        if self.kdf == "scrypt" and self.work_factor is not None and self.work_factor & (self.work_factor - 1):
+            raise ValueError(f"O fator de trabalho do scrypt precisa ser potência de 2: {self.work_factor}.")
+
+
+def keystore_filename(address: str, timestamp: Optional[datetime] = None) -> str:
+    """
+    Nome de arquivo no padrão do geth: UTC--<data ISO>--<endereço em minúsculas, sem 0x>.
+    """
+    timestamp = timestamp or datetime.now(timezone.utc)
+    return f"UTC--{timestamp.strftime('%Y-%m-%dT%H-%M-%S.%f')}Z--{address.lower().removeprefix('0x')}"
+
+
+def encrypt_wallets(records: List[Dict], password: str, params: KdfParams) -> List[Tuple[str, Dict]]:
+    """
+    Cifra as chaves privadas de um lote de carteiras em keystores V3.
+
+    Returns:
+        list: (endereço público, keystore) de cada carteira.
+    """
+    return [
+        (record["public_address"], eth_keyfile.create_keyfile_json(
+            bytes.fromhex(record["private_key"].removeprefix("0x")), password.encode("utf-8"),
+            kdf=params.kdf, iterations=params.work_factor, salt_size=params.salt_size,
+        ))
+        for record in records
+    ]
+
+
+def decrypt_keystores(paths: List[str], password: str) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """
+    Decifra um lote de arquivos keystore.
+
+    Returns:
+        list: (caminho, chave privada em hexadecimal, endereço) de cada arquivo; chave e
+            endereço são None quando o arquivo não pôde ser decifrado (senha errada, formato inválido).
+    """
+    from eth_keys import keys
+
+    results = []
+    for path in paths:
+        try:
+            private_key = eth_keyfile.extract_key_from_keyfile(path, password.encode("utf-8"))
+        except (ValueError, KeyError, OSError) as e:
+            logger.warning(f"Não foi possível decifrar {path}: {e}")
+            results.append((path, None, None))
+            continue
+        results.append((path, private_key.hex(), keys.PrivateKey(private_key).public_key.to_checksum_address()))
+    return results
+
+
+def _chunks(items: Iterable, size: int) -> Iterator[List]:
+    items = iter(items)
+    return iter(lambda: list(islice(items, size)), [])
+
+
+def _run_chunks(fn: Callable, chunks: Iterator[List], args: tuple, workers: int) -> Iterator[List]:
+    # Mesmo esquema de `iter_wallet_keys`: no máximo 2 * workers lotes pendentes, para a
+    # memória não crescer com o total
+    if workers == 1:
+        for chunk in chunks:
+            yield fn(chunk, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        for chunk in chunks:
+            pending.add(executor.submit(fn, chunk, *args))
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in pending:
+            yield future.result()
+
+
+def export_keystores(
+    records: Iterable[Dict],
+    directory: str,
+    password: str,
+    params: KdfParams = KdfParams(),
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> Dict:
+    """
+    Exporta carteiras para arquivos keystore V3 (um por carteira), cifrando em um pool de processos.
+
+    Os registros são consumidos aos poucos (ex.: iterando um `WalletStore`) e cada lote
+    cifrado é gravado assim que fica pronto, então a memória não cresce com o total.
+    Cada arquivo é gravado em um temporário e renomeado, e carteiras que já têm keystore
+    no diretório são puladas, de modo que uma exportação interrompida pode ser retomada.
+    Registros sem chave privada são ignorados.
+
+    O scrypt com os parâmetros padrão usa 256 MiB de memória por processo: com muitos
+    processos, reduza `workers` ou `params.work_factor`.
+
+    Args:
+        records (Iterable[dict]): Registros de carteiras (formato de `build_wallet_record`).
+        directory (str): Diretório dos keystores (criado se não existir).
+        password (str): Senha do lote.
+        params (KdfParams): Parâmetros da derivação da chave do lote.
+        workers (int, opcional): Processos do pool. Padrão: número de CPUs.
+        chunk_size (int): Carteiras por tarefa enviada a um processo.
+        progress (Callable, opcional): Chamado como `progress(exportadas, carteiras_por_segundo)`.
+
+    Returns:
+        dict: {"count", "skipped", "seconds", "wallets_per_second", "workers"}.
+    """
+    workers = workers or os.cpu_count() or 1
+    path = Path(directory)
+    path.mkdir(parents=True, exist_ok=True)
+    existing = {name.rsplit("--", 1)[-1] for name in os.listdir(path) if name.startswith("UTC--")}
+    skipped = 0
+
+    def pending_records() -> Iterator[Dict]:
+        nonlocal skipped
+        for record in records:
+            address = (record.get("public_address") or "").lower().removeprefix("0x")
+            if not record.get("private_key") or address in existing:
+                skipped += 1
+                continue
+            existing.add(address)
+            yield record
+
+    started = time.perf_counter()
+    exported = 0
+    for keystores in _run_chunks(encrypt_wallets, _chunks(pending_records(), chunk_size), (password, params), workers):
+        for address, keystore in keystores:
+            target = path / keystore_filename(address)
+            temporary = target.with_name(target.name + ".tmp")
+            with open(temporary, "w") as file:
+                json.dump(keystore, file)
+            os.replace(temporary, target)
+        exported += len(keystores)
+        if progress:
+            progress(exported, exported / (time.perf_counter() - started))
+
+    elapsed = time.perf_counter() - started
+    return {
+        "count": exported,
+        "skipped": skipped,
+        "seconds": elapsed,
+        "wallets_per_second": exported / elapsed if elapsed else 0.0,
+        "workers": workers,
+    }
+
+
+def import_keystores(
+    paths: Iterable[str],
+    password: str,
+    sink: Callable[[List[Dict]], None],
+    workers: Optional[int] = None,
+    chunk_size: int = 8,
+    progress: Optional[Callable[[int, float], None]] = None,
+) -> Dict:
+    """
+    Decifra arquivos keystore em um pool de processos e entrega os registros a `sink` lote a lote.
+
+    Os registros têm o formato de `build_wallet_record`, com `seed_phrase` vazio (o keystore
+    guarda só a chave privada). Arquivos que não podem ser decifrados são contados em
+    "failed" e não interrompem a importação.
+
+    Args:
+        paths (Iterable[str]): Arquivos keystore.
+        password (str): Senha dos arquivos.
+        sink (Callable): Recebe cada lote de registros e devolve quantos gravou (ex.:
+            `WalletStore.append_many`); os demais (ex.: já armazenados) contam em "skipped".
+            Se devolver None, todos contam como importados.
+        workers (int, opcional): Processos do pool. Padrão: número de CPUs.
+        chunk_size (int): Arquivos por tarefa enviada a um processo.
+        progress (Callable, opcional): Chamado como `progress(importadas, carteiras_por_segundo)`.
+
+    Returns:
+        dict: {"count", "skipped", "failed", "seconds", "wallets_per_second", "workers"};
+            "count" é o número de carteiras gravadas por `sink`.
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    imported = skipped = failed = 0
+    for results in _run_chunks(decrypt_keystores, _chunks(paths, chunk_size), (password,), workers):
+        timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+        records = [
+            build_wallet_record(private_key, address, "", None, None, timestamp)
+            for _, private_key, address in results if private_key is not None
+        ]
+        failed += len(results) - len(records)
+        if records:
+            stored = sink(records)
+            stored = len(records) if stored is None else stored
+            imported += stored
+            skipped += len(records) - stored
+        if progress:
+            progress(imported, imported / (time.perf_counter() - started))
+
+    elapsed = time.perf_counter() - started
+    return {
+        "count": imported,
+        "skipped": skipped,
+        "failed": failed,
+        "seconds": elapsed,
+        "wallets_per_second": imported / elapsed if elapsed else 0.0,
+        "workers": workers,
+    }
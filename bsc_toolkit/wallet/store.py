@@ -0,0 +1,224 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class WalletStore:
+    """
+    Armazenamento append-only de carteiras em JSON Lines (um registro por linha).
+
+    - Cada gravação apenas acrescenta linhas ao fim do arquivo: custo O(1) por carteira,
+      sem reler nem reescrever o que já foi salvo.
+    - `fsync` é feito em lotes (a cada `fsync_every` registros ou `fsync_interval`
+      segundos) e sempre em `flush`/`close`. Os dois limites só são verificados a cada
+      gravação: não há timer, então o último lote depois de um período sem escritas fica
+      sem `fsync` até a próxima gravação, `flush` ou `close`.
+    - Uma queda no meio de uma gravação deixa no máximo uma última linha incompleta;
+      ela é descartada (truncada) na próxima abertura, sem afetar os registros anteriores.
+    - Índices em memória por `public_address` e `wallet_id` guardam a posição de cada
+      registro no arquivo, então as buscas leem uma única linha.
+
+    Args:
+        path (str): Caminho do arquivo `.jsonl` (criado se não existir).
+        fsync_every (int): Registros gravados entre dois `fsync`.
+        fsync_interval (float): Segundos entre dois `fsync` com dados pendentes (verificado a cada gravação).
+    """
+
+    def __init__(self, path: str = "wallets.jsonl", fsync_every: int = 256, fsync_interval: float = 1.0):
+        self.path = path
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self._by_address: Dict[str, int] = {}
+        self._by_id: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+        self._size = self._recover()
+        self._writer = open(self.path, "ab")
+        self._reader = open(self.path, "rb")
+
+    def _recover(self) -> int:
+        """
+        Reconstrói os índices lendo o arquivo e descarta uma última linha incompleta.
+
+        Returns:
+            int: Tamanho válido do arquivo, em bytes.
+        """
+        if not os.path.exists(self.path):
+            open(self.path, "ab").close()
+            return 0
+
+        offset = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break  # Gravação interrompida: linha sem terminador
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"Registro inválido ignorado em {self.path} (byte {offset}).")
+                else:
+                    self._index(record, offset)
+                offset += len(line)
+
+        size = os.path.getsize(self.path)
+        if size > offset:
+            logger.warning(f"Descartando {size - offset} bytes de gravação incompleta no fim de {self.path}.")
+            with open(self.path, "r+b") as file:
+                file.truncate(offset)
+                file.flush()
+                os.fsync(file.fileno())
+        return offset
+
+    def _index(self, record: Dict, offset: int) -> None:
+        if record.get("public_address"):
+            self._by_address[record["public_address"].lower()] = offset
+        if record.get("wallet_id"):
+            self._by_id[record["wallet_id"]] = offset
+
+    # Gravação
+
+    def append(self, record: Dict) -> None:
+        """
+        Acrescenta uma carteira ao armazenamento.
+        """
+        self.append_many([record])
+
+    def append_many(self, records: Iterable[Dict]) -> int:
+        """
+        Acrescenta várias carteiras com uma única escrita.
+
+        Returns:
+            int: Número de registros gravados.
+        """
+        with self._lock:
+            # Tudo é serializado antes de escrever ou indexar: um registro inválido no meio do
+            # lote não deixa no índice posições que nunca foram gravadas
+            records = list(records)
+            chunks = [
+                (json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+                for record in records
+            ]
+            if not chunks:
+                return 0
+
+            self._writer.write(b"".join(chunks))
+            offset = self._size
+            for record, line in zip(records, chunks):
+                self._index(record, offset)
+                offset += len(line)
+            self._size = offset
+            self._unsynced += len(chunks)
+            if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_interval:
+                self._sync()
+            return len(chunks)
+
+    def _sync(self) -> None:
+        self._writer.flush()
+        os.fsync(self._writer.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def flush(self) -> None:
+        """
+        Grava em disco (fsync) tudo o que estiver pendente.
+        """
+        with self._lock:
+            if self._unsynced:
+                self._sync()
+
+    def close(self) -> None:
+        self.flush()
+        self._writer.close()
+        self._reader.close()
+
+    def __enter__(self) -> "WalletStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Leitura
+
+    def _read_at(self, offset: int) -> Dict:
+        with self._lock:
+            self._writer.flush()
+            self._reader.seek(offset)
+            return json.loads(self._reader.readline())
+
+    def get_by_address(self, public_address: str) -> Optional[Dict]:
+        """
+        Busca uma carteira pelo endereço público (sem diferenciar maiúsculas/minúsculas).
+        """
+        offset = self._by_address.get(public_address.lower())
+        return None if offset is None else self._read_at(offset)
+
+    def get_by_id(self, wallet_id: str) -> Optional[Dict]:
+        """
+        Busca uma carteira pelo `wallet_id`.
+        """
+        offset = self._by_id.get(wallet_id)
+        return None if offset is None else self._read_at(offset)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._by_id or key.lower() in self._by_address
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[Dict]:
+        """
+        Percorre todos os registros em ordem de gravação, sem carregar o arquivo inteiro.
+        """
+        with self._lock:
+            self._writer.flush()
+            size = self._size
+        offset = 0
+        with open(self.path, "rb") as file:
+            for line in file:
+                offset += len(line)
+                if offset > size:
+                    break
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+    # Migração
+
+    def import_json(self, path: str) -> int:
+        """
+        Importa um `wallets.json` no formato antigo (lista de carteiras ou {"wallets": [...]}).
+
+        Carteiras cujo `wallet_id` (ou, sem ele, `public_address`) já está no armazenamento
+        são ignoradas, então importar o mesmo arquivo duas vezes não duplica registros.
+
+        Returns:
+            int: Número de carteiras importadas.
+        """
+        with open(path, "r") as file:
+            document = json.load(file)
+        wallets = document.get("wallets", []) if isinstance(document, dict) else document
+        seen_ids = set(self._by_id)
+        seen_addresses = set(self._by_address)
+        new = []
+        for wallet in wallets:
+            if wallet.get("wallet_id"):
+                key, seen = wallet["wallet_id"], seen_ids
+            elif wallet.get("public_address"):
+                key, seen = wallet["public_address"].lower(), seen_addresses
+            else:
+                new.append(wallet)  # Sem chave para detectar duplicatas
+                continue
+            if key not in seen:
+                seen.add(key)
+                new.append(wallet)
+        imported = self.append_many(new)
+        self.flush()
+        return imported
@@ -0,0 +1,201 @@
+import math
+import multiprocessing
+import os
+import secrets
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, Dict, Optional, Tuple
+
+from eth_hash.auto import keccak
+from eth_keys.backends.native.jacobian import fast_multiply
+from eth_keys.constants import SECPK1_G as G
+from eth_keys.constants import SECPK1_N as N
+from eth_keys.constants import SECPK1_P as P
+from eth_utils import to_checksum_address
+
+from .generation import build_wallet_record
+
+HEX_DIGITS = set("0123456789abcdefABCDEF")
+
+# Chaves testadas por tarefa enviada a um processo (alguns décimos de segundo de trabalho)
+DEFAULT_VANITY_BATCH = 8192
+
+# Chaves testadas entre duas consultas ao sinal de parada dentro de uma tarefa
+STOP_CHECK_EVERY = 512
+
+# Sinal de parada compartilhado com os processos do pool (definido pelo inicializador)
+_stop_event = None
+
+
+class VanityPattern:
+    """
+    Padrão de um endereço personalizado: prefixo e/ou sufixo hexadecimais.
+
+    Sem `case_sensitive`, a comparação ignora maiúsculas e minúsculas; com ela, o padrão
+    precisa coincidir com o endereço em checksum (EIP-55), o que dobra a dificuldade a
+    cada letra do padrão. O checksum (um keccak a mais) só é calculado para os endereços
+    que já coincidem em minúsculas.
+
+    Args:
+        prefix (str): Início do endereço, depois de "0x".
+        suffix (str): Fim do endereço.
+        case_sensitive (bool): Exige as maiúsculas/minúsculas do checksum.
+
+    Raises:
+        ValueError: Se o padrão for vazio, tiver caracteres não hexadecimais ou passar de 40 dígitos.
+    """
+
+    def __init__(self, prefix: str = "", suffix: str = "", case_sensitive: bool = False):
+        prefix = prefix[2:] if prefix[:2].lower() == "0x" else prefix
+        if not prefix and not suffix:
+            raise ValueError("Informe um prefixo ou um sufixo.")
+        if not set(prefix + suffix) <= HEX_DIGITS:
+            raise ValueError(f"Padrão inválido: {prefix!r}/{suffix!r}. Use apenas dígitos hexadecimais.")
+        if len(prefix) + len(suffix) > 40:
+            raise ValueError("Prefixo e sufixo somam mais de 40 dígitos.")
+        self.prefix = prefix
+        self.suffix = suffix
+        self.case_sensitive = case_sensitive
+        self._prefix = prefix.lower()
+        self._suffix = suffix.lower()
+
+    def __repr__(self) -> str:
+        return f"VanityPattern(prefix={self.prefix!r}, suffix={self.suffix!r}, case_sensitive={self.case_sensitive})"
+
+    @property
+    def difficulty(self) -> int:
+        """
+        Número esperado de chaves até um acerto (1 / probabilidade de um endereço coincidir).
+        """
+        digits = self.prefix + self.suffix
+        letters = sum(char.isalpha() for char in digits) if self.case_sensitive else 0
+        return 16 ** len(digits) * 2 ** letters
+
+    def matches(self, address_hex: str) -> bool:
+        """
+        Confere um endereço em hexadecimal minúsculo, sem "0x".
+        """
+        if not (address_hex.startswith(self._prefix) and address_hex.endswith(self._suffix)):
+            return False
+        if not self.case_sensitive:
+            return True
+        checksum = to_checksum_address(address_hex)[2:]
+        return checksum.startswith(self.prefix) and checksum.endswith(self.suffix)
+
+
+def _init_worker(stop_event) -> None:
+    global _stop_event
+    _stop_event = stop_event
+
+
+def search_batch(pattern: VanityPattern, count: int) -> Tuple[int, Optional[Tuple[str, str]]]:
+    """
+    Testa até `count` chaves consecutivas a partir de uma chave aleatória.
+
+    Só a primeira chave custa uma multiplicação na curva; as seguintes (k+1, k+2, ...)
+    têm a chave pública obtida somando o ponto gerador à anterior, bem mais barato. O
+    ponto de partida vem de `secrets`, então as chaves continuam imprevisíveis.
+
+    Returns:
+        tuple: (chaves testadas, (chave privada em hexadecimal, endereço em checksum) ou None).
+    """
+    key = secrets.randbelow(N - count - 1) + 1
+    x, y = fast_multiply(G, key)
+    gx, gy = G
+    for tested in range(count):
+        if tested % STOP_CHECK_EVERY == 0 and _stop_event is not None and _stop_event.is_set():
+            return tested, None
+        address_hex = keccak(x.to_bytes(32, "big") + y.to_bytes(32, "big"))[12:].hex()
+        if pattern.matches(address_hex):
+            return tested + 1, ((key + tested).to_bytes(32, "big").hex(), to_checksum_address(address_hex))
+        # Soma afim (x, y) + G: um inverso modular por chave
+        slope = (gy - y) * pow(gx - x, -1, P) % P
+        next_x = (slope * slope - x - gx) % P
+        y = (slope * (x - next_x) - y) % P
+        x = next_x
+    return count, None
+
+
+def search_vanity_address(
+    pattern: VanityPattern,
+    workers: Optional[int] = None,
+    batch_size: int = DEFAULT_VANITY_BATCH,
+    progress: Optional[Callable[[int, float, float], None]] = None,
+    max_keys: Optional[int] = None,
+) -> Dict:
+    """
+    Procura um endereço que siga `pattern`, usando todos os núcleos.
+
+    Cada processo do pool recebe tarefas de `batch_size` chaves; no primeiro acerto, o
+    sinal de parada compartilhado interrompe as tarefas em andamento e as pendentes são
+    canceladas.
+
+    Args:
+        pattern (VanityPattern): Padrão procurado.
+        workers (int, opcional): Processos do pool. Padrão: número de CPUs.
+        batch_size (int): Chaves por tarefa.
+        progress (Callable, opcional): Chamado a cada tarefa concluída como
+            `progress(chaves_testadas, chaves_por_segundo, segundos_estimados_até_o_acerto)`.
+        max_keys (int, opcional): Desiste após testar esta quantidade de chaves.
+
+    Returns:
+        dict: {"private_key", "public_address" (None se desistiu), "keys", "seconds",
+            "keys_per_second", "difficulty", "workers"}.
+    """
+    workers = workers or os.cpu_count() or 1
+    started = time.perf_counter()
+    tested = 0
+    found = None
+
+    def account(keys: int) -> None:
+        nonlocal tested
+        tested += keys
+        if progress:
+            rate = tested / (time.perf_counter() - started)
+            progress(tested, rate, pattern.difficulty / rate if rate else math.inf)
+
+    def exhausted() -> bool:
+        return max_keys is not None and tested >= max_keys
+
+    if workers == 1:
+        while found is None and not exhausted():
+            keys, found = search_batch(pattern, batch_size)
+            account(keys)
+    else:
+        stop_event = multiprocessing.Event()
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(stop_event,)) as executor:
+            pending = {executor.submit(search_batch, pattern, batch_size) for _ in range(2 * workers)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    keys, hit = future.result()
+                    found = found or hit
+                    account(keys)
+                if found or exhausted():
+                    stop_event.set()
+                    # As canceladas nem começaram; as demais param na próxima consulta ao sinal
+                    pending = {future for future in pending if not future.cancel()}
+                else:
+                    pending |= {executor.submit(search_batch, pattern, batch_size) for _ in done}
+
+    elapsed = time.perf_counter() - started
+    private_key, public_address = found or (None, None)
+    return {
+        "private_key": private_key,
+        "public_address": public_address,
+        "keys": tested,
+        "seconds": elapsed,
+        "keys_per_second": tested / elapsed if elapsed else 0.0,
+        "difficulty": pattern.difficulty,
+        "workers": workers,
+    }
+
+
+def build_vanity_record(result: Dict, block_number: Optional[int] = None, node_url: Optional[str] = None) -> Dict:
+    """
+    Registro de carteira (mesmo formato de `build_wallet_record`) de um endereço encontrado.
+
+    O par de chaves não vem de uma frase-semente, então `seed_phrase` fica vazio: a chave
+    privada é o único meio de recuperar a carteira.
+    """
+    return build_wallet_record(result["private_key"], result["public_address"], "", block_number, node_url)